@@ -0,0 +1,105 @@
+"""Benchmark the memory used by CDS features parsed from gene table data.
+
+Synthetic gene table rows are parsed with mysqldb.parse_gene_table_data,
+and the memory retained by the resulting Cds objects is reported.
+No database connection is needed. With --baseline, the same benchmark is
+also run against the pdm_utils source at a git ref, such as a commit
+before a change, so that both results come from the same machine and data.
+Example usage:
+
+    > python3 misc/benchmark_features.py -n 100000
+    > python3 misc/benchmark_features.py -n 100000 --baseline HEAD~1
+"""
+
+import argparse
+import os
+from pathlib import Path
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pdm_utils.functions import mysqldb
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def create_gene_data(count, translation_length=250):
+    """Create a list of synthetic gene table dictionaries."""
+    rng = random.Random(0)
+    data_dicts = []
+    for x in range(count):
+        translation = "M" + "".join(rng.choice(AMINO_ACIDS)
+                                    for y in range(translation_length - 1))
+        start = x * 1000
+        data_dict = {"GeneID": f"Phage{x // 100}_CDS_{x % 100}",
+                     "PhageID": f"Phage{x // 100}",
+                     "Start": start,
+                     "Stop": start + translation_length * 3 + 3,
+                     "Length": translation_length,
+                     "Parts": 1,
+                     "Name": str(x % 100),
+                     "Translation": translation.encode("utf-8"),
+                     "Orientation": rng.choice(["F", "R"]),
+                     "Notes": b"terminase",
+                     "LocusTag": f"SEA_PHAGE{x // 100}_{x % 100}",
+                     "PhamID": rng.randint(1, 50000),
+                     "DomainStatus": 1}
+        data_dicts.append(data_dict)
+    return data_dicts
+
+
+def run_baseline(ref, number):
+    """Run the benchmark against the pdm_utils source at a git ref."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = subprocess.run(["git", "-C", str(REPO_DIR), "archive",
+                                  ref, "src/pdm_utils"],
+                                 stdout=subprocess.PIPE, check=True)
+        subprocess.run(["tar", "-x", "-C", tmpdir], input=archive.stdout,
+                       check=True)
+
+        # The archived package is imported instead of the installed one.
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+                                [str(Path(tmpdir, "src")),
+                                 env.get("PYTHONPATH", "")]).rstrip(os.pathsep)
+        subprocess.run([sys.executable, __file__, "-n", str(number)],
+                       env=env, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("-n", "--number", type=int, default=100000,
+                        help="Number of CDS features to parse.")
+    parser.add_argument("-b", "--baseline", type=str, metavar="REF",
+                        help="Also benchmark pdm_utils at this git ref.")
+    args = parser.parse_args()
+
+    if args.baseline is not None:
+        print(f"Baseline ({args.baseline}):")
+        run_baseline(args.baseline, args.number)
+        print("\nCurrent:")
+
+    data_dicts = create_gene_data(args.number)
+
+    tracemalloc.start()
+    start_time = time.time()
+    features = [mysqldb.parse_gene_table_data(data_dict)
+                for data_dict in data_dicts]
+    elapsed = time.time() - start_time
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Loaded from {mysqldb.__file__}")
+    print(f"Parsed {len(features)} CDS features in {elapsed:.2f} seconds.")
+    print(f"Retained memory: {current / 2**20:.1f} MiB "
+          f"({current / len(features):.0f} bytes per feature).")
+    print(f"Peak memory: {peak / 2**20:.1f} MiB.")
+
+
+if __name__ == "__main__":
+    main()
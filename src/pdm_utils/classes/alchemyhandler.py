@@ -1,3 +1,4 @@
+import os
 import sys
 
 import sqlalchemy
@@ -11,6 +12,8 @@ from sqlalchemy.engine.base import Engine
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.automap import automap_base
 
+from pdm_utils.classes import queryprofiler
+from pdm_utils.classes.schemacache import SchemaCache
 from pdm_utils.functions import cartography
 from pdm_utils.functions import querying
 from pdm_utils.functions import mysqldb_basic
@@ -25,8 +28,55 @@ DATABASE_MSG = ("Unable to connect to database with valid credentials.\n"
                 "Please check your MySQL database access, "
                 "and/or your database availability.")
 
+#Default connection pool settings.
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
+#Connections are replaced after this many seconds, which should be lower than
+#the MySQL wait_timeout, to avoid 'MySQL server has gone away' errors.
+POOL_RECYCLE = 3600
+POOL_PRE_PING = True
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = None
+WRITE_TIMEOUT = None
+
+#MySQL error codes raised when valid credentials cannot access a database.
+DATABASE_ERROR_CODES = {1044, 1049}
+
+#Environment variables that override the default connection pool settings.
+POOL_SIZE_ENV = "PDM_UTILS_POOL_SIZE"
+MAX_OVERFLOW_ENV = "PDM_UTILS_MAX_OVERFLOW"
+POOL_RECYCLE_ENV = "PDM_UTILS_POOL_RECYCLE"
+POOL_PRE_PING_ENV = "PDM_UTILS_POOL_PRE_PING"
+
+#Environment variables that enable query profiling, and set the report
+#written at exit and the number of the slowest statements to EXPLAIN.
+PROFILE_ENV = "PDM_UTILS_PROFILE"
+PROFILE_REPORT_ENV = "PDM_UTILS_PROFILE_REPORT"
+PROFILE_EXPLAIN_ENV = "PDM_UTILS_PROFILE_EXPLAIN"
+PROFILE_REPORT = "pdm_utils_query_profile.json"
+PROFILE_EXPLAIN = 0
+
+#Environment variable that forces cached schemas to be replaced.
+REFRESH_SCHEMA_ENV = "PDM_UTILS_REFRESH_SCHEMA"
+
+def get_env_int(name, default):
+    """Get an integer setting from an environment variable.
+
+    :param name: Name of the environment variable.
+    :type name: str
+    :param default: Value used if the variable is not set or not an integer.
+    :type default: int
+    :returns: Value of the setting.
+    :rtype: int
+    """
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
 class AlchemyHandler:
-    def __init__(self, database=None, username=None, password=None):
+    def __init__(self, database=None, username=None, password=None,
+                 profile=None):
         self._database = database
         self._username = username
         self._password = password
@@ -41,6 +91,34 @@ class AlchemyHandler:
         self._session = None
         self.echo = False
 
+        self.pool_size = get_env_int(POOL_SIZE_ENV, POOL_SIZE)
+        self.max_overflow = get_env_int(MAX_OVERFLOW_ENV, MAX_OVERFLOW)
+        self.pool_recycle = get_env_int(POOL_RECYCLE_ENV, POOL_RECYCLE)
+        self.pool_pre_ping = POOL_PRE_PING
+        if os.environ.get(POOL_PRE_PING_ENV, "") != "":
+            self.pool_pre_ping = os.environ[POOL_PRE_PING_ENV].lower() in \
+                                                {"1", "true", "yes", "on"}
+        self.connect_timeout = CONNECT_TIMEOUT
+        self.read_timeout = READ_TIMEOUT
+        self.write_timeout = WRITE_TIMEOUT
+        #Reflected schemas are cached on disk unless disabled, and
+        #refresh_schema forces the cached schema to be replaced.
+        self.use_schema_cache = True
+        self.refresh_schema = os.environ.get(REFRESH_SCHEMA_ENV, "").lower() \
+                                            in {"1", "true", "yes", "on"}
+        self.schema_cache_dir = None
+
+        #Statements executed through profiled engines are recorded and
+        #the most expensive ones are reported when the process exits.
+        if profile is None:
+            profile = os.environ.get(PROFILE_ENV, "").lower() in \
+                                                {"1", "true", "yes", "on"}
+        self.profile = profile
+        self.profile_report = os.environ.get(PROFILE_REPORT_ENV,
+                                             PROFILE_REPORT)
+        self.profile_explain = get_env_int(PROFILE_EXPLAIN_ENV,
+                                           PROFILE_EXPLAIN)
+
         self.connected = False
         self.has_credentials = False
 
@@ -177,6 +255,8 @@ class AlchemyHandler:
 
         self.clear()
         self._engine = engine
+        if self.profile:
+            self.profile_engine(engine)
         self.get_mysql_dbs()
         self.connected = True
 
@@ -276,42 +356,127 @@ class AlchemyHandler:
 
     def build_engine(self):
         """Create and store SQLAlchemy Engine object.
+
+        A single engine is created for the stored credentials and database,
+        and the engine is only rebuilt if the database is changed.
         """
-        if not self.connected:
-            if not self.has_credentials:
-                raise AttributeError("AlchemyHandler missing credentials.\n"
-                                     "Cannot connect to MySQL.")
+        if self.connected and (not self.has_database or
+                               self.connected_database):
+            return
+
+        if not self.has_credentials:
+            raise AttributeError("AlchemyHandler missing credentials.\n"
+                                 "Cannot connect to MySQL.")
+
+        database = ""
+        if self.has_database:
+            database = self._database
+
+        login_string = self.construct_engine_string(
+                                        username=self._username,
+                                        password=self._password,
+                                        database=database)
+
+        engine = self.create_engine(login_string)
+        try:
+            self.test_engine(engine)
+        except OperationalError as exc:
+            code = getattr(exc.orig, "args", [None])[0]
+            if not self.has_database or code not in DATABASE_ERROR_CODES:
+                raise
 
+            #Credentials are valid, so report the invalid database.
             login_string = self.construct_engine_string(
                                             username=self._username,
                                             password=self._password)
+            self.set_engine(self.create_engine(login_string))
+            self.get_mysql_dbs()
+            self.validate_database()
+            raise
 
-            self._engine = sqlalchemy.create_engine(login_string,
-                                                            echo=self.echo)
-            self._engine.connect()
+        self.set_engine(engine)
+        self.get_mysql_dbs()
 
-            self.connected = True
+        if self.has_database:
+            self.validate_database()
+            self.connected_database = True
 
-            self._metadata = None
-            self._graph = None
+    def get_engine_options(self):
+        """Get the keyword arguments used to create SQLAlchemy engines.
 
-            self.get_mysql_dbs()
+        :returns: Dictionary of create_engine() keyword arguments.
+        :rtype: dict
+        """
+        connect_args = {}
+        if self.connect_timeout is not None:
+            connect_args["connect_timeout"] = self.connect_timeout
+        if self.read_timeout is not None:
+            connect_args["read_timeout"] = self.read_timeout
+        if self.write_timeout is not None:
+            connect_args["write_timeout"] = self.write_timeout
+
+        options = {"echo" : self.echo,
+                   "pool_size" : self.pool_size,
+                   "max_overflow" : self.max_overflow,
+                   "pool_recycle" : self.pool_recycle,
+                   "pool_pre_ping" : self.pool_pre_ping,
+                   "connect_args" : connect_args}
+        return options
+
+    def create_engine(self, login_string):
+        """Create a SQLAlchemy Engine object with the stored pool settings.
+
+        :param login_string: URL string to create SQLAlchemy engine.
+        :type login_string: str
+        :returns: SQLAlchemy Engine object.
+        :rtype: Engine
+        """
+        options = self.get_engine_options()
+        return sqlalchemy.create_engine(login_string, **options)
 
-        if self.has_database:
-            database = self._database
+    def test_engine(self, engine):
+        """Verify a SQLAlchemy Engine object can connect to MySQL, returning
+        the connection to the pool.
 
-            self.validate_database()
+        :param engine: SQLAlchemy Engine object.
+        :type engine: Engine
+        """
+        connection = engine.connect()
+        connection.close()
 
-            login_string = self.construct_engine_string(
-                                        username=self._username,
-                                        password=self._password,
-                                        database=self._database)
+    def set_engine(self, engine):
+        """Store a connected SQLAlchemy Engine object, disposing of the
+        connection pool of the replaced engine.
 
-            self._engine = sqlalchemy.create_engine(login_string,
-                                                            echo=self.echo)
-            self._engine.connect()
+        :param engine: SQLAlchemy Engine object.
+        :type engine: Engine
+        """
+        if self._engine is not None and self._engine is not engine:
+            try:
+                self._engine.dispose()
+            except:
+                pass
 
-            self.connected_database = True
+        self._engine = engine
+        if self.profile:
+            self.profile_engine(engine)
+        if not self.connected:
+            self._metadata = None
+            self._graph = None
+            self._mapper = None
+        self.connected = True
+
+    def profile_engine(self, engine):
+        """Record the statements executed through a SQLAlchemy Engine object,
+        and report the most expensive ones when the process exits.
+
+        :param engine: SQLAlchemy Engine object.
+        :type engine: Engine
+        """
+        profiler = queryprofiler.get_profiler()
+        profiler.attach(engine)
+        profiler.register_report(self.profile_report,
+                                 explain=self.profile_explain)
 
     def connect(self, ask_database=False, login_attempts=5, pipeline=False):
         """Ask for input to connect to MySQL and MySQL databases.
@@ -427,9 +592,33 @@ class AlchemyHandler:
         if not self.connected:
             self.build_engine()
 
+        if self.use_schema_cache and isinstance(self._engine, Engine):
+            self.load_schema()
+            return
+
         self._metadata = MetaData(bind=self._engine)
         self._metadata.reflect()
 
+    def load_schema(self):
+        """Load SQLAlchemy MetaData and NetworkX Graph objects from the
+        schema cache, reflecting and caching the schema if it is not cached,
+        the cached schema does not match the database, or refresh_schema
+        is set.
+        """
+        schema_cache = SchemaCache(cache_dir=self.schema_cache_dir)
+
+        graph = None
+        if not self.refresh_schema:
+            graph = schema_cache.get(self._engine)
+
+        if graph is None:
+            metadata = MetaData(bind=self._engine)
+            metadata.reflect()
+            graph = schema_cache.put(self._engine, metadata)
+
+        self._metadata = graph.graph["metadata"]
+        self._graph = graph
+
     def build_session(self):
         """Create and store SQLAlchemy Session object.
         """
@@ -454,7 +643,10 @@ class AlchemyHandler:
         if self._metadata is None:
             self.build_metadata()
 
-        self._graph = querying.build_graph(self._metadata)
+        #The graph is loaded together with cached MetaData objects.
+        if self._graph is None or \
+                self._graph.graph.get("metadata") is not self._metadata:
+            self._graph = querying.build_graph(self._metadata)
 
     def build_mapper(self):
         """Create and store SQLAlchemy automapper Base object.
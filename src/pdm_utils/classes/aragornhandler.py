@@ -3,14 +3,20 @@ import shlex
 from subprocess import Popen
 import re
 
+from pdm_utils.classes.toolcache import get_shared_cache, get_tool_version
 from pdm_utils.functions import basic
 
 
 class AragornHandler:
-    def __init__(self, identifier, sequence):
+    def __init__(self, identifier, sequence, cache=None):
         self.id = identifier
         self.sequence = sequence
 
+        # Cache of previous Aragorn results
+        if cache is None:
+            cache = get_shared_cache()
+        self.cache = cache
+
         # I/O attributes
         self.temp_dir = "/tmp/aragorn"
         self.input = os.path.join(self.temp_dir, self.id) + ".fasta"
@@ -33,11 +39,13 @@ class AragornHandler:
         with open(self.input, "w") as fh:
             fh.write(f">{self.id}\n{self.sequence}\n")
 
-    def run_aragorn(self, c=False, d=True, m=False, t=True):
+    def run_aragorn(self, c=False, d=True, m=False, t=True, use_cache=True):
         """
         Set up Aragorn command, then run it. Default arguments will
         assume linear sequence to be scanned on both strands for tRNAs
-        only (no tmRNAs).
+        only (no tmRNAs). If the same sequence has already been searched
+        with the same Aragorn version and options, the cached output is
+        written to the output file instead of running Aragorn again.
         :param c: treat sequence as circular
         :type c: bool
         :param d: search both strands of DNA
@@ -46,21 +54,42 @@ class AragornHandler:
         :type m: bool
         :param t: search for tRNAs
         :type t: bool
+        :param use_cache: consult and update the result cache
+        :type use_cache: bool
         :return:
         """
-        command = f"aragorn -gcbact -br -wa "
+        options = "-gcbact -br -wa "
         if c is False:
-            command += "-l "
+            options += "-l "
         if d is False:
-            command += "-s "
+            options += "-s "
         if m is True:
-            command += "-m "
+            options += "-m "
         if t is True:
-            command += "-t "
-        command += f"-o {self.output} {self.input}"
-
+            options += "-t "
+
+        key = None
+        if use_cache:
+            key = self.cache.make_key("aragorn", get_tool_version("aragorn"),
+                                      options, self.sequence)
+            output = self.cache.get(key)
+            if output is not None:
+                with open(self.output, "w") as fh:
+                    fh.write(output)
+                return
+
+        # Remove output from previous runs so that it can't be cached
+        # in place of this run's output.
+        if os.path.exists(self.output):
+            os.remove(self.output)
+
+        command = f"aragorn {options}-o {self.output} {self.input}"
         Popen(shlex.split(command)).wait()
 
+        if key is not None and os.path.exists(self.output):
+            with open(self.output, "r") as fh:
+                self.cache.put(key, fh.read())
+
     def read_output(self):
         """
         Reads the Aragorn output file and joins the lines into a single
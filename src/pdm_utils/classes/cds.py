@@ -12,13 +12,29 @@ from Bio.SeqFeature import SeqFeature, FeatureLocation, CompoundLocation
 from pdm_utils.constants import constants
 from pdm_utils.classes import evaluation
 from pdm_utils.functions import basic
+from pdm_utils.functions import seqkernels
 
 
 
 
-class Cds:
+class Cds(evaluation.EvaluationsMixin):
     """Class to hold data about a CDS feature."""
 
+    # Attributes are stored in slots to reduce the memory used by each
+    # feature, since entire databases of features may be loaded at once.
+    # The __dict__ slot is only allocated if an undeclared attribute
+    # is assigned (e.g. by the compare pipeline).
+    __slots__ = (
+        "id", "name", "seqfeature", "start", "stop", "coordinate_format",
+        "orientation", "parts", "translation_table", "translation",
+        "translation_length", "seq", "length", "genome_id", "genome_length",
+        "pham_id", "domain_status", "raw_description", "description",
+        "locus_tag", "_locus_tag_num", "gene", "raw_product", "raw_function",
+        "raw_note", "product", "function", "note", "_product_num",
+        "_function_num", "_note_num", "_gene_num", "type",
+        "_start_stop_orient_id", "_end_orient_id", "_start_end_id",
+        "__dict__")
+
     def __init__(self):
 
         # The following attributes are common to any CDS.
@@ -31,9 +47,9 @@ class Cds:
         self.orientation = "" #'forward', 'reverse', 'top', 'bottom', etc.
         self.parts = 0 # Number of regions that define the feature
         self.translation_table = 0
-        self.translation = Seq("", IUPAC.protein) # Biopython amino acid Seq object.
+        self.translation = constants.EMPTY_PROTEIN_SEQ # Biopython amino acid Seq object.
         self.translation_length = 0
-        self.seq = Seq("", IUPAC.ambiguous_dna) # Biopython nucleotide Seq object.
+        self.seq = constants.EMPTY_GENOME_SEQ # Biopython nucleotide Seq object.
         self.length = 0
 
         # Information about the genome from which the feature is derived.
@@ -66,7 +82,7 @@ class Cds:
 
         # The following attributes are usefule for processing data
         # from various data sources.
-        self.evaluations = []
+        self._evaluations = None # Created when first accessed.
         self.type = ""
         self._start_stop_orient_id = ()
         self._end_orient_id = ()
@@ -327,7 +343,8 @@ class Cds:
     def translate_seq(self):
         """Translate the CDS nucleotide sequence.
 
-        Use Biopython to translate the nucleotide sequece.
+        Use a codon lookup table (or Biopython, for sequences containing
+        ambiguous nucleotides) to translate the nucleotide sequece.
         The method expects the nucleotide sequence to be a valid CDS
         sequence in which:
 
@@ -342,12 +359,8 @@ class Cds:
         :returns: Amino acid sequence
         :rtype: Seq
         """
-
-        try:
-            translation = self.seq.translate(table=self.translation_table,
-                                             cds=True)
-        except:
-            translation = Seq("", IUPAC.protein)
+        translation, code = seqkernels.translate_cds(self.seq,
+                                                     self.translation_table)
         return translation
 
 
@@ -692,17 +705,21 @@ class Cds:
         self.set_eval(eval_id, definition, result, status)
 
 
-    def check_translation(self, eval_id=None, success="correct",
-                          fail="error", eval_def=None):
+    def check_translation(self, translation=None, eval_id=None,
+                          success="correct", fail="error", eval_def=None):
         """Check that the current and expected translations match.
 
+        :param translation:
+            Expected translation. If not provided, it is generated from
+            the nucleotide sequence.
+        :type translation: Seq
         :param eval_id: same as for check_attribute().
         :param success: same as for check_attribute().
         :param fail: same as for check_attribute().
         :param eval_def: same as for check_attribute().
         """
-
-        translation = self.translate_seq()
+        if translation is None:
+            translation = self.translate_seq()
         exp_len = len(translation)
         result = f"The translation length ({self.translation_length}) "
         if self.translation_length < exp_len:
@@ -735,8 +752,8 @@ class Cds:
         :param fail: same as for check_attribute().
         :param eval_def: same as for check_attribute().
         """
-        amino_acid_set = set(self.translation)
-        amino_acid_error_set = amino_acid_set - check_set
+        amino_acid_error_set = seqkernels.get_invalid_symbols(
+                                    self.translation, check_set)
         result = "The translation contains "
         if len(amino_acid_error_set) > 0:
             aae_string = ", ".join(amino_acid_error_set)
@@ -0,0 +1,81 @@
+"""Represents a persistent cache of evaluation results generated while
+checking flat files during import.
+"""
+
+import json
+
+from pdm_utils.classes.evaluation import Evaluation
+from pdm_utils.classes.toolcache import ToolCache
+from pdm_utils.constants import constants
+
+
+class EvalCache(ToolCache):
+    def __init__(self, cache_dir=None, max_size=None):
+        """
+        Constructor method for an EvalCache object.
+        :param cache_dir: directory in which results are stored
+        :type cache_dir: Path
+        :param max_size: maximum size of the cache in bytes
+        :type max_size: int
+        """
+        if cache_dir is None:
+            cache_dir = constants.EVAL_CACHE_DIR
+        if max_size is None:
+            max_size = constants.EVAL_CACHE_MAX_SIZE
+        super().__init__(cache_dir=cache_dir, max_size=max_size)
+
+        # Tallies of how bundles were evaluated.
+        self.full_hits = 0
+        self.partial_hits = 0
+
+    def get_entry(self, key):
+        """
+        Retrieves stored evaluation results for the indicated key.
+        :param key: cache key
+        :type key: str
+        :return:
+            dictionary of dictionaries of evaluation lists, or None if
+            the key is not cached
+        :rtype: dict
+        """
+        output = self.get(key)
+        if output is None:
+            return None
+
+        try:
+            data = json.loads(output)
+        except ValueError:
+            return None
+
+        entry = {}
+        for group, dict_of_lists in data.items():
+            if not isinstance(dict_of_lists, dict):
+                entry[group] = dict_of_lists
+                continue
+            entry[group] = {}
+            for path, evl_list in dict_of_lists.items():
+                entry[group][path] = [Evaluation(**evl) for evl in evl_list]
+        return entry
+
+    def put_entry(self, key, entry):
+        """
+        Stores evaluation results for the indicated key.
+        :param key: cache key
+        :type key: str
+        :param entry: dictionary of dictionaries of evaluation lists
+        :type entry: dict
+        :return:
+        """
+        data = {}
+        for group, dict_of_lists in entry.items():
+            if not isinstance(dict_of_lists, dict):
+                data[group] = dict_of_lists
+                continue
+            data[group] = {}
+            for path, evl_list in dict_of_lists.items():
+                data[group][path] = [{"id": evl.id,
+                                      "definition": evl.definition,
+                                      "result": evl.result,
+                                      "status": evl.status}
+                                     for evl in evl_list]
+        self.put(key, json.dumps(data))
@@ -14,3 +14,22 @@ class Evaluation:
                 f"Status: {self.status}. "
                 f"Definition: {self.definition} "
                 f"Result: {self.result}")
+
+
+
+class EvaluationsMixin:
+    """Provides a lazily created list of evaluations to feature classes
+    that store their attributes in slots."""
+
+    __slots__ = ("_evaluations",)
+
+    @property
+    def evaluations(self):
+        """List of warnings and errors about the feature."""
+        if self._evaluations is None:
+            self._evaluations = []
+        return self._evaluations
+
+    @evaluations.setter
+    def evaluations(self, value):
+        self._evaluations = value
@@ -59,6 +59,9 @@ class Filter:
         self._or_index = -1
 
         self.verbose = False
+        #Number of threads used to execute IN clause chunks of queries,
+        #defaulting to querying.CHUNK_THREADS.
+        self.threads = None
 
 #-----------------------------------------------------------------------------
 #FILTER CONNECTION HANDLING
@@ -185,7 +188,7 @@ class Filter:
         self._updated = True
         self._values_valid = True
  
-    def sort(self, raw_columns):
+    def sort(self, raw_columns, threads=None):
         """Re-queries for the Filter's values, applying a ORDER BY clause.
        
         :param raw_column: SQLAlchemy Column object(s) or object name(s).
@@ -193,15 +196,20 @@ class Filter:
         :type raw_columns: str
         :type raw_columns: list[Column]
         :type raw_columns: list[str]
+        :param threads: Number of threads used to execute IN clause chunks.
+        :type threads: int
         """
         self.check()
+        if threads is None:
+            threads = self.threads
 
         columns = self.get_columns(raw_columns)
         
         query = q.build_select(self._graph, self._key, order_by=columns)
 
         values = q.first_column(self._engine, query, in_column=self._key,
-                                                     values=self._values)
+                                                     values=self._values,
+                                                     threads=threads)
         self._values = values
         self._values_valid = True 
 
@@ -396,7 +404,7 @@ class Filter:
 #FILTER QUERYING
 
     def build_values(self, where=None, column=None, raw_bytes=False, 
-                                                    limit=8000):
+                                                    limit=8000, threads=None):
         """Queries for values from stored WHERE clauses and Filter key.
         
         :param where: MySQL WHERE clause_related SQLAlchemy object(s).
@@ -410,10 +418,14 @@ class Filter:
         :type column: str
         :param limit: SQLAlchemy IN clause query length limiter.
         :type limit: int
+        :param threads: Number of threads used to execute IN clause chunks.
+        :type threads: int
         :returns: Distinct values fetched from given and innate constraints.
         :rtype: list
         """
         self.check()
+        if threads is None:
+            threads = self.threads
 
         if column is None:
             column_obj = self._key
@@ -433,7 +445,8 @@ class Filter:
 
         values = q.first_column(self.engine, query, in_column=self._key,
                                                     values=self._values,
-                                                    limit=limit) 
+                                                    limit=limit,
+                                                    threads=threads)
 
         if not raw_bytes:
             if column_obj.type.python_type is bytes:
@@ -441,7 +454,7 @@ class Filter:
 
         return values
 
-    def select(self, raw_columns, return_dict=True):
+    def select(self, raw_columns, return_dict=True, threads=None):
         """Queries for data conditioned on the values in the Filter object.
 
         :param columns: SQLAlchemy Column object(s)
@@ -451,21 +464,56 @@ class Filter:
         :type columns: list[str]
         :param return_dict: Toggle whether to return data as a dictionary.
         :type return_dict: Boolean
+        :param threads: Number of threads used to execute IN clause chunks.
+        :type threads: int
         :returns: SELECT data conditioned on the values in the Filter object.
         :rtype: dict
         :rtype: list[RowProxy]
         """
         self.check()
+        if threads is None:
+            threads = self.threads
 
         columns = self.get_columns(raw_columns)
 
         query = q.build_select(self._graph, columns, add_in=self._key)
         results = q.execute(self._engine, query, in_column=self._key, 
                                                  values=self._values,
-                                                 return_dict=return_dict)
+                                                 return_dict=return_dict,
+                                                 threads=threads)
 
         return results
 
+    def iter_select(self, raw_columns, return_dict=True, batch_size=1000,
+                                                         limit=8000):
+        """Streams data conditioned on the values in the Filter object.
+
+        :param columns: SQLAlchemy Column object(s)
+        :type columns: Column
+        :type columns: str
+        :type columns: list[Column]
+        :type columns: list[str]
+        :param return_dict: Toggle whether to return data as a dictionary.
+        :type return_dict: Boolean
+        :param batch_size: Maximum number of rows yielded at a time.
+        :type batch_size: int
+        :param limit: SQLAlchemy IN clause query length limiter.
+        :type limit: int
+        :returns: Batches of SELECT data conditioned on the Filter values.
+        :rtype: Generator[list[dict]]
+        :rtype: Generator[list[RowProxy]]
+        """
+        self.check()
+
+        columns = self.get_columns(raw_columns)
+
+        query = q.build_select(self._graph, columns, add_in=self._key)
+        return q.iter_execute(self._engine, query, in_column=self._key,
+                                                   values=self._values,
+                                                   limit=limit,
+                                                   batch_size=batch_size,
+                                                   return_dict=return_dict)
+
     def query(self, table_map):
         """Queries for ORM object instances conditioned on Filter values.
 
@@ -496,7 +544,8 @@ class Filter:
 
     def transpose(self, raw_column, return_dict=False, set_values=False,
                                                        raw_bytes=False,
-                                                       filter=False):
+                                                       filter=False,
+                                                       threads=None):
         """Queries for distinct values from stored values and a MySQL Column.
 
         :param raw_column: SQLAlchemy Column object or object name.
@@ -506,6 +555,8 @@ class Filter:
         :type return_dict: Boolean
         :param set_values: Toggle whether to replace Filter key and values.
         :type set_values: Boolean
+        :param threads: Number of threads used to execute IN clause chunks.
+        :type threads: int
         :returns: Distinct values fetched from given and innate constraints.
         :rtype: list
         :rtype: dict
@@ -526,7 +577,8 @@ class Filter:
             where_clauses = self.build_where_clauses()    
 
         values = self.build_values(column=column, where=where_clauses,
-                                                  raw_bytes=raw_bytes)
+                                                  raw_bytes=raw_bytes,
+                                                  threads=threads)
 
         if set_values:
             self._key = column
@@ -538,12 +590,15 @@ class Filter:
 
         return values
 
-    def mass_transpose(self, raw_columns, raw_bytes=False, filter=False):
+    def mass_transpose(self, raw_columns, raw_bytes=False, filter=False,
+                                                           threads=None):
         """Queries for sets of distinct values, using self.transpose()
 
         :param columns: SQLAlchemy Column object(s)
         :type columns: Column
         :type columns: list
+        :param threads: Number of threads used to execute IN clause chunks.
+        :type threads: int
         :returns: Distinct values fetched from given and innate restraints.
         :rtype: dict
         """
@@ -559,48 +614,106 @@ class Filter:
         for column in raw_columns:
             column_values = self.transpose(column, return_dict=True,
                                            raw_bytes=raw_bytes,
-                                           filter=filter)
+                                           filter=filter, threads=threads)
             values.update(column_values)
 
         return values
 
-    def group(self, raw_column, raw_bytes=False, filter=False): 
+    def group(self, raw_column, raw_bytes=False, filter=False, threads=None):
         """Queries and separates Filter object's values based on a Column.
 
+        The Filter's values are queried once alongside the Column, with the
+        values chunked in IN clauses. Values are matched to groups as MySQL
+        compares them, and listed in the order of the Filter's values.
+
         :param raw_column: SQLAlchemy Column object or object name.
         :type raw_column: Column
         :type raw_column: str
+        :param threads: Number of threads used to execute IN clause chunks.
+        :type threads: int
         """
         self.check()
+        if threads is None:
+            threads = self.threads
 
         column = self.get_column(raw_column)
 
-        groups = self.transpose(column)
+        groups = self.transpose(column, threads=threads)
+        if not groups:
+            return {}
        
         where_clauses = []
         if filter:
             where_clauses = self.build_where_clauses()
 
-        group_results = {}
+        #Groups without values that pass the filters are retained.
+        group_keys = {}
+        group_values = OrderedDict()
         for group in groups:
-            group_clauses = where_clauses + [(column == group)]
-            values = self.build_values(where=group_clauses, raw_bytes=raw_bytes)
-            group_results.update({group : values})
+            group_keys.setdefault(q.get_collation_key(column, group), group)
+            group_values[group] = OrderedDict()
+
+        query = q.build_distinct(self._graph, [column, self._key],
+                                              where=where_clauses)
+        results = q.execute(self._engine, query, in_column=self._key,
+                                                 values=self._values,
+                                                 return_dict=False,
+                                                 threads=threads)
+
+        decode_key = (not raw_bytes and self._key.type.python_type == bytes)
+        for result in results:
+            #The row holds a single field if the column is the key.
+            group = result[0]
+            if isinstance(group, bytes):
+                group = group.decode("utf-8")
+            group = group_keys.get(q.get_collation_key(column, group), group)
+            value = result[-1]
+            if decode_key and isinstance(value, bytes):
+                value = value.decode("utf-8")
+
+            group_values.setdefault(group, OrderedDict())[value] = None
+
+        #Values are ordered as the Filter's values, which may be sorted.
+        value_order = {}
+        for index, value in enumerate(self._values):
+            value_order.setdefault(self.get_key_value(value), index)
+
+        def get_value_order(value):
+            if isinstance(value, bytes):
+                value = value.decode("utf-8")
+            return value_order.get(self.get_key_value(value),
+                                   len(value_order))
+
+        group_results = {}
+        for group, values in group_values.items():
+            group_results.update({group : sorted(values.keys(),
+                                                 key=get_value_order)})
 
         return group_results
 
-    def retrieve(self, raw_columns, raw_bytes=False, filter=False):
+    def retrieve(self, raw_columns, raw_bytes=False, filter=False,
+                                                     limit=8000, threads=None):
         """Queries for distinct data for each value in the Filter object.
 
+        Each column is queried once for all values, with the values chunked
+        in IN clauses, and the rows are grouped by value as MySQL compares
+        them.
+
         :param columns: SQLAlchemy Column object(s)
         :type columns: Column
         :type columns: str
         :type columns: list[Column]
         :type columns: list[str]
+        :param limit: SQLAlchemy IN clause query length limiter.
+        :type limit: int
+        :param threads: Number of threads used to execute IN clause chunks.
+        :type threads: int
         :returns: Distinct values for each Filter value.
         :rtype: dict{dict}
         """
         self.check()
+        if threads is None:
+            threads = self.threads
 
         if not self._values:
             return {}
@@ -611,24 +724,44 @@ class Filter:
         if filter:
             where_clauses = self.build_where_clauses()
 
-        values = {}
+        values = OrderedDict()
         for value in self._values:
-            value_clauses = where_clauses + [(self._key == value)]
-            values.update({value : {}}) 
-
-            #For each column for each value, add the respective data to a dict.
-            for i in range(len(columns)):
-                query = q.build_distinct(self._graph, columns[i], 
-                                                        where=value_clauses)
-                value_data = q.first_column(self._engine, query)
-
-                if not raw_bytes:
-                    if columns[i].type.python_type == bytes:
-                        value_data = parsing.convert_to_decoded(value_data)
-
-                values[value].update({columns[i].name : value_data})
-
-        return values
+            values[value] = {}
+
+        decode_key = (self._key.type.python_type == bytes)
+        for column in columns:
+            #The column is selected first so that its table is the center
+            #of the joined tables, as when each value is queried separately.
+            query = q.build_distinct(self._graph, [column, self._key],
+                                                  where=where_clauses)
+            results = q.execute(self._engine, query, in_column=self._key,
+                                                     values=self._values,
+                                                     limit=limit,
+                                                     return_dict=False,
+                                                     threads=threads)
+
+            #Groups distinct column data by value, in order of retrieval.
+            value_data = {}
+            for result in results:
+                #The row holds a single field if the column is the key.
+                key_value = result[-1]
+                if decode_key and isinstance(key_value, bytes):
+                    key_value = key_value.decode("utf-8")
+                key_value = self.get_key_value(key_value)
+
+                column_data = value_data.setdefault(key_value, OrderedDict())
+                column_data[result[0]] = None
+
+            decode = (not raw_bytes and column.type.python_type == bytes)
+            for value in values.keys():
+                column_data = list(value_data.get(self.get_key_value(value),
+                                                  {}).keys())
+                if decode:
+                    column_data = parsing.convert_to_decoded(column_data)
+
+                values[value].update({column.name : column_data})
+
+        return dict(values)
   
     def get_column(self, raw_column):
         """Converts a column input, string or Column, to a Column.
@@ -650,6 +783,14 @@ class Filter:
 
         return column
     
+    def get_key_value(self, value):
+        """Normalizes a value of the Filter key as MySQL compares it.
+
+        :param value: Value of the Filter key, decoded if the key is binary.
+        :returns: Value that is equal for key values MySQL considers equal.
+        """
+        return q.get_collation_key(self._key, value)
+
     def get_columns(self, raw_columns):
         """Converts a column input list, string or Column, to a list of Columns.
 
@@ -692,6 +833,7 @@ class Filter:
         copy._session = self._session
         copy._key = self.key
         copy._values = self.values
+        copy.threads = self.threads
 
         return copy
  
@@ -1,15 +1,24 @@
 """Represents a collection of data about a genome that are commonly used to
 maintain and update SEA-PHAGES phage genomics data.
 """
+from bisect import bisect_left
 from operator import attrgetter
 
 from Bio.Alphabet import IUPAC
 from Bio.Seq import Seq
-from Bio.SeqUtils import GC
 
 from pdm_utils.classes import evaluation, cds, trna, tmrna, source
 from pdm_utils.constants import constants
 from pdm_utils.functions import basic
+from pdm_utils.functions import seqkernels
+
+# Descriptions of feature coordinate conflicts identified by IntervalIndex.
+COORDINATE_CONFLICT_MESSAGES = {
+    "duplicate": ("Feature1 and Feature2 contain identical "
+                  "start and stop coordinates."),
+    "nested": "Feature2 is nested within Feature1.",
+    "shared_stop": "Feature1 and Feature2 contain identical stop coordinates."
+    }
 
 class Genome:
     """Class to hold data about a phage genome."""
@@ -24,6 +33,7 @@ class Genome:
         self.subcluster = "" #A1, A2, etc.
         self.id = "" # Unique identifier. Case sensitive, no "_Draft".
         self.name = "" # Case sensitive and contains "_Draft".
+        self._seq_loader = None # Retrieves the sequence on first access.
         self.seq = Seq("", IUPAC.ambiguous_dna) # Biopython Seq object
         self.length = 0 # Size of the nucleotide sequence
         self.gc = -1 # %GC content
@@ -100,6 +110,39 @@ class Genome:
         return ", ".join(str_list)
 
 
+    @property
+    def seq(self):
+        """Biopython Seq object of the nucleotide sequence.
+
+        If a sequence loader has been set, the sequence is retrieved from
+        the loader the first time it is accessed.
+        """
+        if self._seq_loader is not None:
+            loader = self._seq_loader
+            self._seq_loader = None
+            value = loader.get_sequence(self.id)
+            if value is not None:
+                self._seq = value
+        return self._seq
+
+    @seq.setter
+    def seq(self, value):
+        self._seq_loader = None
+        self._seq = value
+
+    def set_sequence_loader(self, loader):
+        """Set a loader to retrieve the nucleotide sequence on first access.
+
+        Only the 'seq' attribute is set when the sequence is retrieved,
+        so the length and gc attributes should be set separately.
+
+        :param loader:
+            Object with a get_sequence() method that returns the Seq
+            for a genome id, such as a SequenceLoader.
+        :type loader: SequenceLoader
+        """
+        self._seq_loader = loader
+
     def set_filename(self, filepath):
         """Set the filename. Discard the path and file extension.
 
@@ -206,9 +249,10 @@ class Genome:
             self.seq = Seq(value).upper()
         else:
             self.seq = value.upper()
-        self.length = len(self.seq)
+        stats = seqkernels.get_sequence_stats(self.seq)
+        self.length = stats["length"]
         if self.length > 0:
-            self.gc = round(GC(self.seq), 4)
+            self.gc = round(stats["gc"], 4)
         else:
             self.gc = -1
 
@@ -274,6 +318,30 @@ class Genome:
         self.tmrna_features = value     # Should be a list
         self._tmrna_features_tally = len(self.tmrna_features)
 
+    def translate_cds_features(self, fill=False):
+        """Translate the nucleotide sequences of all CDS features together.
+
+        Each CDS feature is translated using its own translation table.
+
+        :param fill:
+            Indicates whether the translation of each CDS feature
+            should be set from its nucleotide sequence.
+        :type fill: bool
+        :returns:
+            List of (translation, code) tuples, one for each CDS feature,
+            in which code is None or a key in
+            seqkernels.TRANSLATION_FAILURES.
+        :rtype: list
+        """
+        results = seqkernels.translate_cds_seqs(
+                        [cds_ftr.seq for cds_ftr in self.cds_features],
+                        [cds_ftr.translation_table
+                         for cds_ftr in self.cds_features])
+        if fill:
+            for x in range(len(self.cds_features)):
+                self.cds_features[x].set_translation(results[x][0])
+        return results
+
     def set_source_features(self, value):
         """Set and tally the source features.
 
@@ -749,8 +817,8 @@ class Genome:
         # function though, it is not clear how stable/reliable it is.
         # Instead, Bio.Alphabet.IUPAC.unambiguous_dna alphabet can be passed
         # to the check_nucleotides method.
-        nucleotide_set = set(self.seq)
-        nucleotide_error_set = nucleotide_set - check_set
+        nucleotide_error_set = seqkernels.get_invalid_symbols(self.seq,
+                                                              check_set)
         if len(nucleotide_error_set) > 0:
             nes_string = basic.join_strings(nucleotide_error_set, delimiter=", ")
             result = ("There are unexpected nucleotides in the sequence: "
@@ -979,12 +1047,8 @@ class Genome:
                   "by orientation for evaluation. ")
         msgs = ["There are one or more errors with the feature coordinates."]
         for unsorted_features in unsorted_feature_lists:
-            sorted_features = sorted(unsorted_features,
-                                     key=attrgetter("start", "stop"))
-            index = 0
-            while index < len(sorted_features) - 1:
-                current = sorted_features[index]
-                next = sorted_features[index + 1]
+            index = IntervalIndex(unsorted_features)
+            for current, next, conflict in index.get_conflicts():
                 ftrs = (f"Feature1 ID: {current.id}, "
                         f"start coordinate: {current.start}, "
                         f"stop coordinate: {current.stop}, "
@@ -993,40 +1057,8 @@ class Genome:
                         f"start coordinate: {next.start}, "
                         f"stop coordinate: {next.stop}, "
                         f"orientation: {next.orientation}. ")
-
-                if (current.start == next.start and current.stop == next.stop):
-                    msgs.append(ftrs)
-                    msgs.append("Feature1 and Feature2 contain identical "
-                                "start and stop coordinates.")
-
-                # To identify nested features, the following tests
-                # avoid false errors due to genes that may wrap around the
-                # genome.
-                elif (current.start < next.start and
-                      current.start < next.stop and
-                      current.stop > next.start and
-                      current.stop > next.stop):
-                    msgs.append(ftrs)
-                    msgs.append("Feature2 is nested within Feature1.")
-                elif (current.start == next.start and
-                        basic.reformat_strand(current.orientation,
-                            format="fr_short") == "r" and
-                        basic.reformat_strand(next.orientation,
-                            format="fr_short") == "r"):
-                    msgs.append(ftrs)
-                    msgs.append(("Feature1 and Feature2 contain "
-                                 "identical stop coordinates."))
-                elif (current.stop == next.stop and
-                        basic.reformat_strand(current.orientation,
-                            format="fr_short") == "f" and
-                        basic.reformat_strand(next.orientation,
-                            format="fr_short") == "f"):
-                    msgs.append(ftrs)
-                    msgs.append(("Feature1 and Feature2 contain "
-                                 "identical stop coordinates."))
-                else:
-                    pass
-                index += 1
+                msgs.append(ftrs)
+                msgs.append(COORDINATE_CONFLICT_MESSAGES[conflict])
         if len(msgs) > 1:
             result = result + " ".join(msgs)
             status = fail
@@ -1036,3 +1068,172 @@ class Genome:
         definition = ("Check if there are any feature coordinate conflicts.")
         definition = basic.join_strings([definition, eval_def])
         self.set_eval(eval_id, definition, result, status)
+
+
+class IntervalIndex:
+    """Class to index features by coordinates for region and conflict
+    queries.
+
+    Features are sorted by start and stop coordinates, and the stop
+    coordinates are stored in a max-tree so that all features overlapping
+    a region can be reported without comparing every feature.
+    Coordinates are used as they are stored, so features that wrap around
+    the end of the genome (start > stop) are not split.
+    """
+
+    def __init__(self, features):
+        """Constructor method for an IntervalIndex object.
+
+        :param features:
+            List of features that contain 'start', 'stop', and
+            'orientation' attributes.
+        :type features: list
+        """
+        self.features = sorted(features, key=attrgetter("start", "stop"))
+        self.starts = [ftr.start for ftr in self.features]
+        self.stops = [ftr.stop for ftr in self.features]
+
+        # Max-tree of stop coordinates. Leaves begin at index self._size.
+        self._size = 1
+        while self._size < len(self.features):
+            self._size *= 2
+        self._tree = [None] * (2 * self._size)
+        for index in range(len(self.stops)):
+            self._tree[self._size + index] = self.stops[index]
+        for node in range(self._size - 1, 0, -1):
+            children = [value for value in self._tree[2*node:2*node + 2]
+                        if value is not None]
+            if len(children) > 0:
+                self._tree[node] = max(children)
+
+    def __len__(self):
+        return len(self.features)
+
+    def _report(self, end, threshold):
+        """Get indices of features, among the first 'end' sorted features,
+        with a stop coordinate larger than the threshold.
+
+        :param end: Number of sorted features to search.
+        :type end: int
+        :param threshold: Stop coordinate that must be exceeded.
+        :type threshold: int
+        :returns: Sorted list of feature indices.
+        :rtype: list
+        """
+        indices = []
+        if end <= 0:
+            return indices
+        stack = [(1, 0, self._size)]
+        while len(stack) > 0:
+            node, low, high = stack.pop()
+            value = self._tree[node]
+            if low >= end or value is None or value <= threshold:
+                continue
+            if high - low == 1:
+                indices.append(low)
+            else:
+                mid = (low + high) // 2
+                stack.append((2*node + 1, mid, high))
+                stack.append((2*node, low, mid))
+        return indices
+
+    def query(self, start, stop):
+        """Get features that overlap the region [start, stop).
+
+        :param start: Start coordinate of the region.
+        :type start: int
+        :param stop: Stop coordinate of the region.
+        :type stop: int
+        :returns: List of overlapping features, sorted by coordinates.
+        :rtype: list
+        """
+        end = bisect_left(self.starts, stop)
+        return [self.features[index] for index in self._report(end, start)]
+
+    def get_nested(self):
+        """Get pairs of features in which the second feature is nested
+        within the first feature.
+
+        :returns: List of (index1, index2) tuples of sorted feature indices.
+        :rtype: list
+        """
+        pairs = []
+        for index2 in range(len(self.features)):
+            start2 = self.starts[index2]
+            stop2 = self.stops[index2]
+            end = bisect_left(self.starts, start2)
+            # To identify nested features, the following tests
+            # avoid false errors due to genes that may wrap around the
+            # genome.
+            for index1 in self._report(end, max(start2, stop2)):
+                if self.starts[index1] < stop2:
+                    pairs.append((index1, index2))
+        return pairs
+
+    def get_duplicates(self):
+        """Get pairs of features with identical start and stop coordinates.
+
+        :returns: List of (index1, index2) tuples of sorted feature indices.
+        :rtype: list
+        """
+        groups = {}
+        for index in range(len(self.features)):
+            coords = (self.starts[index], self.stops[index])
+            groups.setdefault(coords, []).append(index)
+        return _get_group_pairs(groups)
+
+    def get_shared_stops(self):
+        """Get pairs of features with the same orientation and identical
+        stop coordinates, but different start coordinates.
+
+        For features in the reverse orientation, the stop coordinate is
+        the 'start' attribute.
+
+        :returns: List of (index1, index2) tuples of sorted feature indices.
+        :rtype: list
+        """
+        groups = {}
+        for index in range(len(self.features)):
+            strand = basic.reformat_strand(self.features[index].orientation,
+                                           format="fr_short")
+            if strand == "f":
+                key = ("f", self.stops[index])
+            elif strand == "r":
+                key = ("r", self.starts[index])
+            else:
+                continue
+            groups.setdefault(key, []).append(index)
+        pairs = _get_group_pairs(groups)
+        return [(index1, index2) for index1, index2 in pairs
+                if (self.starts[index1] != self.starts[index2] or
+                    self.stops[index1] != self.stops[index2])]
+
+    def get_conflicts(self):
+        """Get all pairs of features with conflicting coordinates.
+
+        :returns:
+            List of (feature1, feature2, conflict) tuples, in which
+            conflict is 'duplicate', 'nested', or 'shared_stop', sorted by
+            the coordinates of feature1 and feature2.
+        :rtype: list
+        """
+        conflicts = []
+        for index1, index2 in self.get_duplicates():
+            conflicts.append((index1, index2, "duplicate"))
+        for index1, index2 in self.get_nested():
+            conflicts.append((index1, index2, "nested"))
+        for index1, index2 in self.get_shared_stops():
+            conflicts.append((index1, index2, "shared_stop"))
+        conflicts.sort()
+        return [(self.features[index1], self.features[index2], conflict)
+                for index1, index2, conflict in conflicts]
+
+
+def _get_group_pairs(groups):
+    """Get all pairs of indices within each group of indices."""
+    pairs = []
+    for indices in groups.values():
+        for x in range(len(indices)):
+            for y in range(x + 1, len(indices)):
+                pairs.append((indices[x], indices[y]))
+    return pairs
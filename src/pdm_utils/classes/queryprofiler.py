@@ -0,0 +1,305 @@
+"""Represents a profiler that records the SQL statements executed through
+SQLAlchemy engines and reports the most expensive ones."""
+
+import atexit
+import csv
+import json
+import re
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import event
+
+# Number of statements included in a report, ranked by total latency.
+TOP_STATEMENTS = 20
+
+REPORT_FIELDS = ["fingerprint", "count", "total_time", "mean_time",
+                 "max_time", "rows"]
+
+# Key used to store execution start times in the connection info dictionary.
+START_TIMES_KEY = "pdm_utils_profiler_start_times"
+
+# Patterns used to replace literal values in statements, so that statements
+# differing only in their values share a fingerprint.
+PLACEHOLDER_PATTERN = re.compile(r"%\(\w+\)s|%s|\?")
+STRING_PATTERN = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+NUMBER_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+VALUE_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Process-wide profiler shared by all profiled engines.
+PROFILER = None
+
+
+class QueryProfiler:
+    def __init__(self):
+        """
+        Constructor method for a QueryProfiler object.
+        """
+        self.enabled = True
+        self.stats = {}
+        self.report_path = None
+        self.explain = 0
+
+        self._engines = []
+        self._lock = threading.Lock()
+        self._registered = False
+
+    def attach(self, engine):
+        """
+        Records the statements executed through a SQLAlchemy engine.
+        :param engine: SQLAlchemy Engine object.
+        :type engine: Engine
+        :return:
+        """
+        if any(engine is attached for attached in self._engines):
+            return
+        event.listen(engine, "before_cursor_execute",
+                     self.before_cursor_execute)
+        event.listen(engine, "after_cursor_execute",
+                     self.after_cursor_execute)
+        self._engines.append(engine)
+
+    def detach(self, engine):
+        """
+        Stops recording the statements executed through a SQLAlchemy engine.
+        :param engine: SQLAlchemy Engine object.
+        :type engine: Engine
+        :return:
+        """
+        for index in range(len(self._engines)):
+            if self._engines[index] is engine:
+                event.remove(engine, "before_cursor_execute",
+                             self.before_cursor_execute)
+                event.remove(engine, "after_cursor_execute",
+                             self.after_cursor_execute)
+                del self._engines[index]
+                return
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters,
+                              context, executemany):
+        """Stores the start time of a statement on its connection."""
+        conn.info.setdefault(START_TIMES_KEY, []).append(time.perf_counter())
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters,
+                             context, executemany):
+        """Records the latency and number of rows of a statement."""
+        start_times = conn.info.get(START_TIMES_KEY)
+        if not start_times:
+            return
+        elapsed = time.perf_counter() - start_times.pop()
+        if not self.enabled:
+            return
+        # Unbuffered cursors report a negative row count.
+        rows = max(getattr(cursor, "rowcount", 0) or 0, 0)
+        self.record(statement, elapsed, rows=rows, parameters=parameters,
+                    engine=conn.engine)
+
+    def record(self, statement, elapsed, rows=0, parameters=None,
+               engine=None):
+        """
+        Adds an execution of a statement to the recorded statistics.
+        :param statement: SQL statement string
+        :type statement: str
+        :param elapsed: latency of the execution in seconds
+        :type elapsed: float
+        :param rows: number of rows returned or affected
+        :type rows: int
+        :param parameters: parameters the statement was executed with
+        :type parameters: dict
+        :param engine: SQLAlchemy Engine object the statement was executed on
+        :type engine: Engine
+        :return:
+        """
+        fingerprint = get_fingerprint(statement)
+        with self._lock:
+            entry = self.stats.get(fingerprint)
+            if entry is None:
+                entry = {"fingerprint": fingerprint, "count": 0,
+                         "total_time": 0.0, "max_time": 0.0, "rows": 0}
+                self.stats[fingerprint] = entry
+            entry["count"] += 1
+            entry["total_time"] += elapsed
+            entry["rows"] += rows
+            if elapsed >= entry["max_time"]:
+                # The slowest execution is kept so that it can be explained.
+                entry["max_time"] = elapsed
+                entry["statement"] = statement
+                entry["parameters"] = parameters
+                entry["engine"] = engine
+
+    def clear(self):
+        """
+        Removes all recorded statistics.
+        :return:
+        """
+        with self._lock:
+            self.stats = {}
+
+    def get_report(self, top=TOP_STATEMENTS, explain=0):
+        """
+        Summarizes the statements with the highest total latency.
+        :param top: maximum number of statements to report
+        :type top: int
+        :param explain:
+            number of the slowest reported statements for which the MySQL
+            EXPLAIN output is included
+        :type explain: int
+        :return: dictionary of overall totals and a list of statements
+        :rtype: dict
+        """
+        with self._lock:
+            entries = list(self.stats.values())
+
+        statements = []
+        for entry in sorted(entries, key=lambda entry: entry["total_time"],
+                            reverse=True)[:top]:
+            data = {"fingerprint": entry["fingerprint"],
+                    "count": entry["count"],
+                    "total_time": entry["total_time"],
+                    "mean_time": entry["total_time"] / entry["count"],
+                    "max_time": entry["max_time"],
+                    "rows": entry["rows"],
+                    "statement": entry["statement"]}
+            statements.append((entry, data))
+
+        slowest = sorted(statements, key=lambda item: item[1]["max_time"],
+                         reverse=True)[:explain]
+        for entry, data in slowest:
+            data["explain"] = self.explain_statement(entry)
+
+        report = {"statements": len(entries),
+                  "executions": sum(entry["count"] for entry in entries),
+                  "total_time": sum(entry["total_time"] for entry in entries),
+                  "top": [data for entry, data in statements]}
+        return report
+
+    def explain_statement(self, entry):
+        """
+        Gets the MySQL execution plan of the slowest execution of a statement.
+        :param entry: recorded statistics of the statement
+        :type entry: dict
+        :return: list of EXPLAIN rows, or an error message
+        :rtype: list
+        :rtype: str
+        """
+        statement = entry["statement"]
+        engine = entry.get("engine")
+        if engine is None or \
+                not statement.lstrip().upper().startswith("SELECT"):
+            return None
+
+        args = []
+        if entry.get("parameters"):
+            args.append(entry["parameters"])
+        self.enabled = False
+        try:
+            with engine.connect() as connection:
+                results = connection.execute("EXPLAIN " + statement,
+                                             *args).fetchall()
+            return [{key: convert_value(value)
+                     for key, value in dict(result).items()}
+                    for result in results]
+        except Exception as exc:
+            return f"EXPLAIN failed: {exc}"
+        finally:
+            self.enabled = True
+
+    def write_report(self, file_path, top=TOP_STATEMENTS, explain=0):
+        """
+        Writes a report of the statements with the highest total latency,
+        as CSV if the file has a '.csv' suffix and as JSON otherwise.
+        :param file_path: path to the report file
+        :type file_path: Path
+        :param top: maximum number of statements to report
+        :type top: int
+        :param explain:
+            number of the slowest reported statements for which the MySQL
+            EXPLAIN output is included in a JSON report
+        :type explain: int
+        :return:
+        """
+        file_path = Path(file_path)
+        if file_path.suffix.lower() == ".csv":
+            report = self.get_report(top=top)
+            with file_path.open("w", newline="") as handle:
+                writer = csv.DictWriter(handle, REPORT_FIELDS,
+                                        extrasaction="ignore")
+                writer.writeheader()
+                for data in report["top"]:
+                    writer.writerow(data)
+        else:
+            report = self.get_report(top=top, explain=explain)
+            with file_path.open("w") as handle:
+                json.dump(report, handle, indent=2)
+
+    def register_report(self, file_path, explain=0):
+        """
+        Sets the report written when the Python process exits.
+        :param file_path: path to the report file
+        :type file_path: Path
+        :param explain:
+            number of the slowest reported statements to explain
+        :type explain: int
+        :return:
+        """
+        self.report_path = Path(file_path)
+        self.explain = explain
+        if not self._registered:
+            atexit.register(self.write_exit_report)
+            self._registered = True
+
+    def write_exit_report(self):
+        """Writes the registered report, if any statements were recorded."""
+        if self.report_path is None or not self.stats:
+            return
+        try:
+            self.write_report(self.report_path, explain=self.explain)
+        except OSError as exc:
+            print(f"Unable to write query profile to {self.report_path}: "
+                  f"{exc}")
+            return
+        print(f"Query profile written to {self.report_path}.")
+
+
+def get_fingerprint(statement):
+    """Normalize a SQL statement by replacing its literal values.
+
+    :param statement: SQL statement string.
+    :type statement: str
+    :returns: Statement with values replaced by '?' and value lists by '(...)'.
+    :rtype: str
+    """
+    fingerprint = STRING_PATTERN.sub("?", statement)
+    fingerprint = PLACEHOLDER_PATTERN.sub("?", fingerprint)
+    fingerprint = NUMBER_PATTERN.sub("?", fingerprint)
+    fingerprint = VALUE_LIST_PATTERN.sub("(...)", fingerprint)
+    fingerprint = WHITESPACE_PATTERN.sub(" ", fingerprint)
+    return fingerprint.strip()
+
+
+def convert_value(value):
+    """Convert a value from an EXPLAIN row into a JSON serializable value.
+
+    :param value: Value retrieved from MySQL.
+    :returns: The value, decoded if bytes and converted to str if not
+              a JSON primitive.
+    """
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def get_profiler():
+    """Get the profiler shared by all profiled engines in the process.
+
+    :returns: QueryProfiler object.
+    :rtype: QueryProfiler
+    """
+    global PROFILER
+    if PROFILER is None:
+        PROFILER = QueryProfiler()
+    return PROFILER
@@ -0,0 +1,164 @@
+"""Represents a persistent cache of reflected MySQL database schemas and
+the join graphs derived from them."""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from pdm_utils.constants import constants
+from pdm_utils.functions import mysqldb_basic
+from pdm_utils.functions import querying
+
+# Version of the cache file format.
+FORMAT_VERSION = 1
+
+SUFFIX = ".pickle"
+
+SCHEMA_VERSION_QUERY = "SELECT SchemaVersion FROM version"
+
+# Column and foreign key definitions of every table in a database, used to
+# verify that a cached schema still matches the database.
+FINGERPRINT_QUERY = (
+    "SELECT c.TABLE_NAME, c.COLUMN_NAME, c.COLUMN_TYPE, c.IS_NULLABLE, "
+    "c.COLUMN_KEY, k.REFERENCED_TABLE_NAME, k.REFERENCED_COLUMN_NAME "
+    "FROM information_schema.COLUMNS AS c "
+    "LEFT JOIN information_schema.KEY_COLUMN_USAGE AS k "
+    "ON k.TABLE_SCHEMA = c.TABLE_SCHEMA AND k.TABLE_NAME = c.TABLE_NAME "
+    "AND k.COLUMN_NAME = c.COLUMN_NAME "
+    "AND k.REFERENCED_TABLE_NAME IS NOT NULL "
+    "WHERE c.TABLE_SCHEMA = '{}' "
+    "ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION, k.REFERENCED_TABLE_NAME")
+
+
+class SchemaCache:
+    def __init__(self, cache_dir=None):
+        """
+        Constructor method for a SchemaCache object.
+        :param cache_dir: directory in which schemas are stored
+        :type cache_dir: Path
+        """
+        if cache_dir is None:
+            cache_dir = constants.SCHEMA_CACHE_DIR
+        self.cache_dir = Path(cache_dir)
+
+    def get_schema_version(self, engine):
+        """
+        Gets the schema version of a MySQL database.
+        :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+        :type engine: Engine
+        :return: schema version, or None if it is not recorded
+        :rtype: int
+        """
+        try:
+            return mysqldb_basic.scalar(engine, SCHEMA_VERSION_QUERY)
+        except Exception:
+            return None
+
+    def get_fingerprint(self, engine):
+        """
+        Gets a digest of the table definitions of a MySQL database.
+        :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+        :type engine: Engine
+        :return: hexadecimal digest
+        :rtype: str
+        """
+        query = FINGERPRINT_QUERY.format(engine.url.database)
+        rows = [tuple(row) for row in engine.execute(query).fetchall()]
+        return hashlib.sha256(repr(rows).encode("utf-8")).hexdigest()
+
+    def make_key(self, engine):
+        """
+        Generates a cache key from the host, database and schema version
+        of a MySQL database.
+        :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+        :type engine: Engine
+        :return: hexadecimal digest
+        :rtype: str
+        """
+        data = "\n".join([str(engine.url.host), str(engine.url.database),
+                          str(self.get_schema_version(engine))])
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get_path(self, key):
+        """
+        Gets the path of the file storing the indicated key.
+        :param key: cache key
+        :type key: str
+        :return: path to the cached schema
+        :rtype: Path
+        """
+        return Path(self.cache_dir, key + SUFFIX)
+
+    def get(self, engine):
+        """
+        Retrieves the cached schema of a MySQL database, if it matches the
+        current table definitions of the database.
+        :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+        :type engine: Engine
+        :return:
+            graph generated by querying.build_graph(), storing a MetaData
+            object bound to the engine, or None if the schema is not cached
+        :rtype: Graph
+        """
+        path = self.get_path(self.make_key(engine))
+        try:
+            with path.open("rb") as handle:
+                data = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+                ImportError):
+            return None
+
+        if (not isinstance(data, dict) or
+                data.get("format") != FORMAT_VERSION or
+                data.get("fingerprint") != self.get_fingerprint(engine)):
+            return None
+
+        graph = data["graph"]
+        graph.graph["metadata"].bind = engine
+        return graph
+
+    def put(self, engine, metadata):
+        """
+        Stores the schema of a MySQL database.
+        :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+        :type engine: Engine
+        :param metadata: MetaData object reflected from the database
+        :type metadata: MetaData
+        :return: graph generated by querying.build_graph()
+        :rtype: Graph
+        """
+        graph = querying.build_graph(metadata)
+        data = {"format": FORMAT_VERSION,
+                "fingerprint": self.get_fingerprint(engine),
+                "graph": graph}
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.get_path(self.make_key(engine))
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as handle:
+            pickle.dump(data, handle)
+        os.replace(tmp_path, path)
+        return graph
+
+    def get_entries(self):
+        """
+        Gets the paths of all cached schemas.
+        :return: list of paths
+        :rtype: list
+        """
+        if not self.cache_dir.exists():
+            return []
+        return [path for path in self.cache_dir.iterdir()
+                if path.suffix == SUFFIX]
+
+    def clear(self):
+        """
+        Removes all cached schemas.
+        :return: number of schemas removed
+        :rtype: int
+        """
+        entries = self.get_entries()
+        for path in entries:
+            path.unlink()
+        return len(entries)
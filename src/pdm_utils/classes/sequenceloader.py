@@ -0,0 +1,91 @@
+"""Represents a loader that retrieves genome sequences from a MySQL database
+only when they are needed."""
+
+from Bio.Seq import Seq
+
+from pdm_utils.functions import mysqldb_basic
+
+SEQUENCE_QUERY = "SELECT PhageID, Sequence FROM phage"
+
+
+class SequenceLoader:
+    def __init__(self, engine, phage_ids, batch_size=100):
+        """
+        Constructor method for a SequenceLoader object.
+        :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+        :type engine: Engine
+        :param phage_ids:
+            Ordered list of PhageIDs of genomes whose sequences may be
+            requested. When a sequence is requested, sequences of the
+            following genomes in the list are retrieved in the same query.
+        :type phage_ids: list
+        :param batch_size: maximum number of sequences retrieved per query
+        :type batch_size: int
+        """
+        self.engine = engine
+        self.phage_ids = list(phage_ids)
+        self.batch_size = batch_size
+
+        self._positions = {}
+        for index in range(len(self.phage_ids)):
+            self._positions.setdefault(self.phage_ids[index], index)
+        self._requested = set()
+        self._sequences = {}
+
+        # Tally of the number of queries executed.
+        self.queries = 0
+
+    def get_batch(self, phage_id):
+        """
+        Gets the list of PhageIDs to retrieve together with the indicated
+        PhageID, beginning with the PhageID itself.
+        :param phage_id: PhageID of the requested genome
+        :type phage_id: str
+        :return: list of PhageIDs
+        :rtype: list
+        """
+        batch = [phage_id]
+        index = self._positions.get(phage_id, len(self.phage_ids)) + 1
+        while len(batch) < self.batch_size and index < len(self.phage_ids):
+            neighbor = self.phage_ids[index]
+            if neighbor not in self._requested and neighbor not in batch:
+                batch.append(neighbor)
+            index += 1
+        return batch
+
+    def load(self, phage_ids):
+        """
+        Retrieves and decodes sequences for the indicated genomes.
+        :param phage_ids: list of PhageIDs
+        :type phage_ids: list
+        :return:
+        """
+        result_list = mysqldb_basic.retrieve_data(self.engine,
+                                                  column="PhageID",
+                                                  query=SEQUENCE_QUERY,
+                                                  id_list=phage_ids)
+        self.queries += 1
+        self._requested.update(phage_ids)
+        for data_dict in result_list:
+            # Sequence data is stored as MEDIUMBLOB, so decode to string.
+            value = data_dict["Sequence"].decode("utf-8")
+            self._sequences[data_dict["PhageID"]] = value
+
+    def get_sequence(self, phage_id):
+        """
+        Gets the sequence of the indicated genome. The decoded sequence is
+        only retained by the loader until it is requested.
+        :param phage_id: PhageID of the requested genome
+        :type phage_id: str
+        :return:
+            genome sequence, coerced into a Biopython Seq object in the same
+            way as Genome.set_sequence(), or None if the genome is not
+            present in the database
+        :rtype: Seq
+        """
+        if phage_id not in self._sequences:
+            self.load(self.get_batch(phage_id))
+        value = self._sequences.pop(phage_id, None)
+        if value is None:
+            return None
+        return Seq(value).upper()
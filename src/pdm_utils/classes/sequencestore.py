@@ -0,0 +1,391 @@
+"""Represents a local, memory-mapped snapshot of genome sequences stored in a
+MySQL database."""
+
+from bisect import bisect_right
+import json
+import mmap
+import os
+from pathlib import Path
+
+from Bio.Seq import Seq
+import numpy as np
+
+from pdm_utils.constants import constants
+from pdm_utils.functions import mysqldb_basic
+
+# Version of the store file format.
+FORMAT_VERSION = 1
+
+DATA_FILE = "sequences.2bit"
+INDEX_FILE = "index.json"
+
+ID_QUERY = "SELECT PhageID FROM phage"
+SEQUENCE_QUERY = "SELECT PhageID, Sequence FROM phage"
+# The stamp is cheap to compute, and changes when genomes are added or
+# removed, when the database version is incremented, or when a genome is
+# modified with a later DateLastModified. Changes made through the store
+# itself are stamped with update().
+VERSION_QUERY = "SELECT Version FROM version"
+STAMP_QUERY = "SELECT COUNT(*), MAX(DateLastModified) FROM phage"
+
+# Nucleotides are packed four per byte, with the first nucleotide
+# in the two most significant bits. Other symbols are stored as 'A' and
+# recorded in the exception list of the genome.
+NUCLEOTIDES = b"ACGT"
+
+
+def _create_tables():
+    """Create the lookup tables used to pack and unpack nucleotides."""
+    pack = np.zeros(256, dtype=np.uint8)
+    valid = np.zeros(256, dtype=bool)
+    for index in range(len(NUCLEOTIDES)):
+        pack[NUCLEOTIDES[index]] = index
+        valid[NUCLEOTIDES[index]] = True
+    codes = np.arange(256, dtype=np.uint8)
+    unpack = np.empty((256, 4), dtype=np.uint8)
+    for position in range(4):
+        shift = 6 - 2 * position
+        unpack[:, position] = np.frombuffer(NUCLEOTIDES, dtype=np.uint8)[
+                                            (codes >> shift) & 3]
+    return pack, valid, unpack
+
+PACK_TABLE, VALID_TABLE, UNPACK_TABLE = _create_tables()
+
+
+class SequenceStore:
+    def __init__(self, path=None):
+        """
+        Constructor method for a SequenceStore object.
+        :param path: directory containing the store files
+        :type path: Path
+        """
+        if path is None:
+            path = constants.SEQ_STORE_DIR
+        self.path = Path(path)
+        self.data_path = Path(self.path, DATA_FILE)
+        self.index_path = Path(self.path, INDEX_FILE)
+
+        self.version = None
+        self.index = {}
+
+        # Sequences updated since the snapshot was written.
+        self.pending = {}
+
+        self._file = None
+        self._mmap = None
+
+    def exists(self):
+        """
+        Checks whether a snapshot has been written to the store directory.
+        :return: True if the store files are present
+        :rtype: bool
+        """
+        return self.data_path.exists() and self.index_path.exists()
+
+    def open(self):
+        """
+        Loads the offset index and memory-maps the packed sequence file.
+        :return:
+        """
+        self.close()
+        with self.index_path.open("r") as handle:
+            data = json.load(handle)
+        if data.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Sequence store at {self.path} uses an "
+                             "unsupported file format.")
+        self.version = data["version"]
+        self.index = data["genomes"]
+
+        self._file = self.data_path.open("rb")
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        else:
+            self._mmap = b""
+
+    def close(self):
+        """
+        Closes the memory-mapped sequence file.
+        :return:
+        """
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clear(self):
+        """
+        Removes the snapshot from the store directory.
+        :return: number of genome sequences removed
+        :rtype: int
+        """
+        removed = 0
+        if self.load():
+            removed = len(self.index)
+        self.close()
+        for filepath in (self.data_path, self.index_path):
+            if filepath.exists():
+                filepath.unlink()
+        self.version = None
+        self.index = {}
+        self.pending = {}
+        return removed
+
+    def load(self):
+        """
+        Opens the snapshot if it exists and has not been opened yet.
+        :return: True if a snapshot is open
+        :rtype: bool
+        """
+        if self._mmap is None:
+            if not self.exists():
+                return False
+            self.open()
+        return True
+
+    def get_db_version(self, engine):
+        """
+        Gets the version stamp of the phage table of a MySQL database.
+        :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+        :type engine: Engine
+        :return:
+            dictionary of the database name and version, and the number
+            of genomes and latest modification date of the phage table
+        :rtype: dict
+        """
+        version = engine.execute(VERSION_QUERY).fetchone()
+        count, modified = engine.execute(STAMP_QUERY).fetchone()
+        if modified is not None:
+            modified = str(modified)
+        return {"database": engine.url.database, "version": version[0],
+                "count": count, "modified": modified}
+
+    def is_current(self, engine):
+        """
+        Checks whether the snapshot matches the current phage table.
+        :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+        :type engine: Engine
+        :return: True if the snapshot version matches the database
+        :rtype: bool
+        """
+        if not self.load():
+            return False
+        return self.version == self.get_db_version(engine)
+
+    def snapshot(self, engine, batch_size=100):
+        """
+        Writes the sequences of all genomes in a MySQL database to the store,
+        retrieving sequences in batches.
+        :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+        :type engine: Engine
+        :param batch_size: number of sequences retrieved per query
+        :type batch_size: int
+        :return:
+        """
+        version = self.get_db_version(engine)
+        phage_ids = sorted(mysqldb_basic.query_set(engine, ID_QUERY))
+
+        def iter_sequences():
+            for x in range(0, len(phage_ids), batch_size):
+                result_list = mysqldb_basic.retrieve_data(
+                                    engine, column="PhageID",
+                                    query=SEQUENCE_QUERY,
+                                    id_list=phage_ids[x:x + batch_size])
+                for data_dict in result_list:
+                    # Sequence data is stored as MEDIUMBLOB.
+                    yield (data_dict["PhageID"], data_dict["Sequence"])
+
+        self.write(iter_sequences(), version)
+
+    def update(self, engine, sequences):
+        """
+        Records sequences committed to a MySQL database by this process,
+        and stamps the snapshot with the resulting database version, so
+        that the snapshot does not need to be rewritten from the database.
+        :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+        :type engine: Engine
+        :param sequences: dictionary of PhageIDs and sequences
+        :type sequences: dict
+        :return:
+        """
+        if not self.load():
+            return
+        for phage_id, value in sequences.items():
+            self.pending[phage_id] = str(value).upper()
+        self.version = self.get_db_version(engine)
+
+    def flush(self):
+        """
+        Writes sequences recorded with update() to the store files.
+        :return:
+        """
+        if not self.pending or not self.load():
+            return
+
+        def iter_sequences():
+            for phage_id in self.get_phage_ids():
+                yield (phage_id, str(self.get_sequence(phage_id)))
+
+        self.write(iter_sequences(), self.version)
+
+    def write(self, sequences, version):
+        """
+        Writes sequences to the store, replacing any existing snapshot.
+        :param sequences: iterable of (PhageID, sequence) tuples
+        :type sequences: iterable
+        :param version: version stamp of the sequences
+        :type version: dict
+        :return:
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        genomes = {}
+        offset = 0
+        tmp_data_path = self.data_path.with_name(DATA_FILE + ".tmp")
+        with tmp_data_path.open("wb") as handle:
+            for phage_id, value in sequences:
+                if isinstance(value, str):
+                    value = value.encode("utf-8")
+                elif value is None:
+                    value = b""
+                packed, exceptions = pack_sequence(bytes(value).upper())
+                handle.write(packed)
+                genomes[phage_id] = {"offset": offset,
+                                     "length": len(value),
+                                     "exceptions": exceptions}
+                offset += len(packed)
+
+        data = {"format": FORMAT_VERSION, "version": version,
+                "genomes": genomes}
+        tmp_index_path = self.index_path.with_name(INDEX_FILE + ".tmp")
+        with tmp_index_path.open("w") as handle:
+            json.dump(data, handle)
+        # Sequences may be read from the existing snapshot until it is
+        # replaced.
+        self.close()
+        self.pending = {}
+        os.replace(tmp_data_path, self.data_path)
+        os.replace(tmp_index_path, self.index_path)
+        self.open()
+
+    def get_phage_ids(self):
+        """
+        Gets the PhageIDs of all genomes in the store.
+        :return: list of PhageIDs
+        :rtype: list
+        """
+        self.load()
+        phage_ids = list(self.index.keys())
+        phage_ids.extend(phage_id for phage_id in self.pending.keys()
+                         if phage_id not in self.index)
+        return phage_ids
+
+    def get_length(self, phage_id):
+        """
+        Gets the length of a genome sequence.
+        :param phage_id: PhageID of the genome
+        :type phage_id: str
+        :return: length of the sequence, or -1 if the genome is not stored
+        :rtype: int
+        """
+        self.load()
+        if phage_id in self.pending:
+            return len(self.pending[phage_id])
+        entry = self.index.get(phage_id)
+        if entry is None:
+            return -1
+        return entry["length"]
+
+    def get_subsequence(self, phage_id, start, stop):
+        """
+        Gets a region of a genome sequence. Only the packed bytes spanning
+        the region are read from the memory-mapped file.
+        :param phage_id: PhageID of the genome
+        :type phage_id: str
+        :param start: 0-based start coordinate of the region
+        :type start: int
+        :param stop: 0-based half-open stop coordinate of the region
+        :type stop: int
+        :return: nucleotide sequence, or None if the genome is not stored
+        :rtype: str
+        """
+        self.load()
+        if phage_id in self.pending:
+            return self.pending[phage_id][max(0, start):max(0, stop)]
+        entry = self.index.get(phage_id)
+        if entry is None:
+            return None
+        start = max(0, start)
+        stop = min(entry["length"], stop)
+        if stop <= start:
+            return ""
+
+        first = entry["offset"] + start // 4
+        last = entry["offset"] + (stop + 3) // 4
+        view = np.frombuffer(self._mmap, dtype=np.uint8,
+                             count=last - first, offset=first)
+        shift = start % 4
+        region = UNPACK_TABLE[view].reshape(-1)[shift:shift + stop - start]
+
+        exceptions = entry["exceptions"]
+        index = max(0, bisect_right(exceptions, [start]) - 1)
+        while index < len(exceptions) and exceptions[index][0] < stop:
+            exc_start, exc_length, symbol = exceptions[index]
+            left = max(exc_start, start) - start
+            right = min(exc_start + exc_length, stop) - start
+            if right > left:
+                region[left:right] = ord(symbol)
+            index += 1
+        return region.tobytes().decode("ascii")
+
+    def get_sequence(self, phage_id):
+        """
+        Gets a genome sequence.
+        :param phage_id: PhageID of the genome
+        :type phage_id: str
+        :return:
+            genome sequence, coerced into a Biopython Seq object in the same
+            way as Genome.set_sequence(), or None if the genome is not stored
+        :rtype: Seq
+        """
+        value = self.get_subsequence(phage_id, 0, self.get_length(phage_id))
+        if value is None:
+            return None
+        return Seq(value).upper()
+
+
+def pack_sequence(value):
+    """Pack a nucleotide sequence into 2-bit codes.
+
+    :param value: Uppercase nucleotide sequence.
+    :type value: bytes
+    :returns:
+        Tuple of the packed bytes and a list of [start, length, symbol]
+        runs of symbols other than 'ACGT'.
+    :rtype: tuple
+    """
+    data = np.frombuffer(value, dtype=np.uint8)
+    codes = PACK_TABLE[data]
+    remainder = len(codes) % 4
+    if remainder > 0:
+        codes = np.concatenate((codes, np.zeros(4 - remainder,
+                                                dtype=np.uint8)))
+    codes = codes.reshape(-1, 4)
+    packed = (codes[:, 0] << 6) | (codes[:, 1] << 4) | \
+             (codes[:, 2] << 2) | codes[:, 3]
+
+    exceptions = []
+    positions = np.flatnonzero(~VALID_TABLE[data])
+    if len(positions) > 0:
+        # Split positions into runs of the same consecutive symbol.
+        breaks = np.flatnonzero((np.diff(positions) != 1) |
+                                (data[positions[1:]] != data[positions[:-1]]))
+        run_starts = np.concatenate(([0], breaks + 1))
+        run_ends = np.concatenate((breaks + 1, [len(positions)]))
+        for x in range(len(run_starts)):
+            start = int(positions[run_starts[x]])
+            length = int(run_ends[x] - run_starts[x])
+            exceptions.append([start, length, chr(data[start])])
+    return packed.astype(np.uint8).tobytes(), exceptions
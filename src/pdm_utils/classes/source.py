@@ -5,7 +5,16 @@ to maintain and update SEA-PHAGES phage genomics data.
 from pdm_utils.functions import basic
 from pdm_utils.classes import evaluation
 
-class Source:
+class Source(evaluation.EvaluationsMixin):
+
+    # Attributes are stored in slots to reduce the memory used by each
+    # feature. The __dict__ slot is only allocated if an undeclared
+    # attribute is assigned.
+    __slots__ = (
+        "id", "name", "seqfeature", "start", "stop", "organism", "host",
+        "lab_host", "genome_id", "_organism_name", "_organism_host_genus",
+        "_host_host_genus", "_lab_host_host_genus", "type",
+        "__dict__")
 
     def __init__(self):
 
@@ -25,7 +34,7 @@ class Source:
         self._organism_host_genus = "" # Parsed from organism.
         self._host_host_genus = "" # Parsed from host.
         self._lab_host_host_genus = "" # Parsed from lab_host.
-        self.evaluations = [] # List of warnings and errors about source feature.
+        self._evaluations = None # Created when first accessed.
         self.type = ""
 
 
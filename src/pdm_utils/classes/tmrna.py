@@ -11,6 +11,7 @@ from Bio.Alphabet import IUPAC
 
 from pdm_utils.classes import evaluation
 from pdm_utils.classes.aragornhandler import AragornHandler
+from pdm_utils.constants import constants
 from pdm_utils.functions import basic
 
 # Extracts peptide tag from note field acid and anticodon from note field for Aragorn-determinate
@@ -18,13 +19,24 @@ from pdm_utils.functions import basic
 NOTE_STANDARD_REGEX = re.compile("Peptide tag: ([\w|*]*)")
 
 
-class Tmrna:
+class Tmrna(evaluation.EvaluationsMixin):
+    # Attributes are stored in slots to reduce the memory used by each
+    # feature. The __dict__ slot is only allocated if an undeclared
+    # attribute is assigned.
+    __slots__ = (
+        "seq", "length", "genome_id", "genome_length", "start", "stop",
+        "coordinate_format", "orientation", "id", "name", "peptide_tag",
+        "seqfeature", "locus_tag", "_locus_tag_num", "_gene_num", "parts",
+        "gene", "note", "aragorn_run", "aragorn_data", "type",
+        "_start_stop_orient_id", "_end_orient_id", "_start_end_id",
+        "__dict__")
+
     def __init__(self):
         """
         Constructor method for a tmRNA object.
         """
         # The only attribute a tmRNA really needs to have is a sequence
-        self.seq = Seq("", IUPAC.ambiguous_dna)
+        self.seq = constants.EMPTY_GENOME_SEQ
         self.length = 0
 
         # Information about the tmRNA with respect to its parent genome
@@ -54,7 +66,7 @@ class Tmrna:
         self.aragorn_data = None
 
         # Useful for processing data from various sources:
-        self.evaluations = list()
+        self._evaluations = None # Created when first accessed.
         self.type = ""
         self._start_stop_orient_id = tuple()
         self._end_orient_id = tuple()
@@ -0,0 +1,243 @@
+"""Represents a persistent, content-addressed cache of raw output produced
+by external annotation tools such as Aragorn and tRNAscan-SE.
+"""
+
+import functools
+import hashlib
+import os
+import re
+import subprocess
+from pathlib import Path
+
+from pdm_utils.constants import constants
+
+VERSION_REGEX = re.compile(r"v?(\d+(?:\.\d+)+)")
+
+#ToolCache shared by all tool handlers in the process, so that its running
+#size and hit/miss counts persist across runs of the tools.
+SHARED_CACHE = None
+
+
+@functools.lru_cache(maxsize=None)
+def get_tool_version(tool):
+    """Get the version of an external tool installed on the system.
+
+    The version is parsed from the tool's help text, and is only
+    determined once per tool per process.
+
+    :param tool: Name of the tool's executable.
+    :type tool: str
+    :returns: Version of the tool, or 'unknown' if it can't be determined.
+    :rtype: str
+    """
+    try:
+        result = subprocess.run([tool, "-h"], stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT,
+                                universal_newlines=True)
+    except OSError:
+        return "unknown"
+
+    match = VERSION_REGEX.search(result.stdout)
+    if match is None:
+        return "unknown"
+    return match.group(1)
+
+
+def get_shared_cache():
+    """Get the ToolCache shared by all tool handlers in the process.
+
+    :returns: ToolCache object.
+    :rtype: ToolCache
+    """
+    global SHARED_CACHE
+    if SHARED_CACHE is None:
+        SHARED_CACHE = ToolCache()
+    return SHARED_CACHE
+
+
+class ToolCache:
+    def __init__(self, cache_dir=None, max_size=None):
+        """
+        Constructor method for a ToolCache object.
+        :param cache_dir: directory in which results are stored
+        :type cache_dir: Path
+        :param max_size: maximum size of the cache in bytes
+        :type max_size: int
+        """
+        if cache_dir is None:
+            cache_dir = constants.TOOL_CACHE_DIR
+        if max_size is None:
+            max_size = constants.TOOL_CACHE_MAX_SIZE
+
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        # Running total of the cache size in bytes, computed from the
+        # cache directory on the first write.
+        self._size = None
+
+    def make_key(self, tool, version, options, sequence):
+        """
+        Computes the cache key for a tool run. Results for the same
+        sequence searched by the same tool version with the same options
+        always share a key.
+        :param tool: name of the tool
+        :type tool: str
+        :param version: version of the tool
+        :type version: str
+        :param options: command line options used for the search
+        :type options: str
+        :param sequence: sequence that was searched
+        :type sequence: str
+        :return: key
+        :rtype: str
+        """
+        seq_digest = hashlib.sha256(sequence.upper().encode()).hexdigest()
+        key_str = "\t".join([tool, version, options, seq_digest])
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+    def get_path(self, key):
+        """
+        Builds the path at which the output for the indicated key is stored.
+        :param key: cache key
+        :type key: str
+        :return: path
+        :rtype: Path
+        """
+        return Path(self.cache_dir, key[:2], key + ".out")
+
+    def get(self, key):
+        """
+        Retrieves stored output for the indicated key.
+        :param key: cache key
+        :type key: str
+        :return: stored output, or None if the key is not cached
+        :rtype: str
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, "r") as fh:
+                output = fh.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        # Refresh the modification time so that eviction removes the
+        # least recently used results first.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return output
+
+    def put(self, key, output):
+        """
+        Stores output for the indicated key, then evicts old results if
+        the cache has grown too large.
+        :param key: cache key
+        :type key: str
+        :param output: raw tool output
+        :type output: str
+        :return:
+        """
+        path = self.get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self._size is None:
+            self._size = self.size()
+        try:
+            self._size -= path.stat().st_size
+        except OSError:
+            pass
+
+        # Write to a temporary file first so that concurrent readers
+        # never see a partially written result.
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w") as fh:
+            fh.write(output)
+        os.replace(temp_path, path)
+
+        # The cache directory is only scanned once the running total
+        # exceeds the limit.
+        self._size += len(output.encode())
+        if self._size > self.max_size:
+            self.evict()
+
+    def get_entries(self):
+        """
+        Gets all stored results.
+        :return: list of (modification time, size, path) tuples
+        :rtype: list
+        """
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+
+        for path in self.cache_dir.glob("*/*.out"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self):
+        """
+        Computes the total size of all stored results.
+        :return: size in bytes
+        :rtype: int
+        """
+        return sum(entry[1] for entry in self.get_entries())
+
+    def evict(self):
+        """
+        Removes the least recently used results until the cache is no
+        larger than `max_size`.
+        :return: number of results removed
+        :rtype: int
+        """
+        entries = self.get_entries()
+        total = sum(entry[1] for entry in entries)
+        self._size = total
+        if total <= self.max_size:
+            return 0
+
+        removed = 0
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        self._size = total
+        return removed
+
+    def clear(self):
+        """
+        Removes all stored results.
+        :return: number of results removed
+        :rtype: int
+        """
+        removed = 0
+        for mtime, size, path in self.get_entries():
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+        self._size = None
+
+        if self.cache_dir.exists():
+            for subdir in self.cache_dir.iterdir():
+                if subdir.is_dir() and not any(subdir.iterdir()):
+                    subdir.rmdir()
+        return removed
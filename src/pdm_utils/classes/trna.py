@@ -11,6 +11,7 @@ from Bio.SeqFeature import SeqFeature, FeatureLocation, CompoundLocation
 from pdm_utils.classes import evaluation
 from pdm_utils.classes.aragornhandler import AragornHandler
 from pdm_utils.classes.trnascansehandler import TRNAscanSEHandler
+from pdm_utils.constants import constants
 from pdm_utils.functions import basic
 
 # Amino acids that we allow in the database
@@ -41,13 +42,25 @@ NOTE_STANDARD_REGEX = re.compile("tRNA-(\w+)\s?\((\w+)\)")
 NOTE_SPECIAL_REGEX = re.compile("tRNA-\?\((\w+)\|(\w+)\)\s?\((\w+)\)")
 
 
-class Trna:
+class Trna(evaluation.EvaluationsMixin):
+    # Attributes are stored in slots to reduce the memory used by each
+    # feature. The __dict__ slot is only allocated if an undeclared
+    # attribute is assigned.
+    __slots__ = (
+        "seq", "length", "genome_id", "genome_length", "start", "stop",
+        "coordinate_format", "orientation", "id", "name", "amino_acid",
+        "anticodon", "structure", "seqfeature", "locus_tag", "_locus_tag_num",
+        "_gene_num", "parts", "gene", "product", "note", "aragorn_data",
+        "trnascanse_data", "_sources", "use", "type",
+        "_start_stop_orient_id", "_end_orient_id", "_start_end_id",
+        "__dict__")
+
     def __init__(self):
         """
         Constructor method for a tRNA object.
         """
         # The only attribute a tRNA really needs to have is a sequence
-        self.seq = Seq("", IUPAC.ambiguous_dna)
+        self.seq = constants.EMPTY_GENOME_SEQ
         self.length = 0
 
         # Information about the tRNA with respect to its parent genome
@@ -81,19 +94,31 @@ class Trna:
         # tRNAscan-SE data
         self.trnascanse_data = None
 
-        # Which program(s) support the annotation?
-        self.sources = set()
+        # Which program(s) support the annotation? Created when first
+        # accessed.
+        self._sources = None
 
         # Which program to check for valid anticodon?
         self.use = None
 
         # Useful for processing data from various sources:
-        self.evaluations = list()
+        self._evaluations = None # Created when first accessed.
         self.type = ""
         self._start_stop_orient_id = tuple()
         self._end_orient_id = tuple()
         self._start_end_id = tuple()
 
+    @property
+    def sources(self):
+        """Set of programs that support the annotation."""
+        if self._sources is None:
+            self._sources = set()
+        return self._sources
+
+    @sources.setter
+    def sources(self, value):
+        self._sources = value
+
     # TODO: create base feature class
     def set_locus_tag(self, tag="", delimiter="_", check_value=None):
         """
@@ -3,14 +3,20 @@ import shlex
 from subprocess import Popen
 import re
 
+from pdm_utils.classes.toolcache import get_shared_cache, get_tool_version
 from pdm_utils.functions import basic
 
 
 class TRNAscanSEHandler:
-    def __init__(self, identifier, sequence):
+    def __init__(self, identifier, sequence, cache=None):
         self.id = identifier
         self.sequence = sequence
 
+        # Cache of previous tRNAscan-SE results
+        if cache is None:
+            cache = get_shared_cache()
+        self.cache = cache
+
         # I/O attributes
         self.temp_dir = "/tmp/trnascanse"
         self.input = os.path.join(self.temp_dir, self.id) + ".fasta"
@@ -33,18 +39,44 @@ class TRNAscanSEHandler:
         with open(self.input, "w") as fh:
             fh.write(f">{self.id}\n{self.sequence}\n")
 
-    def run_trnascanse(self, x=10):
+    def run_trnascanse(self, x=10, use_cache=True):
         """
-        Set up tRNAscan-SE command, then run it. Explanation of
-        arguments:
+        Set up tRNAscan-SE command, then run it. If the same sequence has
+        already been searched with the same tRNAscan-SE version and
+        options, the cached output is written to the output file instead
+        of running tRNAscan-SE again. Explanation of arguments:
         :param x: score cutoff for tRNAscan-SE
         :type x: int
+        :param use_cache: consult and update the result cache
+        :type use_cache: bool
         :return:
         """
-        command = f"tRNAscan-SE -B -H -qQ --detail -X {x} -o /dev/null "
+        options = f"-B -H -qQ --detail -X {x} "
+
+        key = None
+        if use_cache:
+            key = self.cache.make_key("tRNAscan-SE",
+                                      get_tool_version("tRNAscan-SE"),
+                                      options, self.sequence)
+            output = self.cache.get(key)
+            if output is not None:
+                with open(self.output, "w") as fh:
+                    fh.write(output)
+                return
+
+        # Remove output from previous runs so that it can't be cached
+        # in place of this run's output.
+        if os.path.exists(self.output):
+            os.remove(self.output)
+
+        command = f"tRNAscan-SE {options}-o /dev/null "
         command += f"-f {self.output} {self.input}"
         Popen(shlex.split(command)).wait()
 
+        if key is not None and os.path.exists(self.output):
+            with open(self.output, "r") as fh:
+                self.cache.put(key, fh.read())
+
     def read_output(self):
         """
         Reads the Aragorn output file and joins the lines into a single
@@ -95,6 +95,23 @@ EMPTY_SET = {"",
 # Path to blastclust binary
 BLASTCLUST_PATH = Path("~/bin/blast-2.2.14/bin").expanduser()
 
+# Local directory to store cached results from external tools
+# (e.g. Aragorn and tRNAscan-SE), and the maximum size (in bytes)
+# the cache can grow to before the least recently used results are evicted.
+CACHE_DIR = Path("~/.pdm_utils/cache").expanduser()
+TOOL_CACHE_DIR = Path(CACHE_DIR, "tools")
+TOOL_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+# Local directory to store cached import evaluation results.
+EVAL_CACHE_DIR = Path(CACHE_DIR, "evaluations")
+EVAL_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+# Local directory to store a memory-mapped snapshot of genome sequences.
+SEQ_STORE_DIR = Path(CACHE_DIR, "sequences")
+
+# Local directory to store reflected database schemas.
+SCHEMA_CACHE_DIR = Path(CACHE_DIR, "schemas")
+
 
 # Set up dna and protein alphabets to verify sequence integrity
 DNA_ALPHABET = set(IUPAC.IUPACUnambiguousDNA.letters)
@@ -11,10 +11,20 @@ import sqlalchemy
 from pdm_utils.classes import cds, trna, tmrna
 from pdm_utils.classes import genome
 from pdm_utils.classes import genomepair
+from pdm_utils.classes.sequenceloader import SequenceLoader
 from pdm_utils.constants import constants
 from pdm_utils.functions import basic
 from pdm_utils.functions import mysqldb_basic
 
+# Maximum number of PhageIDs in each query when retrieving features
+# for several genomes.
+FEATURE_CHUNK_SIZE = 500
+
+# Number of genomes retrieved at a time when streaming genomes.
+GENOME_BATCH_SIZE = 100
+
+PHAGE_ID_QUERY = "SELECT PhageID FROM phage"
+
 def parse_phage_table_data(data_dict, trans_table=11, gnm_type=""):
     """Parse a MySQL database dictionary to create a Genome object.
 
@@ -394,23 +404,89 @@ def parse_feature_data(engine, ftr_type, column=None, phage_id_list=None,
                                               id_list=phage_id_list)
     ftrs = []
     for data_dict in result_list:
-        if ftr_type == "cds":
-            ftr = parse_gene_table_data(data_dict)
-        elif ftr_type == "trna":
-            ftr = parse_trna_table_data(data_dict)
-        elif ftr_type == "tmrna":
-            ftr = parse_tmrna_table_data(data_dict)
-        else:
-            # If the ftr_type is invalid, just take the data dictionary.
-            # Alternatively it could raise an error.
-            ftr = data_dict
+        ftr = parse_feature_table_data(data_dict, ftr_type)
         ftrs.append(ftr)
     return ftrs
 
 
+def parse_feature_table_data(data_dict, ftr_type):
+    """Parse a MySQL database dictionary to create a feature object.
+
+    :param data_dict:
+        Dictionary of data retrieved from the gene, trna, or tmrna table.
+    :type data_dict: dict
+    :param ftr_type:
+        Indicates the type of feature ('cds', 'trna', 'tmrna').
+    :type ftr_type: str
+    :returns:
+        A pdm_utils Cds, Trna, or Tmrna object, or the data dictionary
+        if the ftr_type is invalid.
+    :rtype: misc.
+    """
+    if ftr_type == "cds":
+        ftr = parse_gene_table_data(data_dict)
+    elif ftr_type == "trna":
+        ftr = parse_trna_table_data(data_dict)
+    elif ftr_type == "tmrna":
+        ftr = parse_tmrna_table_data(data_dict)
+    else:
+        # If the ftr_type is invalid, just take the data dictionary.
+        # Alternatively it could raise an error.
+        ftr = data_dict
+    return ftr
+
+
+def parse_feature_dict(engine, ftr_type, phage_id_list, query,
+                       chunk_size=FEATURE_CHUNK_SIZE):
+    """Returns features of several genomes grouped by PhageID.
+
+    Features are retrieved with one query for every 'chunk_size' PhageIDs,
+    instead of one query per genome.
+
+    :param engine:
+        This parameter is passed directly to the 'parse_feature_data' function.
+    :type engine: Engine
+    :param ftr_type:
+        This parameter is passed directly to the 'parse_feature_data' function.
+    :type ftr_type: str
+    :param phage_id_list: List of PhageIDs of the genomes.
+    :type phage_id_list: list
+    :param query:
+        This parameter is passed directly to the 'parse_feature_data' function.
+        If the query does not select the PhageID column, features are
+        retrieved separately for each genome.
+    :type query: str
+    :param chunk_size: Maximum number of PhageIDs in each query.
+    :type chunk_size: int
+    :returns:
+        Dictionary, where the key is the PhageID and the value is
+        the list of features, in the order they were retrieved.
+    :rtype: dict
+    """
+    COLUMN = "PhageID"
+    ftr_dict = {}
+    for x in range(0, len(phage_id_list), chunk_size):
+        chunk = phage_id_list[x:x + chunk_size]
+        result_list = mysqldb_basic.retrieve_data(engine, column=COLUMN,
+                                                  query=query, id_list=chunk)
+        if any(COLUMN not in data_dict.keys() for data_dict in result_list):
+            # Unable to group the features, so retrieve them
+            # for each genome separately.
+            for phage_id in chunk:
+                ftr_dict[phage_id] = parse_feature_data(
+                                        engine, ftr_type, column=COLUMN,
+                                        phage_id_list=[phage_id], query=query)
+            continue
+
+        for data_dict in result_list:
+            ftr = parse_feature_table_data(data_dict, ftr_type)
+            ftr_dict.setdefault(data_dict[COLUMN], []).append(ftr)
+    return ftr_dict
+
+
 def parse_genome_data(engine, phage_id_list=None, phage_query=None,
                       gene_query=None, trna_query=None, tmrna_query=None,
-                      gnm_type=""):
+                      gnm_type="", lazy_seq=False, seq_loader=None):
     """Returns a list of Genome objects containing data parsed from a MySQL
     database.
 
@@ -451,6 +527,18 @@ def parse_genome_data(engine, phage_id_list=None, phage_query=None,
     :type phage_id_list: list
     :param gnm_type: Identifier for the type of genome.
     :type gnm_type: str
+    :param lazy_seq:
+        Indicates whether genome sequences that are not selected by the
+        'phage_query' should be retrieved from the database the first time
+        they are accessed. Sequences are retrieved in batches with the
+        sequences of the following genomes in the list. The length and gc
+        attributes are only set from the Length and GC columns.
+    :type lazy_seq: bool
+    :param seq_loader:
+        Object used to retrieve sequences when 'lazy_seq' is True, such as
+        a SequenceStore. If None, sequences are retrieved from the database
+        using a SequenceLoader.
+    :type seq_loader: SequenceLoader
     :returns: A list of pdm_utils Genome objects.
     :rtype: list
     """
@@ -459,32 +547,39 @@ def parse_genome_data(engine, phage_id_list=None, phage_query=None,
     result_list1 = mysqldb_basic.retrieve_data(engine, column=COLUMN,
                                                id_list=phage_id_list,
                                                query=phage_query)
+    phage_ids = [data_dict[COLUMN] for data_dict in result_list1
+                 if data_dict.get(COLUMN) is not None]
+    if lazy_seq:
+        if seq_loader is None:
+            seq_loader = SequenceLoader(engine, phage_ids)
+
+    # Retrieve features for all genomes at once, instead of once per genome.
+    ftr_dicts = {}
+    for ftr_type, query in (("cds", gene_query), ("trna", trna_query),
+                            ("tmrna", tmrna_query)):
+        if query is not None:
+            ftr_dicts[ftr_type] = parse_feature_dict(engine, ftr_type,
+                                                     phage_ids, query)
+
     for data_dict in result_list1:
         gnm = parse_phage_table_data(data_dict, gnm_type=gnm_type)
+        if lazy_seq and "Sequence" not in data_dict.keys():
+            gnm.set_sequence_loader(seq_loader)
 
         if gene_query is not None:
-            cds_list = parse_feature_data(engine, "cds", column=COLUMN,
-                                          phage_id_list=[gnm.id],
-                                          query=gene_query)
-
+            cds_list = ftr_dicts["cds"].get(data_dict.get(COLUMN), [])
             for x in range(len(cds_list)):
                 cds_list[x].genome_length = gnm.length
             gnm.cds_features = cds_list
 
         if trna_query is not None:
-            trna_list = parse_feature_data(engine, "trna", column=COLUMN,
-                                          phage_id_list=[gnm.id],
-                                          query=trna_query)
-
+            trna_list = ftr_dicts["trna"].get(data_dict.get(COLUMN), [])
             for x in range(len(trna_list)):
                 trna_list[x].genome_length = gnm.length
             gnm.trna_features = trna_list
 
         if tmrna_query is not None:
-            tmrna_list = parse_feature_data(engine, "tmrna", column=COLUMN,
-                                          phage_id_list=[gnm.id],
-                                          query=tmrna_query)
-
+            tmrna_list = ftr_dicts["tmrna"].get(data_dict.get(COLUMN), [])
             for x in range(len(tmrna_list)):
                 tmrna_list[x].genome_length = gnm.length
             gnm.tmrna_features = tmrna_list
@@ -493,14 +588,75 @@ def parse_genome_data(engine, phage_id_list=None, phage_query=None,
     return genome_list
 
 
-def create_seq_set(engine):
+def iter_genome_data(engine, phage_id_list=None, phage_query=None,
+                     gene_query=None, trna_query=None, tmrna_query=None,
+                     gnm_type="", batch_size=GENOME_BATCH_SIZE):
+    """Yields Genome objects containing data parsed from a MySQL database
+    one at a time.
+
+    Genome and feature data are retrieved with parse_genome_data() for
+    'batch_size' genomes at a time, so only one batch of genomes is held in
+    memory and no connection is held open while genomes are consumed.
+    Genomes are yielded in order of PhageID. The parameters are the same
+    as for parse_genome_data().
+
+    :param engine: same as for parse_genome_data().
+    :type engine: Engine
+    :param phage_id_list: same as for parse_genome_data().
+    :type phage_id_list: list
+    :param phage_query: same as for parse_genome_data().
+    :type phage_query: str
+    :param gene_query: same as for parse_genome_data().
+    :type gene_query: str
+    :param trna_query: same as for parse_genome_data().
+    :type trna_query: str
+    :param tmrna_query: same as for parse_genome_data().
+    :type tmrna_query: str
+    :param gnm_type: same as for parse_genome_data().
+    :type gnm_type: str
+    :param batch_size: Number of genomes retrieved at a time.
+    :type batch_size: int
+    :returns: Generator of pdm_utils Genome objects.
+    :rtype: generator
+    """
+    if phage_id_list is None or len(phage_id_list) == 0:
+        phage_id_list = mysqldb_basic.query_set(engine, PHAGE_ID_QUERY)
+    phage_id_list = sorted(set(phage_id_list))
+
+    for x in range(0, len(phage_id_list), batch_size):
+        genome_list = parse_genome_data(
+                            engine,
+                            phage_id_list=phage_id_list[x:x + batch_size],
+                            phage_query=phage_query, gene_query=gene_query,
+                            trna_query=trna_query, tmrna_query=tmrna_query,
+                            gnm_type=gnm_type)
+        genome_list.sort(key=lambda gnm: gnm.id)
+        for gnm in genome_list:
+            yield gnm
+
+
+def create_seq_set(engine, seq_store=None):
     """Create set of genome sequences currently in a MySQL database.
 
     :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
     :type engine: Engine
+    :param seq_store:
+        Local snapshot of genome sequences. Sequences are retrieved from
+        the snapshot, which is first refreshed from the database if the
+        phage table has changed since it was written.
+    :type seq_store: SequenceStore
     :returns: A set of unique values from phage.Sequence.
     :rtype: set
     """
+    if seq_store is not None:
+        if not seq_store.is_current(engine):
+            seq_store.snapshot(engine)
+        result_set = set()
+        for phage_id in seq_store.get_phage_ids():
+            gnm_seq = seq_store.get_sequence(phage_id)
+            result_set.add(Seq(str(gnm_seq), IUPAC.ambiguous_dna))
+        return result_set
+
     query = "SELECT Sequence FROM phage"
 
     # Returns a list of items, where each item is a tuple of
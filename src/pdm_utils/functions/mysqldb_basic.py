@@ -1,9 +1,15 @@
 """Basic functions to interact with MySQL and manage databases."""
 
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 
+from sqlalchemy.exc import DBAPIError
+
 from pdm_utils.functions import basic
 
+# Number of tables copied concurrently by copy_db_native().
+COPY_THREADS = 4
+
 def drop_db(engine, database):
     """Delete a database.
 
@@ -90,9 +96,13 @@ def install_db(engine, schema_filepath):
     return result
 
 
-def copy_db(engine, new_database):
+def copy_db(engine, new_database, native=True, threads=COPY_THREADS):
     """Copies a database.
 
+    By default, tables are copied within the MySQL server with
+    copy_db_native(). If the native copy is not selected or fails,
+    the database is copied by piping mysqldump output into mysql.
+
     :param engine:
         SQLAlchemy Engine object able to connect to a MySQL database, which
         contains the name of the database that will be copied into
@@ -100,6 +110,10 @@ def copy_db(engine, new_database):
     :type engine: Engine
     :param new_database: Name of the new copied database.
     :type new_database: str
+    :param native: Indicates whether to copy tables within the server.
+    :type native: bool
+    :param threads: Number of tables copied concurrently in a native copy.
+    :type threads: int
     :returns: Indicates if copy was successful (0) or failed (1).
     :rtype: int
     """
@@ -112,7 +126,12 @@ def copy_db(engine, new_database):
             print(f"Unable to copy {engine.url.database} to "
                   f"{new_database} since {new_database} does not exist.")
             result = 1
+        elif native and copy_db_native(engine, new_database,
+                                       threads=threads) == 0:
+            result = 0
         else:
+            if native:
+                print("Falling back to mysqldump to copy the database.")
             #mysqldump -u root -pPWD database1 | mysql -u root -pPWD database2
             cmd1 = mysqldump_command(engine.url.username,
                                      engine.url.password,
@@ -133,6 +152,113 @@ def copy_db(engine, new_database):
 
     return result
 
+def copy_db_native(engine, new_database, threads=COPY_THREADS):
+    """Copies a database within the MySQL server.
+
+    The table definitions are copied into the new database, and tables are
+    then copied concurrently over separate connections using
+    INSERT ... SELECT statements, with unique and foreign key checks
+    disabled during the load. Row counts of the new tables are validated
+    against the copied row counts.
+
+    :param engine:
+        SQLAlchemy Engine object able to connect to a MySQL database, which
+        contains the name of the database that will be copied into
+        the new database.
+    :type engine: Engine
+    :param new_database: Name of the existing database.
+    :type new_database: str
+    :param threads: Number of tables copied concurrently.
+    :type threads: int
+    :returns: Indicates if copy was successful (0) or failed (1).
+    :rtype: int
+    """
+    database = engine.url.database
+    print("Copying database tables...")
+    try:
+        tables = sorted(copy_schema(engine, new_database))
+
+        def copy_table(table):
+            new_table = f"`{new_database}`.`{table}`"
+            with engine.connect() as connection:
+                connection.execute("SET FOREIGN_KEY_CHECKS = 0")
+                connection.execute("SET UNIQUE_CHECKS = 0")
+                try:
+                    result = connection.execute(
+                                f"INSERT INTO {new_table} "
+                                f"SELECT * FROM `{database}`.`{table}`")
+                    count = result.rowcount
+                finally:
+                    connection.execute("SET UNIQUE_CHECKS = 1")
+                    connection.execute("SET FOREIGN_KEY_CHECKS = 1")
+            return count
+
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+            counts = list(executor.map(copy_table, tables))
+
+        errors = []
+        for table in tables:
+            count = scalar(engine, f"SELECT COUNT(*) FROM "
+                                   f"`{database}`.`{table}`")
+            new_count = scalar(engine, f"SELECT COUNT(*) FROM "
+                                       f"`{new_database}`.`{table}`")
+            if new_count != count:
+                errors.append(table)
+    except DBAPIError as err:
+        print(f"Unable to copy {engine.url.database} to "
+              f"{new_database} within MySQL due to copying error:")
+        print(err.orig)
+        return 1
+
+    if len(errors) > 0:
+        print(f"Unable to copy {engine.url.database} to {new_database} "
+              "since row counts differ for the following tables: "
+              f"{', '.join(errors)}.")
+        return 1
+
+    print(f"Copy complete: {sum(counts)} rows copied "
+          f"in {len(tables)} tables.")
+    return 0
+
+def copy_schema(engine, new_database):
+    """Copies the table definitions of a database into another database
+    without copying any data.
+
+    As with mysqldump, tables in the new database with the same names as
+    copied tables are replaced.
+
+    :param engine:
+        SQLAlchemy Engine object able to connect to a MySQL database, which
+        contains the name of the database whose tables will be copied.
+    :type engine: Engine
+    :param new_database: Name of the existing database.
+    :type new_database: str
+    :returns: Names of the tables created.
+    :rtype: set
+    """
+    query = ("SELECT table_name FROM information_schema.tables "
+             f"WHERE table_schema = '{engine.url.database}' "
+             "AND table_type = 'BASE TABLE'")
+    tables = query_set(engine, query)
+    with engine.connect() as connection:
+        # Table definitions reference other tables without a database name,
+        # so they are created from within the new database, and foreign
+        # keys are not checked since tables are created in any order.
+        connection.execute("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            for table in tables:
+                result = connection.execute(
+                            f"SHOW CREATE TABLE "
+                            f"`{engine.url.database}`.`{table}`").fetchone()
+                connection.execute(f"USE `{new_database}`")
+                connection.execute(f"DROP TABLE IF EXISTS `{table}`")
+                connection.execute(result[1])
+                connection.execute(f"USE `{engine.url.database}`")
+        finally:
+            connection.execute(f"USE `{engine.url.database}`")
+            connection.execute("SET FOREIGN_KEY_CHECKS = 1")
+    return tables
+
 # TODO test.
 def pipe_commands(command1, command2):
     """Pipe one command into the other."""
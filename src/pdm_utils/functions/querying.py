@@ -1,7 +1,12 @@
 import re
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextlib import ExitStack
 from datetime import datetime
 from decimal import Decimal
+from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 from networkx import Graph
 from networkx import shortest_path
@@ -9,8 +14,10 @@ from sqlalchemy import and_
 from sqlalchemy import Column
 from sqlalchemy import join
 from sqlalchemy import MetaData
+from sqlalchemy import Index
 from sqlalchemy import select
 from sqlalchemy import Table
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.declarative.api import DeclarativeMeta
 from sqlalchemy.sql import distinct
 from sqlalchemy.sql import func
@@ -29,6 +36,20 @@ from pdm_utils.functions import parsing
 COLUMN_TYPES = [Column, Table, functions.count, BinaryExpression, 
                 UnaryExpression, Label, DeclarativeMeta]
 
+#Number of values above which values are loaded into a temporary table
+#instead of being split into IN clause chunks. None disables temporary tables.
+TEMP_TABLE_THRESHOLD = 50000
+TEMP_TABLE_PREFIX = "pdm_utils_values"
+
+#Number of threads used to execute IN clause chunks of a query concurrently.
+#Each thread draws a connection from the engine's connection pool.
+CHUNK_THREADS = 1
+MAX_CHUNK_THREADS = 8
+
+#Joined tables built by build_fromclause(), stored for each graph by
+#the set of joined tables and the center table.
+JOIN_PLANS = WeakKeyDictionary()
+
 #-----------------------------------------------------------------------------
 #SQLALCHEMY OBJECT RETRIEVAL
 #Functions that functionalize retrieval of SqlAlchemy objects.
@@ -120,11 +141,32 @@ def build_fromclause(db_graph, columns):
     :rtype: Table
     """
     table_list = get_table_list(columns)
-    table_pathing = get_table_pathing(db_graph, table_list)
-    joined_table = join_pathed_tables(db_graph, table_pathing)
+
+    #The schema graph does not change, so joins are only planned once
+    #for each set of tables and center table.
+    join_plans = JOIN_PLANS.setdefault(db_graph, {})
+    plan_key = (frozenset(table_list), table_list[0])
+
+    joined_table = join_plans.get(plan_key)
+    if joined_table is None:
+        table_pathing = get_table_pathing(db_graph, table_list)
+        joined_table = join_pathed_tables(db_graph, table_pathing)
+        join_plans[plan_key] = joined_table
 
     return joined_table
 
+def clear_join_plans(db_graph=None):
+    """Clear joined tables stored by build_fromclause().
+
+    :param db_graph: SQLAlchemy structured NetworkX Graph object.
+                     If None, joined tables are cleared for all graphs.
+    :type db_graph: Graph
+    """
+    if db_graph is None:
+        JOIN_PLANS.clear()
+    else:
+        JOIN_PLANS.pop(db_graph, None)
+
 def build_onclause(db_graph, source_table, adjacent_table):
     """Creates a SQLAlchemy BinaryExpression object for a MySQL ON clause 
        expression
@@ -551,12 +593,30 @@ def append_order_by_clauses(executable, order_by_clauses):
 
     return executable
 
+def get_collation_key(column, value):
+    """Normalize a value as values of a Column are compared by MySQL.
+
+    Text columns use the database's case-insensitive collation, under which
+    values are also compared ignoring trailing spaces, while binary columns
+    are compared byte by byte.
+
+    :param column: SQLAlchemy Column object the value belongs to.
+    :type column: Column
+    :param value: Value retrieved from or conditioned against the Column.
+    :returns: Value that is equal for values MySQL considers equal.
+    """
+    if isinstance(value, str) and column.type.python_type is not bytes:
+        return value.rstrip(" ").casefold()
+
+    return value
+
 #-----------------------------------------------------------------------------
 #SQLALCHEMY EXECUTE QUERY FUNCTIONS
 #Functions that execute SqlAlchemy select statements and handle outputs.
 #-----------------------------------------------------------------------------
 def execute(engine, executable, in_column=None, values=[], limit=8000, 
-                                                           return_dict=True):
+                                                           return_dict=True,
+                                                           threads=None):
     """Use SQLAlchemy Engine to execute a MySQL query.
     
     :param engine: SQLAlchemy Engine object used for executing queries.
@@ -566,6 +626,10 @@ def execute(engine, executable, in_column=None, values=[], limit=8000,
     :type executable: str
     :param return_dict: Toggle whether execute returns dict or tuple.
     :type return_dict: Boolean
+    :param threads:
+        Number of threads used to execute IN clause chunks,
+        defaulting to CHUNK_THREADS.
+    :type threads: int
     :returns: Results from execution of given MySQL query.
     :rtype: list[dict]
     :rtype: list[tuple]
@@ -577,7 +641,8 @@ def execute(engine, executable, in_column=None, values=[], limit=8000,
         
         results = execute_value_subqueries(engine, executable,
                                            in_column, values, 
-                                           return_dict=return_dict, limit=limit)
+                                           return_dict=return_dict, limit=limit,
+                                           threads=threads)
                                            
     else:
         proxy = engine.execute(executable)
@@ -593,7 +658,8 @@ def execute(engine, executable, in_column=None, values=[], limit=8000,
 
     return results
     
-def first_column(engine, executable, in_column=None, values=[], limit=8000):
+def first_column(engine, executable, in_column=None, values=[], limit=8000,
+                                                                threads=None):
     """Use SQLAlchemy Engine to execute and return the first column of fields.
         
     :param engine: SQLAlchemy Engine object used for executing queries.
@@ -601,6 +667,10 @@ def first_column(engine, executable, in_column=None, values=[], limit=8000):
     :param executable: Input an executable MySQL query.
     :type executable: Select
     :type executable: str
+    :param threads:
+        Number of threads used to execute IN clause chunks,
+        defaulting to CHUNK_THREADS.
+    :type threads: int
     :returns: A column for a set of MySQL values.
     :rtype: list[str]
     """     
@@ -611,7 +681,7 @@ def first_column(engine, executable, in_column=None, values=[], limit=8000):
 
         values = first_column_value_subqueries(engine, executable,
                                                in_column, values,
-                                               limit=limit)
+                                               limit=limit, threads=threads)
     else:
         proxy = engine.execute(executable)
         results = proxy.fetchall()
@@ -624,7 +694,9 @@ def first_column(engine, executable, in_column=None, values=[], limit=8000):
 
 def execute_value_subqueries(engine, executable, in_column, source_values,
                                                             return_dict=True,
-                                                            limit=8000):
+                                                            limit=8000,
+                                                            threshold=None,
+                                                            threads=None):
     """Query with a conditional on a set of values using subqueries.
 
     :param engine: SQLAlchemy Engine object used for executing queries.
@@ -640,6 +712,14 @@ def execute_value_subqueries(engine, executable, in_column, source_values,
     :type return_dict: Boolean
     :param limit: SQLAlchemy IN clause query length limiter.
     :type limit: int
+    :param threshold:
+        Number of values above which values are joined from a temporary
+        table, defaulting to TEMP_TABLE_THRESHOLD.
+    :type threshold: int
+    :param threads:
+        Number of threads used to execute IN clause chunks,
+        defaulting to CHUNK_THREADS.
+    :type threads: int
     :returns: List of grouped data for each value constraint.
     :rtype: list
     """
@@ -657,15 +737,16 @@ def execute_value_subqueries(engine, executable, in_column, source_values,
     if in_column.type.python_type == bytes:
         source_values = parsing.convert_to_encoded(source_values)
 
-    chunked_values = [source_values[i*limit:(i+1)*limit]\
-                for i in range((len(source_values) + limit - 1) // limit)]
-
-    for value_chunk in chunked_values:
-        subquery = executable.where(in_column.in_(value_chunk))
-        
-        proxy = engine.execute(subquery)
-        results = proxy.fetchall()
+    if use_temp_table(source_values, threshold=threshold):
+        results_list = [execute_temp_table_subquery(engine, executable,
+                                                    in_column, source_values,
+                                                    limit=limit)]
+    else:
+        subqueries = build_chunk_subqueries(executable, in_column,
+                                            source_values, limit)
+        results_list = execute_chunks(engine, subqueries, threads=threads)
 
+    for results in results_list:
         for result in results:
             if return_dict:
                 result = dict(result)
@@ -675,7 +756,9 @@ def execute_value_subqueries(engine, executable, in_column, source_values,
     return values
 
 def first_column_value_subqueries(engine, executable, in_column, source_values, 
-                                                                 limit=8000):
+                                                                 limit=8000,
+                                                                 threshold=None,
+                                                                 threads=None):
     """Query with a conditional on a set of values using subqueries.
 
     :param engine: SQLAlchemy Engine object used for executing queries.
@@ -691,6 +774,14 @@ def first_column_value_subqueries(engine, executable, in_column, source_values,
     :type return_dict: Boolean
     :param limit: SQLAlchemy IN clause query length limiter.
     :type limit: int
+    :param threshold:
+        Number of values above which values are joined from a temporary
+        table, defaulting to TEMP_TABLE_THRESHOLD.
+    :type threshold: int
+    :param threads:
+        Number of threads used to execute IN clause chunks,
+        defaulting to CHUNK_THREADS.
+    :type threads: int
     :returns: Distinct values fetched from value constraints.
     :rtype: list
     """
@@ -708,21 +799,274 @@ def first_column_value_subqueries(engine, executable, in_column, source_values,
     if in_column.type.python_type == bytes:
         source_values = parsing.convert_to_encoded(source_values)
 
-    chunked_values = [source_values[i*limit:(i+1)*limit]\
-                for i in range((len(source_values) + limit - 1) // limit)]  
-
-    for value_chunk in chunked_values: 
-        subquery = executable.where(in_column.in_(value_chunk))
-
-        proxy = engine.execute(subquery)
-        results = proxy.fetchall()
-
+    if use_temp_table(source_values, threshold=threshold):
+        results = execute_temp_table_subquery(engine, executable, in_column,
+                                              source_values, limit=limit)
         for result in results:
-            values.append(result[0]) 
+            values.append(result[0])
+    else:
+        subqueries = build_chunk_subqueries(executable, in_column,
+                                            source_values, limit)
+        for results in execute_chunks(engine, subqueries, threads=threads):
+            for result in results:
+                values.append(result[0])
 
     values = list(OrderedDict.fromkeys(values))
     return values
 
+def get_chunk_threads(engine, threads, chunks):
+    """Determine the number of threads used to execute IN clause chunks.
+
+    :param engine: SQLAlchemy Engine object used for executing queries.
+    :type engine: Engine
+    :param threads: Number of threads requested, defaulting to CHUNK_THREADS.
+    :type threads: int
+    :param chunks: Number of chunks to be executed.
+    :type chunks: int
+    :returns: Number of threads, capped by MAX_CHUNK_THREADS, the number of
+              chunks and the size of the engine's connection pool.
+    :rtype: int
+    """
+    if threads is None:
+        threads = CHUNK_THREADS
+
+    threads = min(threads, MAX_CHUNK_THREADS, chunks)
+
+    if threads <= 1:
+        return 1
+
+    #Threads beyond the pool size would only wait for pooled connections.
+    pool_size = getattr(engine.pool, "size", None)
+    if callable(pool_size):
+        threads = min(threads, pool_size())
+
+    return max(threads, 1)
+
+def execute_chunks(engine, subqueries, threads=None):
+    """Execute the IN clause chunks of a query, optionally concurrently.
+
+    :param engine: SQLAlchemy Engine object used for executing queries.
+    :type engine: Engine
+    :param subqueries: Executable MySQL queries for each chunk of values.
+    :type subqueries: list[Select]
+    :param threads: Number of threads requested, defaulting to CHUNK_THREADS.
+    :type threads: int
+    :returns: Results from execution of each query, in order of the queries.
+    :rtype: list[list[RowProxy]]
+    """
+    def fetch(subquery):
+        return engine.execute(subquery).fetchall()
+
+    threads = get_chunk_threads(engine, threads, len(subqueries))
+    if threads == 1:
+        return [fetch(subquery) for subquery in subqueries]
+
+    #Executor.map() returns results in the order of the queries.
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(fetch, subqueries))
+
+def use_temp_table(source_values, threshold=None):
+    """Determine whether to condition a query on values in a temporary table.
+
+    :param source_values: Values from specified MySQL column.
+    :type source_values: list
+    :param threshold:
+        Number of values above which a temporary table is used,
+        defaulting to TEMP_TABLE_THRESHOLD.
+    :type threshold: int
+    :returns: Indicates whether to use a temporary table.
+    :rtype: bool
+    """
+    if threshold is None:
+        threshold = TEMP_TABLE_THRESHOLD
+
+    if threshold is None:
+        return False
+
+    return len(source_values) > threshold
+
+def build_chunk_subqueries(executable, in_column, source_values, limit):
+    """Condition a query on chunks of values with IN clauses.
+
+    :param executable: Input a executable MySQL query.
+    :type executable: Select
+    :param in_column: SQLAlchemy Column object.
+    :type in_column: Column
+    :param source_values: Values from specified MySQL column.
+    :type source_values: list
+    :param limit: SQLAlchemy IN clause query length limiter.
+    :type limit: int
+    :returns: Executable MySQL queries for each chunk of values.
+    :rtype: list[Select]
+    """
+    return [executable.where(in_column.in_(source_values[i:i+limit]))
+                                for i in range(0, len(source_values), limit)]
+
+@contextmanager
+def value_subqueries(connection, executable, in_column, source_values,
+                                                        limit=8000,
+                                                        threshold=None):
+    """Condition a query on a set of values for the duration of a block.
+
+    Above the threshold, the values are bulk-loaded into a uniquely named,
+    session-scoped temporary table, which is joined to the query once and
+    dropped when the block exits. If the number of values is below the
+    threshold or the temporary table cannot be created, the values are
+    split into IN clause chunks instead.
+
+    :param connection: SQLAlchemy Connection used for the whole block.
+    :type connection: Connection
+    :param executable: Input a executable MySQL query.
+    :type executable: Select
+    :param in_column: SQLAlchemy Column object.
+    :type in_column: Column
+    :param source_values: Values from specified MySQL column, encoded
+                          if the column stores bytes.
+    :type source_values: list
+    :param limit: SQLAlchemy IN clause query length limiter.
+    :type limit: int
+    :param threshold:
+        Number of values above which values are joined from a temporary
+        table, defaulting to TEMP_TABLE_THRESHOLD.
+    :type threshold: int
+    :returns: Executable MySQL queries to be executed on the connection.
+    :rtype: list[Select]
+    """
+    temp_table = None
+    if use_temp_table(source_values, threshold=threshold):
+        #Unique names keep the tables of queries sharing a connection apart.
+        name = f"{TEMP_TABLE_PREFIX}_{uuid4().hex}"
+        temp_table = Table(name, MetaData(),
+                           Column("value", in_column.type),
+                           prefixes=["TEMPORARY"])
+        #BLOB and TEXT columns cannot be indexed without a prefix length.
+        if in_column.type.python_type != bytes:
+            Index(f"{name}_index", temp_table.c.value)
+
+        #Users without the CREATE TEMPORARY TABLES privilege
+        #fall back to IN clause chunks.
+        try:
+            temp_table.create(connection)
+        except DBAPIError:
+            temp_table = None
+
+    if temp_table is None:
+        yield build_chunk_subqueries(executable, in_column, source_values,
+                                     limit)
+        return
+
+    try:
+        connection.execute(temp_table.insert(),
+                           [{"value" : value} for value in source_values])
+        yield [executable.where(in_column.in_(
+                                        select([temp_table.c.value])))]
+    finally:
+        temp_table.drop(connection)
+
+def execute_temp_table_subquery(engine, executable, in_column, source_values,
+                                                               limit=8000):
+    """Query with a conditional on a set of values in a temporary table.
+
+    :param engine: SQLAlchemy Engine object used for executing queries.
+    :type engine: Engine
+    :param executable: Input a executable MySQL query.
+    :type executable: Select
+    :param in_column: SQLAlchemy Column object.
+    :type in_column: Column
+    :param source_values: Values from specified MySQL column, encoded
+                          if the column stores bytes.
+    :type source_values: list
+    :param limit:
+        SQLAlchemy IN clause query length limiter, used if the temporary
+        table cannot be created.
+    :type limit: int
+    :returns: Results from execution of the query.
+    :rtype: list[RowProxy]
+    """
+    results = []
+    #Temporary tables are only visible to the connection that created them.
+    with engine.connect() as connection:
+        with value_subqueries(connection, executable, in_column,
+                              source_values, limit=limit,
+                              threshold=0) as subqueries:
+            for subquery in subqueries:
+                results.extend(connection.execute(subquery).fetchall())
+
+    return results
+
+def iter_execute(engine, executable, in_column=None, values=[], limit=8000,
+                                                     batch_size=1000,
+                                                     return_dict=True,
+                                                     threshold=None):
+    """Use SQLAlchemy Engine to execute a MySQL query and stream the results.
+
+    Rows are fetched from a server-side cursor and yielded in batches,
+    so that only a batch of rows is held in memory at a time.
+
+    :param engine: SQLAlchemy Engine object used for executing queries.
+    :type engine: Engine
+    :param executable: Input a executable MySQL query.
+    :type executable: Select
+    :param in_column: SQLAlchemy Column object.
+    :type in_column: Column
+    :param values: Values from specified MySQL column.
+    :type values: list[str]
+    :param limit: SQLAlchemy IN clause query length limiter.
+    :type limit: int
+    :param batch_size: Maximum number of rows yielded at a time.
+    :type batch_size: int
+    :param return_dict: Toggle whether to yield data as dictionaries.
+    :type return_dict: Boolean
+    :param threshold:
+        Number of values above which values are joined from a temporary
+        table, defaulting to TEMP_TABLE_THRESHOLD.
+    :type threshold: int
+    :returns: Batches of results from execution of given MySQL query.
+    :rtype: Generator[list[dict]]
+    :rtype: Generator[list[RowProxy]]
+    """
+    if values:
+        if not isinstance(in_column, Column):
+            raise ValueError("Inputted column to conditional values against "
+                             "is not a SqlAlchemy Column."
+                            f"Object is instead type {type(in_column)}.")
+
+        if not executable.is_derived_from(in_column.table):
+            raise ValueError("Inputted column to conditional values against "
+                             "must be a column from the table(s) joined in "
+                             "the SQLAlchemy select.")
+
+        if in_column.type.python_type == bytes:
+            values = parsing.convert_to_encoded(values)
+
+    #Temporary tables are only visible to the connection that created them.
+    with engine.connect() as connection, ExitStack() as stack:
+        subqueries = [executable]
+        if values:
+            subqueries = stack.enter_context(value_subqueries(
+                                                connection, executable,
+                                                in_column, values,
+                                                limit=limit,
+                                                threshold=threshold))
+
+        streaming = connection.execution_options(stream_results=True)
+        for subquery in subqueries:
+            proxy = streaming.execute(subquery)
+            try:
+                while True:
+                    results = proxy.fetchmany(batch_size)
+                    if not results:
+                        break
+
+                    if return_dict:
+                        results = [dict(result) for result in results]
+
+                    yield results
+            #Unread rows of an unbuffered cursor must be discarded
+            #before the connection is used again.
+            finally:
+                proxy.close()
+
 def query(session, db_graph, table_map, where=None):
     """Use SQLAlchemy session to retrieve ORM objects from a mapped object.
 
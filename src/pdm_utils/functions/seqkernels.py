@@ -0,0 +1,339 @@
+"""Fast nucleotide and amino acid sequence kernels.
+
+Sequences are converted to bytes once, and alphabet validation is performed
+with bytes.translate() while symbol counting (GC content, ambiguous bases)
+and CDS translation are performed with NumPy lookup tables. These should not
+require import of other modules in this package to prevent circular imports.
+"""
+
+import functools
+
+from Bio import Alphabet
+from Bio.Alphabet import IUPAC
+from Bio.Data import CodonTable
+from Bio.Seq import Seq
+import numpy as np
+
+# Symbols counted towards GC content (consistent with Bio.SeqUtils.GC).
+GC_SYMBOLS = "GCSgcs"
+
+# IUPAC ambiguous nucleotide symbols.
+AMBIGUOUS_DNA_SYMBOLS = "RYSWKMBDHVNryswkmbdhvn"
+
+# Nucleotides that can be translated with a codon lookup table.
+# Sequences containing other symbols are translated by Biopython.
+CODON_NUCLEOTIDES = "ACGT"
+
+# Codes indicating why a CDS nucleotide sequence could not be translated.
+TRANSLATION_FAILURES = {
+    "bad_start": "The first codon is not a start codon.",
+    "bad_length": "The sequence length is not a multiple of three.",
+    "bad_stop": "The final codon is not a stop codon.",
+    "internal_stop": "There is an extra in-frame stop codon.",
+    "invalid": "The sequence could not be translated."
+    }
+
+
+def to_bytes(seq):
+    """Convert a sequence to an ASCII bytes object.
+
+    :param seq: Sequence to be converted.
+    :type seq: str, Seq, bytes
+    :returns:
+        ASCII-encoded sequence, or None if the sequence contains
+        non-ASCII characters.
+    :rtype: bytes
+    """
+    if isinstance(seq, (bytes, bytearray)):
+        return bytes(seq)
+    try:
+        return str(seq).encode("ascii")
+    except UnicodeEncodeError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_delete_bytes(alphabet):
+    """Get the bytes to delete from a sequence to retain invalid symbols."""
+    symbols = [symbol for symbol in alphabet
+               if isinstance(symbol, str) and len(symbol) == 1
+               and ord(symbol) < 128]
+    return "".join(sorted(symbols)).encode("ascii")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_lookup_table(symbols):
+    """Get a boolean lookup table indexed by byte value."""
+    table = np.zeros(256, dtype=bool)
+    for code in symbols.encode("ascii"):
+        table[code] = True
+    return table
+
+
+def get_invalid_symbols(seq, alphabet):
+    """Identify symbols in a sequence that are not in a reference alphabet.
+
+    The result is identical to set(seq) - alphabet.
+
+    :param seq: Sequence to be checked.
+    :type seq: str, Seq
+    :param alphabet: Set of valid symbols.
+    :type alphabet: set
+    :returns: Set of symbols that are not present in the alphabet.
+    :rtype: set
+    """
+    data = to_bytes(seq)
+    if data is None:
+        return set(str(seq)) - set(alphabet)
+    delete = _get_delete_bytes(frozenset(alphabet))
+    invalid = data.translate(None, delete)
+    return set(invalid.decode("ascii"))
+
+
+def count_symbols(seq):
+    """Count the occurrence of every byte value in a sequence.
+
+    :param seq: Sequence to be counted.
+    :type seq: str, Seq, bytes
+    :returns: Array of 256 counts indexed by byte value.
+    :rtype: numpy.ndarray
+    """
+    data = to_bytes(seq)
+    if data is None:
+        data = str(seq).encode("utf-8")
+    return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+
+
+def count_from_table(counts, symbols):
+    """Sum symbol counts using a lookup table.
+
+    :param counts: Array of 256 counts generated by count_symbols().
+    :type counts: numpy.ndarray
+    :param symbols: String of ASCII symbols to be summed.
+    :type symbols: str
+    :returns: Total number of occurrences of the symbols.
+    :rtype: int
+    """
+    return int(counts[_get_lookup_table(symbols)].sum())
+
+
+def get_gc_content(seq):
+    """Compute the GC content of a nucleotide sequence.
+
+    The result is identical to Bio.SeqUtils.GC().
+
+    :param seq: Nucleotide sequence.
+    :type seq: str, Seq
+    :returns: Percentage (between 0 and 100) of G, C, and S symbols.
+    :rtype: float
+    """
+    return get_sequence_stats(seq)["gc"]
+
+
+def get_ambiguous_count(seq):
+    """Count the number of IUPAC ambiguous nucleotides in a sequence.
+
+    :param seq: Nucleotide sequence.
+    :type seq: str, Seq
+    :returns: Number of ambiguous nucleotides.
+    :rtype: int
+    """
+    return get_sequence_stats(seq)["ambiguous"]
+
+
+def get_sequence_stats(seq):
+    """Compute the length, GC content, and ambiguous nucleotide count
+    of a nucleotide sequence in a single pass.
+
+    :param seq: Nucleotide sequence.
+    :type seq: str, Seq
+    :returns:
+        Dictionary with 'length', 'gc' (percentage, identical to
+        Bio.SeqUtils.GC()) and 'ambiguous' keys.
+    :rtype: dict
+    """
+    length = len(seq)
+    if length == 0:
+        return {"length": 0, "gc": 0.0, "ambiguous": 0}
+    counts = count_symbols(seq)
+    gc = count_from_table(counts, GC_SYMBOLS)
+    ambiguous = count_from_table(counts, AMBIGUOUS_DNA_SYMBOLS)
+    return {"length": length,
+            "gc": gc * 100.0 / length,
+            "ambiguous": ambiguous}
+
+
+
+@functools.lru_cache(maxsize=None)
+def get_codon_lookup(table):
+    """Get lookup tables to translate codons for a translation table.
+
+    Codons are indexed as 16 * first + 4 * second + third nucleotide,
+    in which nucleotides are numbered in the order 'ACGT'.
+
+    :param table: Translation table id.
+    :type table: int
+    :returns:
+        Tuple of a uint8 array of 64 amino acids (stop codons are '*') and
+        a boolean array of 64 start codon flags, or None if the table
+        is not valid or contains codons that code for both an amino acid
+        and a stop.
+    :rtype: tuple
+    """
+    try:
+        codon_table = CodonTable.unambiguous_dna_by_id[int(table)]
+    except (KeyError, TypeError, ValueError):
+        return None
+    forward = codon_table.forward_table
+    stops = codon_table.stop_codons
+    if len(forward) + len(stops) != 64:
+        return None
+    amino_acids = np.full(64, ord("*"), dtype=np.uint8)
+    for codon, amino_acid in forward.items():
+        amino_acids[_get_codon_index(codon)] = ord(amino_acid)
+    starts = np.zeros(64, dtype=bool)
+    for codon in codon_table.start_codons:
+        starts[_get_codon_index(codon)] = True
+    return (amino_acids, starts)
+
+
+def _get_codon_index(codon):
+    """Get the index of an unambiguous codon in a codon lookup table."""
+    index = 0
+    for nucleotide in codon:
+        index = index * 4 + CODON_NUCLEOTIDES.index(nucleotide)
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _get_nucleotide_indices():
+    """Get a lookup table of nucleotide indices by byte value."""
+    table = np.zeros(256, dtype=np.uint8)
+    for index in range(len(CODON_NUCLEOTIDES)):
+        table[ord(CODON_NUCLEOTIDES[index])] = index
+    return table
+
+
+def _get_protein_alphabet(seq, table):
+    """Get the alphabet Biopython assigns to a translation, or None if
+    the sequence should be translated by Biopython."""
+    alphabet = getattr(seq, "alphabet", None)
+    if alphabet is None:
+        return CodonTable.ambiguous_generic_by_id[table].protein_alphabet
+    elif alphabet == IUPAC.unambiguous_dna:
+        return CodonTable.unambiguous_dna_by_id[table].protein_alphabet
+    elif (alphabet == IUPAC.unambiguous_rna or
+            hasattr(alphabet, "gap_char") or
+            isinstance(Alphabet._get_base_alphabet(alphabet),
+                       Alphabet.ProteinAlphabet)):
+        return None
+    else:
+        return CodonTable.ambiguous_generic_by_id[table].protein_alphabet
+
+
+def _translate_with_biopython(seq, table):
+    """Translate a CDS sequence with Biopython and convert errors to
+    translation failure codes."""
+    if not isinstance(seq, Seq):
+        seq = Seq(str(seq))
+    try:
+        translation = seq.translate(table=table, cds=True)
+    except CodonTable.TranslationError as exc:
+        message = str(exc)
+        if message.startswith("First codon"):
+            code = "bad_start"
+        elif message.endswith("multiple of three"):
+            code = "bad_length"
+        elif message.startswith("Final codon"):
+            code = "bad_stop"
+        elif message.startswith("Extra in frame stop"):
+            code = "internal_stop"
+        else:
+            code = "invalid"
+        return (Seq("", IUPAC.protein), code)
+    except Exception:
+        return (Seq("", IUPAC.protein), "invalid")
+    return (translation, None)
+
+
+def translate_cds(seq, table):
+    """Translate a CDS nucleotide sequence.
+
+    :param seq: CDS nucleotide sequence.
+    :type seq: Seq
+    :param table: Translation table id.
+    :type table: int
+    :returns:
+        Tuple of the amino acid sequence and a TRANSLATION_FAILURES code,
+        as described for translate_cds_seqs().
+    :rtype: tuple
+    """
+    return translate_cds_seqs([seq], [table])[0]
+
+
+def translate_cds_seqs(seqs, tables):
+    """Translate a batch of CDS nucleotide sequences.
+
+    The results are identical to Biopython Seq.translate(cds=True):
+    the sequence must begin with a start codon (translated as methionine),
+    end with a stop codon (which is not translated), contain no other
+    in-frame stop codon, and have a length divisible by 3.
+    Sequences that only contain 'ACGT' are translated together with a
+    codon lookup table. Sequences with ambiguous nucleotides, or that use
+    translation tables with codons that code for both an amino acid and a
+    stop, are translated by Biopython.
+
+    :param seqs: List of CDS nucleotide sequences.
+    :type seqs: list
+    :param tables: List of translation table ids, one for each sequence.
+    :type tables: list
+    :returns:
+        List of (translation, code) tuples, in which translation is an
+        amino acid Seq (empty if it could not be translated) and code is
+        None or a key in TRANSLATION_FAILURES.
+    :rtype: list
+    """
+    results = [None] * len(seqs)
+
+    # Group sequences that can be translated with a codon lookup table.
+    batches = {}
+    for index in range(len(seqs)):
+        seq = seqs[index]
+        table = tables[index]
+        lookup = get_codon_lookup(table)
+        data = to_bytes(seq)
+        if lookup is not None and data is not None:
+            data = data.upper()
+            protein_alphabet = _get_protein_alphabet(seq, table)
+            if (protein_alphabet is not None and len(data) >= 3 and
+                    len(data) % 3 == 0 and
+                    len(data.translate(None, b"ACGT")) == 0):
+                batch = batches.setdefault(table, [])
+                batch.append((index, data, protein_alphabet))
+                continue
+        results[index] = _translate_with_biopython(seq, table)
+
+    for table, batch in batches.items():
+        amino_acids, starts = get_codon_lookup(table)
+        data = b"".join([item[1] for item in batch])
+        nts = _get_nucleotide_indices()[np.frombuffer(data, dtype=np.uint8)]
+        codons = (nts[0::3].astype(np.intp) * 16 +
+                  nts[1::3] * 4 + nts[2::3])
+        translation = amino_acids[codons]
+        is_stop = translation == ord("*")
+        stop_tally = np.concatenate(([0], np.cumsum(is_stop)))
+
+        first = 0
+        for index, seq_data, protein_alphabet in batch:
+            last = first + len(seq_data) // 3 - 1
+            if not starts[codons[first]]:
+                results[index] = (Seq("", IUPAC.protein), "bad_start")
+            elif not is_stop[last]:
+                results[index] = (Seq("", IUPAC.protein), "bad_stop")
+            elif last > first and stop_tally[last] - stop_tally[first+1] > 0:
+                results[index] = (Seq("", IUPAC.protein), "internal_stop")
+            else:
+                protein = "M" + translation[first+1:last].tobytes().decode()
+                results[index] = (Seq(protein, protein_alphabet), None)
+            first = last + 1
+    return results
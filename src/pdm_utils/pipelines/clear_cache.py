@@ -0,0 +1,80 @@
+"""Pipeline to clear locally cached pdm_utils data."""
+
+import argparse
+import pathlib
+
+from pdm_utils.classes.evalcache import EvalCache
+from pdm_utils.classes.schemacache import SchemaCache
+from pdm_utils.classes.sequencestore import SequenceStore
+from pdm_utils.classes.toolcache import ToolCache
+
+CACHE_TYPES = {"evaluations", "schemas", "sequences", "tools"}
+
+
+def main(unparsed_args_list):
+    """Run main clear_cache pipeline."""
+    args = parse_args(unparsed_args_list)
+
+    if "tools" in args.cache_types:
+        tool_cache = ToolCache(cache_dir=args.tool_cache_dir)
+        size = tool_cache.size()
+        removed = tool_cache.clear()
+        print(f"Removed {removed} cached external tool results "
+              f"({size} bytes) from {tool_cache.cache_dir}.")
+
+    if "evaluations" in args.cache_types:
+        eval_cache = EvalCache(cache_dir=args.eval_cache_dir)
+        size = eval_cache.size()
+        removed = eval_cache.clear()
+        print(f"Removed {removed} cached import evaluation results "
+              f"({size} bytes) from {eval_cache.cache_dir}.")
+
+    if "sequences" in args.cache_types:
+        seq_store = SequenceStore(path=args.seq_store_dir)
+        removed = seq_store.clear()
+        print(f"Removed {removed} stored genome sequences "
+              f"from {seq_store.path}.")
+
+    if "schemas" in args.cache_types:
+        schema_cache = SchemaCache(cache_dir=args.schema_cache_dir)
+        removed = schema_cache.clear()
+        print(f"Removed {removed} cached database schemas "
+              f"from {schema_cache.cache_dir}.")
+
+    print("Clear cache script completed.")
+
+
+def parse_args(unparsed_args_list):
+    """Verify the correct arguments are selected."""
+
+    clear_cache_help = "Pipeline to clear locally cached pdm_utils data."
+    cache_types_help = (
+        "Indicates which caches to clear. "
+        "By default, all caches are cleared.")
+    tool_cache_dir_help = (
+        "Path to the directory containing cached external tool results.")
+    eval_cache_dir_help = (
+        "Path to the directory containing cached import evaluation results.")
+    seq_store_dir_help = (
+        "Path to the directory containing stored genome sequences.")
+    schema_cache_dir_help = (
+        "Path to the directory containing cached database schemas.")
+
+    parser = argparse.ArgumentParser(description=clear_cache_help)
+    parser.add_argument("-t", "--cache_types", nargs="*",
+                        choices=sorted(CACHE_TYPES),
+                        default=sorted(CACHE_TYPES), help=cache_types_help)
+    parser.add_argument("-tcd", "--tool_cache_dir", type=pathlib.Path,
+                        default=None, help=tool_cache_dir_help)
+    parser.add_argument("-ecd", "--eval_cache_dir", type=pathlib.Path,
+                        default=None, help=eval_cache_dir_help)
+    parser.add_argument("-ssd", "--seq_store_dir", type=pathlib.Path,
+                        default=None, help=seq_store_dir_help)
+    parser.add_argument("-scd", "--schema_cache_dir", type=pathlib.Path,
+                        default=None, help=schema_cache_dir_help)
+
+    # Assumed command line arg structure:
+    # python3 -m pdm_utils.run <pipeline> <additional args...>
+    # sys.argv:      [0]            [1]         [2...]
+    args = parser.parse_args(unparsed_args_list[2:])
+    return args
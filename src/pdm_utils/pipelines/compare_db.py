@@ -51,6 +51,7 @@ from pdm_utils.classes import dbcomparesummary
 from pdm_utils.classes import genometriad
 from pdm_utils.classes.alchemyhandler import AlchemyHandler
 from pdm_utils.classes.filter import Filter
+from pdm_utils.classes.sequencestore import SequenceStore
 from pdm_utils.constants import constants
 from pdm_utils.functions import basic
 from pdm_utils.functions import flat_files
@@ -87,7 +88,7 @@ CDS_SUMMARY_OUTPUT = "summary_cds.csv"
 GENOME_OUTPUT = "genome.csv"
 GENE_OUTPUT = "cds.csv"
 
-PHAGE_QUERY = ("SELECT PhageID, Name, HostGenus, Sequence, Length, "
+PHAGE_QUERY = ("SELECT PhageID, Name, HostGenus, Length, GC, "
                "Status, Cluster, Accession, RetrieveRecord, "
                "DateLastModified, AnnotationAuthor FROM phage")
 GENE_QUERY = ("SELECT PhageID, GeneID, Name, Start, Stop, Orientation, "
@@ -356,6 +357,11 @@ def main(unparsed_args_list):
     ncbi_credentials_file = args.ncbi_credentials_file
     interactive = args.interactive
 
+    if args.seq_store:
+        seq_store = SequenceStore()
+    else:
+        seq_store = None
+
     # Filters input: phage.Status=draft AND phage.HostGenus=Mycobacterium
     # Args structure: [['phage.Status=draft'], ['phage.HostGenus=Mycobacterium']]
     filters = args.filters
@@ -399,7 +405,8 @@ def main(unparsed_args_list):
 
     # Now proceed with getting all genome data.
     pmd_tup = process_mysql_data(working_path, engine, phage_ids,
-                                 interactive, save_records)
+                                 interactive, save_records,
+                                 seq_store=seq_store)
     mysql_genome_dict = pmd_tup[0]
     mysql_accessions = pmd_tup[1]
     mysql_acc_duplicates = pmd_tup[2]
@@ -472,6 +479,9 @@ def parse_args(unparsed_args_list):
         "with each conditional formatted as 'table.Field=value'.")
     interactive_help = (
         "Indicates whether evaluation is paused when errors are encountered.")
+    seq_store_help = (
+        "Indicates whether genome sequences should be read from a local "
+        "snapshot, which is only refreshed when the phage table changes.")
 
     parser = argparse.ArgumentParser(description=compare_help)
     parser.add_argument("database", type=str, help=database_help)
@@ -491,6 +501,8 @@ def parse_args(unparsed_args_list):
         default=False, help=save_records_help)
     parser.add_argument("-i", "--interactive", action="store_true",
         default=False, help=interactive_help)
+    parser.add_argument("-ss", "--seq_store", action="store_true",
+        default=False, help=seq_store_help)
 
     # Assumed command line arg structure:
     # python3 -m pdm_utils <pipeline> <additional args...>
@@ -643,15 +655,22 @@ def selected_authors_lst(lst1):
     return lst2
 
 # TODO refactor and test.
-def process_mysql_data(working_path, engine, phage_ids, interactive, save):
+def process_mysql_data(working_path, engine, phage_ids, interactive, save,
+                       seq_store=None):
     """Retrieve and process MySQL data."""
 
     print('\n\nPreparing genome data sets from the MySQL database...')
+    # Sequences are retrieved from the local snapshot if one is used.
+    if seq_store is not None and not seq_store.is_current(engine):
+        print("Refreshing the genome sequence snapshot...")
+        seq_store.snapshot(engine)
     genome_list = mysqldb.parse_genome_data(engine,
                                             phage_id_list=phage_ids,
                                             phage_query=PHAGE_QUERY,
                                             gene_query=GENE_QUERY,
-                                            gnm_type=GNM_MYSQL)
+                                            gnm_type=GNM_MYSQL,
+                                            lazy_seq=True,
+                                            seq_loader=seq_store)
 
     tup = filter_mysql_genomes(genome_list)
     gnm_dict = tup[0]
@@ -1,15 +1,23 @@
 """Pipeline for exporting database information into files."""
 import argparse
 import csv
+import gzip
+import hashlib
+import itertools
+import json
 import os
 import shutil
+import struct
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from functools import singledispatch
+from io import StringIO
 from pathlib import Path
 from typing import List, Dict
 
 from Bio import SeqIO
+from Bio import bgzf
 from Bio.Alphabet import IUPAC
 from Bio.SeqFeature import SeqFeature
 from Bio.SeqRecord import SeqRecord
@@ -24,6 +32,10 @@ from pdm_utils.functions import mysqldb_basic
 from pdm_utils.functions import parsing
 from pdm_utils.functions import querying
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 #GLOBAL VARIABLES
 #-----------------------------------------------------------------------------
@@ -35,6 +47,10 @@ DEFAULT_TABLE = "phage"
 PHAGE_QUERY = "SELECT * FROM phage"
 GENE_QUERY = "SELECT * FROM gene"
 
+# Parent genome columns used to annotate CDS SeqRecords.
+CDS_PARENT_COLUMNS = ["phage.PhageID", "phage.Accession", "phage.HostGenus",
+                      "phage.Length", "phage.DateLastModified"]
+
 # Valid Biopython formats that crash the script due to specific values in
 # some genomes that can probably be fixed relatively easily and implemented.
 # BIOPYTHON_PIPELINES_FIXABLE = ["embl", "imgt", "seqxml"]
@@ -50,6 +66,19 @@ BIOPYTHON_PIPELINES = ["gb", "fasta", "clustal", "fasta-2line", "nexus",
 FILTERABLE_PIPELINES = BIOPYTHON_PIPELINES + ["csv"]
 PIPELINES = FILTERABLE_PIPELINES + ["sql"]
 FLAT_FILE_TABLES = ["phage", "gene"]
+# Formats in which each record is written independently, so that
+# concatenated files can be written from separately formatted chunks.
+CHUNKABLE_FORMATS = ["gb", "fasta", "fasta-2line", "pir", "tab"]
+DEFAULT_PROCESSES = 1
+# Number of inputs sent to a process pool at a time when streaming
+# genomes, which bounds the number of genomes held in memory.
+PROCESS_BATCH_SIZE = 100
+# Compression formats and the suffixes appended to compressed file names.
+COMPRESSION_SUFFIXES = {"gz" : ".gz", "bgzf" : ".gz", "zst" : ".zst"}
+# Formats for which bgzf compressed files are indexed with .fai and .gzi files.
+FASTA_INDEX_FORMATS = ["fasta", "fasta-2line"]
+# Name of the manifest file kept in incrementally exported directories.
+MANIFEST_NAME = "export_manifest.json"
 
 #Once trna has data, these tables can be reintroduced.
 TABLES = ["phage", "gene", "domain", "gene_domain", "pham",
@@ -95,6 +124,12 @@ def main(unparsed_args_list):
               "Pipeline parsed from command line args is not supported")
         sys.exit(1)
 
+    if args.pipeline in BIOPYTHON_PIPELINES and args.compress == "zst" \
+                                            and zstandard is None:
+        print("ABORTED EXPORT: zst compression requires the "
+              "'zstandard' package to be installed.")
+        sys.exit(1)
+
     if args.pipeline != "I":
         execute_export(alchemist, args.folder_path, args.folder_name,
                        args.pipeline, table=args.table, values=values,
@@ -104,6 +139,9 @@ def main(unparsed_args_list):
                        sequence_columns=args.sequence_columns,
                        raw_bytes=args.raw_bytes,
                        concatenate=args.concatenate,
+                       processes=args.processes,
+                       compress=args.compress,
+                       incremental=args.incremental,
                        verbose=args.verbose)
     else:
         pass
@@ -175,6 +213,20 @@ def parse_export(unparsed_args_list):
         SeqRecord export option to toggle concatenation of files.
             Toggle to enable concatenation of files.
         """
+    PROCESSES_HELP = """
+        SeqRecord export option to convert and write SeqRecords
+        with multiple processes.
+            Follow selection argument with the number of processes.
+        """
+    COMPRESS_HELP = """
+        SeqRecord export option to compress files as they are written.
+            Follow selection argument with a compression format.
+        """
+    INCREMENTAL_HELP = """
+        SeqRecord export option to update a previous export, rewriting
+        only the files of genomes modified since that export.
+            Follow selection argument with the path to the export dir.
+        """
 
 
     SEQUENCE_COLUMNS_HELP = """
@@ -241,6 +293,14 @@ def parse_export(unparsed_args_list):
         if initial.pipeline in BIOPYTHON_PIPELINES:
             optional_parser.add_argument("-cc", "--concatenate",
                                 help=CONCATENATE_HELP, action="store_true")
+            optional_parser.add_argument("-np", "--processes", type=int,
+                                help=PROCESSES_HELP)
+            optional_parser.add_argument("-cp", "--compress", type=str,
+                                help=COMPRESS_HELP,
+                                choices=list(COMPRESSION_SUFFIXES.keys()))
+            optional_parser.add_argument("-inc", "--incremental",
+                                type=convert_export_dir_path,
+                                help=INCREMENTAL_HELP)
         else:
             optional_parser.add_argument("-sc", "--sequence_columns",
                                 help=SEQUENCE_COLUMNS_HELP, action="store_true")
@@ -260,7 +320,9 @@ def parse_export(unparsed_args_list):
                                  filters="", groups=[], sort=[],
                                  include_columns=[], exclude_columns=[],
                                  sequence_columns=False, concatenate=False,
-                                 raw_bytes=False)
+                                 raw_bytes=False,
+                                 processes=DEFAULT_PROCESSES,
+                                 compress=None, incremental=None)
 
     parsed_args = optional_parser.parse_args(unparsed_args_list[4:])
 
@@ -271,7 +333,8 @@ def execute_export(alchemist, folder_path, folder_name, pipeline,
                         filters="", groups=[], sort=[],
                         include_columns=[], exclude_columns=[],
                         sequence_columns=False, raw_bytes=False,
-                        concatenate=False):
+                        concatenate=False, processes=DEFAULT_PROCESSES,
+                        compress=None, incremental=None):
     """Executes the entirety of the file export pipeline.
 
     :param alchemist: A connected and fully built AlchemyHandler object.
@@ -301,11 +364,31 @@ def execute_export(alchemist, folder_path, folder_name, pipeline,
     :type sequence_columns: bool
     :param concatenate: A boolean to toggle concaternation for SeqRecords.
     :type concaternate: bool
+    :param processes: Number of processes used to convert and write SeqRecords.
+    :type processes: int
+    :param compress: Compression format for SeqRecord files.
+    :type compress: str
+    :param incremental: Path to a previous SeqRecord export dir to update.
+    :type incremental: Path
     """
     if verbose:
         print("Retrieving database version...")
     db_version = mysqldb_basic.get_first_row_data(alchemist.engine, "version")
 
+    if incremental is not None and pipeline in BIOPYTHON_PIPELINES:
+        if groups:
+            print("ABORTED EXPORT: Incremental export does not support "
+                  "grouping of exported files.")
+            sys.exit(1)
+
+        execute_incremental_export(alchemist, incremental, pipeline,
+                                   db_version, table, values=values,
+                                   filters=filters, sort=sort,
+                                   concatenate=concatenate,
+                                   processes=processes, compress=compress,
+                                   verbose=verbose)
+        return
+
     if pipeline == "csv":
         if verbose:
             print("Processing columns for csv export...")
@@ -358,6 +441,7 @@ def execute_export(alchemist, folder_path, folder_name, pipeline,
                 execute_ffx_export(alchemist, mapped_path, export_path,
                                    db_filter.values, pipeline, db_version,
                                    table, concatenate=concatenate,
+                                   processes=processes, compress=compress,
                                    verbose=verbose)
             else:
                 execute_csv_export(db_filter, mapped_path, export_path,
@@ -398,27 +482,39 @@ def execute_csv_export(db_filter, export_path, folder_path, columns, csv_name,
         if column.name != db_filter._key.name:
             headers.append(column.name)
 
-    results = db_filter.select(columns)
-
-    if not raw_bytes:
-        decode_results(results, columns, verbose=verbose)
+    # Rows are written as they are streamed from the database, so only
+    # one batch of rows is held in memory at a time.
+    batches = db_filter.iter_select(columns)
+    first_batch = next(batches, None)
 
-    if len(results) == 0:
+    if first_batch is None:
         print(f"No database entries received for {csv_name}.")
         export_path.rmdir()
 
     else:
         if verbose:
             print(f"...Writing csv {csv_name}.csv in '{export_path.name}'...")
-            print("......Database entries retrieved: {len(results)}")
+
+        rows = 0
+        def iter_results():
+            nonlocal rows
+            for results in itertools.chain([first_batch], batches):
+                if not raw_bytes:
+                    decode_results(results, columns)
+                rows += len(results)
+                yield from results
 
         file_path = export_path.joinpath(f"{csv_name}.csv")
-        basic.export_data_dict(results, file_path, headers,
+        basic.export_data_dict(iter_results(), file_path, headers,
                                                include_headers=True)
 
+        if verbose:
+            print(f"......Database entries written: {rows}")
+
 def execute_ffx_export(alchemist, export_path, folder_path, values,
                        file_format, db_version, table,
-                       concatenate=False, verbose=False):
+                       concatenate=False, processes=DEFAULT_PROCESSES,
+                       compress=None, verbose=False):
     """Executes SeqRecord export of the compilation of data from a MySQL emtry.
 
     :param alchemist: A connected and fully build AlchemyHandler object.
@@ -441,6 +537,10 @@ def execute_ffx_export(alchemist, export_path, folder_path, values,
     :type sort: list[Column]
     :param concatenate: A boolean to toggle concatenation of SeqRecords.
     :type concaternate: bool
+    :param processes: Number of processes used to convert and write SeqRecords.
+    :type processes: int
+    :param compress: Compression format for SeqRecord files.
+    :type compress: str
     :param verbose: A boolean value to toggle progress print statements.
     :type verbose: bool
     """
@@ -452,28 +552,372 @@ def execute_ffx_export(alchemist, export_path, folder_path, values,
     seqrecords = []
     if table == "phage":
         seqrecords = get_genome_seqrecords(alchemist, values=values,
-                                                            verbose=verbose)
+                                                      processes=processes,
+                                                      verbose=verbose)
     elif table == "gene":
         seqrecords = get_cds_seqrecords(alchemist, values=values,
-                                                            verbose=verbose)
+                                                   processes=processes,
+                                                   verbose=verbose)
     else:
         print(f"Unknown error occured, table '{table}' is not recognized "
                "for SeqRecord export pipelines.")
         sys.exit(1)
 
+    def iter_versioned_seqrecords():
+        for record in seqrecords:
+            append_database_version(record, db_version)
+            yield record
+
     if verbose:
             print("Appending database version...")
-    for record in seqrecords:
-        append_database_version(record, db_version)
-    write_seqrecord(seqrecords, file_format, export_path, verbose=verbose,
-                                                    concatenate=concatenate)
+    #SeqRecords are converted and written as genomes are streamed from
+    #the database.
+    write_seqrecord(iter_versioned_seqrecords(), file_format, export_path,
+                                                    verbose=verbose,
+                                                    concatenate=concatenate,
+                                                    processes=processes,
+                                                    compress=compress)
+
+def execute_incremental_export(alchemist, export_path, file_format,
+                               db_version, table, values=[], filters="",
+                               sort=[], concatenate=False,
+                               processes=DEFAULT_PROCESSES, compress=None,
+                               verbose=False):
+    """Updates a SeqRecord export dir with genomes modified since the
+    export recorded in its manifest.
+
+    :param alchemist: A connected and fully build AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param export_path: Path to the dir of the export to update.
+    :type export_path: Path
+    :param file_format: Biopython supported file type.
+    :type file_format: str
+    :param db_version: Dictionary containing database version information.
+    :type db_version: dict
+    :param table: MySQL table name.
+    :type table: str
+    :param values: List of values to fitler database results.
+    :type values: list[str]
+    :param filters: A list of lists with filter values, grouped by ORs.
+    :type filters: list[list[str]]
+    :param sort: A list of supported MySQL column names to sort by.
+    :type sort: list[str]
+    :param concatenate: A boolean to toggle concatenation of SeqRecords.
+    :type concaternate: bool
+    :param processes: Number of processes used to convert and write SeqRecords.
+    :type processes: int
+    :param compress: Compression format for SeqRecord files.
+    :type compress: str
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    """
+    export_path.mkdir(parents=True, exist_ok=True)
+
+    db_filter = apply_filters(alchemist, table, filters, verbose=verbose)
+    db_filter.values = values
+    db_filter.values = db_filter.build_values()
+    if sort and db_filter.values:
+        db_filter.sort(get_sort_columns(alchemist, sort))
+
+    if table == "phage":
+        genome_keys = {phage_id: [phage_id] for phage_id in db_filter.values}
+    elif table == "gene":
+        genome_keys = get_gene_genome_keys(alchemist, db_filter.values)
+    else:
+        print(f"Unknown error occured, table '{table}' is not recognized "
+               "for SeqRecord export pipelines.")
+        sys.exit(1)
+
+    if verbose:
+        print("Comparing genomes to the export manifest...")
+    dates = get_genome_modified_dates(alchemist, list(genome_keys.keys()))
+
+    settings = {"pipeline" : file_format, "table" : table,
+                "concatenate" : concatenate, "compress" : compress}
+    manifest = read_manifest(export_path)
+    if manifest is None:
+        exported = {}
+    elif manifest["settings"] != settings:
+        #Files exported with other settings are replaced entirely.
+        remove_export_files(export_path, get_manifest_files(manifest))
+        exported = {}
+    else:
+        exported = manifest["genomes"]
+
+    changed = []
+    for genome_id, keys in genome_keys.items():
+        entry = exported.get(genome_id)
+        #Genomes without a DateLastModified are always exported, since
+        #their modifications can not be detected.
+        if entry is None or dates[genome_id] is None \
+                         or entry["DateLastModified"] != dates[genome_id] \
+                         or entry["keys"] != keys \
+                         or not all([export_path.joinpath(file_name).is_file()
+                                     for file_name in entry["files"].keys()]):
+            changed.append(genome_id)
+    removed = [genome_id for genome_id in exported.keys()
+                         if genome_id not in genome_keys]
+
+    if verbose:
+        print(f"...Genomes modified: {len(changed)}")
+        print(f"...Genomes removed: {len(removed)}")
+
+    genomes = {genome_id : exported[genome_id]
+                                for genome_id in genome_keys.keys()
+                                if genome_id not in changed}
+    if concatenate and (changed or removed):
+        #A concatenated file is rewritten with all of its genomes.
+        changed = list(genome_keys.keys())
+        genomes = {}
+
+    export_values = [key for genome_id in changed
+                         for key in genome_keys[genome_id]]
+    for genome_id in changed:
+        genomes[genome_id] = {"DateLastModified" : dates[genome_id],
+                              "keys" : genome_keys[genome_id],
+                              "files" : {}}
+
+    if export_values:
+        keyed_seqrecords = get_keyed_seqrecords(alchemist, table,
+                                                export_values,
+                                                genome_keys,
+                                                processes=processes,
+                                                verbose=verbose)
+
+        #SeqRecords are streamed to the files, and the files of each genome
+        #are recorded as its SeqRecords are written.
+        suffix = COMPRESSION_SUFFIXES.get(compress, "")
+
+        def iter_seqrecords():
+            for genome_id, record in keyed_seqrecords:
+                append_database_version(record, db_version)
+                if concatenate:
+                    file_name = f"{export_path.name}.{file_format}{suffix}"
+                else:
+                    file_name = f"{record.name}.{file_format}{suffix}"
+                genomes[genome_id]["files"][file_name] = None
+                yield record
+
+        #Files are hashed as they are formatted, and files with unchanged
+        #content are not rewritten.
+        previous_digests = {}
+        for entry in exported.values():
+            previous_digests.update(entry["files"])
+        file_digests = write_seqrecord(iter_seqrecords(), file_format,
+                                       export_path, concatenate=concatenate,
+                                       processes=processes, compress=compress,
+                                       verbose=verbose,
+                                       digests=previous_digests)
+
+        for genome_id in changed:
+            files = genomes[genome_id]["files"]
+            for file_name in files.keys():
+                files[file_name] = file_digests[file_name]
+
+    manifest = {"settings" : settings,
+                "version" : db_version.get("Version"),
+                "genomes" : genomes}
+    stale_files = set(get_manifest_files({"genomes" : exported})) - \
+                  set(get_manifest_files(manifest))
+    if verbose:
+        print(f"...Removing files: {len(stale_files)}")
+    remove_export_files(export_path, stale_files)
+
+    write_manifest(manifest, export_path)
+
+def get_gene_genome_keys(alchemist, gene_ids):
+    """Groups GeneIDs by the PhageID of their parent genome.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param gene_ids: List of GeneIDs.
+    :type gene_ids: list[str]
+    :returns: Dictionary of PhageIDs and lists of their GeneIDs.
+    :rtype: dict
+    """
+    genome_keys = {}
+    if not gene_ids:
+        return genome_keys
+
+    gene_id_column = querying.get_column(alchemist.metadata, "gene.GeneID")
+    phage_id_column = querying.get_column(alchemist.metadata, "gene.PhageID")
+    query = querying.build_select(alchemist.graph,
+                                  [gene_id_column, phage_id_column])
+    results = querying.execute(alchemist.engine, query,
+                               in_column=gene_id_column, values=gene_ids)
+
+    gene_genomes = {}
+    for result in results:
+        gene_genomes[result["GeneID"]] = result["PhageID"]
+    for gene_id in gene_ids:
+        genome_keys.setdefault(gene_genomes[gene_id], []).append(gene_id)
+
+    return genome_keys
+
+def get_genome_modified_dates(alchemist, genome_ids):
+    """Retrieves the DateLastModified of genomes.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param genome_ids: List of PhageIDs.
+    :type genome_ids: list[str]
+    :returns: Dictionary of PhageIDs and DateLastModified strings.
+    :rtype: dict
+    """
+    dates = {}
+    if not genome_ids:
+        return dates
+
+    phage_id_column = querying.get_column(alchemist.metadata, "phage.PhageID")
+    date_column = querying.get_column(alchemist.metadata,
+                                      "phage.DateLastModified")
+    query = querying.build_select(alchemist.graph,
+                                  [phage_id_column, date_column])
+    results = querying.execute(alchemist.engine, query,
+                               in_column=phage_id_column, values=genome_ids)
+
+    for result in results:
+        date = result["DateLastModified"]
+        if date is not None:
+            date = str(date)
+        dates[result["PhageID"]] = date
+
+    return dates
+
+def get_keyed_seqrecords(alchemist, table, values, genome_keys,
+                                                   processes=1, verbose=False):
+    """Creates SeqRecords paired with the PhageID of their genome.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param table: MySQL table name.
+    :type table: str
+    :param values: List of PhageIDs or GeneIDs to create SeqRecords from.
+    :type values: list[str]
+    :param genome_keys: Dictionary of PhageIDs and lists of their values.
+    :type genome_keys: dict
+    :param processes: Number of processes used to convert SeqRecords.
+    :type processes: int
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    :returns: Generator of tuples of PhageIDs and SeqRecords.
+    :rtype: generator
+    """
+    if table == "phage":
+        def iter_genomes():
+            for gnm in mysqldb.iter_genome_data(alchemist.engine,
+                                                phage_id_list=values,
+                                                phage_query=PHAGE_QUERY,
+                                                gene_query=GENE_QUERY):
+                if verbose:
+                    print(f"Converting {gnm.name}...")
+                yield gnm
+
+        yield from imap_processes(genome_to_keyed_seqrecord, iter_genomes(),
+                                  processes)
+        return
+
+    gene_genomes = {}
+    for genome_id, gene_ids in genome_keys.items():
+        for gene_id in gene_ids:
+            gene_genomes[gene_id] = genome_id
+
+    #CDS SeqRecords are created a batch at a time to bound memory use.
+    for x in range(0, len(values), PROCESS_BATCH_SIZE):
+        seqrecords = get_cds_seqrecords(
+                                alchemist,
+                                values=values[x:x + PROCESS_BATCH_SIZE],
+                                processes=processes, verbose=verbose)
+        for record in seqrecords:
+            yield (gene_genomes[record.name], record)
+
+def get_file_hash(digests):
+    """Computes a content hash of a file from the hashes of its formatted
+    SeqRecords.
+
+    :param digests: SHA-256 hex digests of the formatted SeqRecords, in the
+        order they are written.
+    :type digests: Iterable[str]
+    :returns: SHA-256 hex digest.
+    :rtype: str
+    """
+    hash_object = hashlib.sha256()
+    for digest in digests:
+        hash_object.update(digest.encode("utf-8"))
+    return hash_object.hexdigest()
+
+def read_manifest(export_path):
+    """Reads the manifest of an incrementally exported dir.
 
-def write_seqrecord(seqrecord_list, file_format, export_path, concatenate=False,
-                                                              verbose=False):
-    """Outputs files with a particuar format from a SeqRecord list.
+    :param export_path: Path to the export dir.
+    :type export_path: Path
+    :returns: Manifest dictionary, or None if the dir has no manifest.
+    :rtype: dict
+    """
+    manifest_path = export_path.joinpath(MANIFEST_NAME)
+    if not manifest_path.is_file():
+        return None
+
+    with manifest_path.open(mode="r") as manifest_handle:
+        return json.load(manifest_handle)
+
+def write_manifest(manifest, export_path):
+    """Atomically replaces the manifest of an incrementally exported dir.
+
+    :param manifest: Manifest dictionary.
+    :type manifest: dict
+    :param export_path: Path to the export dir.
+    :type export_path: Path
+    """
+    manifest_path = export_path.joinpath(MANIFEST_NAME)
+    temp_path = export_path.joinpath(f".{MANIFEST_NAME}.tmp")
+    with temp_path.open(mode="w") as manifest_handle:
+        json.dump(manifest, manifest_handle, indent=2, sort_keys=True)
+        manifest_handle.flush()
+        os.fsync(manifest_handle.fileno())
+    os.replace(temp_path, manifest_path)
+
+def get_manifest_files(manifest):
+    """Lists the file names recorded in a manifest.
+
+    :param manifest: Manifest dictionary.
+    :type manifest: dict
+    :returns: List of distinct file names.
+    :rtype: list[str]
+    """
+    file_names = []
+    for entry in manifest["genomes"].values():
+        file_names.extend(entry["files"].keys())
+    return list(dict.fromkeys(file_names))
+
+def remove_export_files(export_path, file_names):
+    """Removes exported files along with their index files.
 
-    :param seq_record_list: List of populated SeqRecords.
-    :type seq_record_list: list[SeqRecord]
+    :param export_path: Path to the export dir.
+    :type export_path: Path
+    :param file_names: Names of the exported files.
+    :type file_names: Iterable[str]
+    """
+    for file_name in file_names:
+        for name in [file_name, f"{file_name}.fai", f"{file_name}.gzi"]:
+            file_path = export_path.joinpath(name)
+            if file_path.is_file():
+                file_path.unlink()
+
+def write_seqrecord(seqrecords, file_format, export_path, concatenate=False,
+                                                          verbose=False,
+                                                          processes=1,
+                                                          compress=None,
+                                                          digests=None):
+    """Outputs files with a particuar format from SeqRecords.
+
+    SeqRecords are consumed and written as they are produced. If several
+    SeqRecords share a name, only the first is written to a file.
+    SeqRecord files are not rewritten if their content hash matches the
+    given hash and the file exists.
+
+    :param seqrecords: Populated SeqRecords.
+    :type seqrecords: Iterable[SeqRecord]
     :param file_format: Biopython supported file type.
     :type file_format: str
     :param export_path: Path to a dir for file creation.
@@ -482,25 +926,290 @@ def write_seqrecord(seqrecord_list, file_format, export_path, concatenate=False,
     :type concaternate: bool
     :param verbose: A boolean value to toggle progress print statements.
     :type verbose: bool
+    :param processes: Number of processes used to format SeqRecords.
+    :type processes: int
+    :param compress: Compression format for the files.
+    :type compress: str
+    :param digests: Content hashes of existing files, keyed by file name.
+    :type digests: dict
+    :returns: Content hashes of the written files, keyed by file name.
+    :rtype: dict
     """
+    if digests is None:
+        digests = {}
+
     if verbose:
         print("Writing selected data to files...")
 
-    record_dictionary = {}
+    suffix = COMPRESSION_SUFFIXES.get(compress, "")
     if concatenate:
-        record_dictionary.update({export_path.name:seqrecord_list})
+        file_path = export_path.joinpath(
+                                f"{export_path.name}.{file_format}{suffix}")
+        if verbose:
+            print(f"...Writing {export_path.name}...")
+        if file_format in CHUNKABLE_FORMATS:
+            #SeqRecords are formatted and hashed in parallel and written in
+            #their original order.
+            results = imap_processes(format_hashed_seqrecords,
+                                     (([record], file_format)
+                                                    for record in seqrecords),
+                                     processes)
+            record_digests = []
+
+            def iter_texts():
+                for text, record_digest in results:
+                    record_digests.append(record_digest)
+                    yield text
+
+            write_text_file(iter_texts(), file_path, file_format,
+                            compress=compress)
+            return {file_path.name : get_file_hash(record_digests)}
+        else:
+            #Alignment formats are written from all SeqRecords at once.
+            file_path, file_digest = write_seqrecord_file(
+                                        (list(seqrecords), file_path,
+                                         file_format, compress, None))
+            return {file_path.name : file_digest}
+
+    def iter_tasks():
+        record_names = set()
+        for record in seqrecords:
+            if record.name in record_names:
+                continue
+            record_names.add(record.name)
+
+            if verbose:
+                print(f"...Writing {record.name}...")
+            file_name = f"{record.name}.{file_format}{suffix}"
+            file_path = export_path.joinpath(file_name)
+            yield (record, file_path, file_format, compress,
+                   digests.get(file_name))
+
+    return {file_path.name : file_digest
+            for file_path, file_digest in imap_processes(write_seqrecord_file,
+                                                         iter_tasks(),
+                                                         processes)}
+
+def write_seqrecord_file(task):
+    """Writes SeqRecords to a file, unless the existing file has the same
+    content.
+
+    :param task:
+        Tuple of SeqRecord(s), file Path, Biopython file format, compression
+        format and the content hash of the existing file, or None.
+    :type task: tuple
+    :returns: Tuple of the Path to the file and its content hash.
+    :rtype: tuple
+    """
+    records, file_path, file_format, compress, digest = task
+    if isinstance(records, SeqRecord):
+        records = [records]
+
+    if file_format in CHUNKABLE_FORMATS:
+        #Records are formatted and hashed one at a time, as they are in
+        #concatenated files.
+        results = [format_hashed_seqrecords(([record], file_format))
+                                                    for record in records]
+    else:
+        results = [format_hashed_seqrecords((records, file_format))]
+
+    file_digest = get_file_hash([record_digest
+                                 for text, record_digest in results])
+    if file_digest != digest or not file_path.is_file():
+        write_text_file([text for text, record_digest in results],
+                        file_path, file_format, compress=compress)
+    return (file_path, file_digest)
+
+def write_text_file(texts, file_path, file_format, compress=None):
+    """Writes formatted SeqRecords to a file, and indexes bgzf compressed
+    FASTA files.
+
+    :param texts: Formatted SeqRecords, in the order to write them.
+    :type texts: Iterable[str]
+    :param file_path: Path to the file.
+    :type file_path: Path
+    :param file_format: Biopython file format the SeqRecords were formatted as.
+    :type file_format: str
+    :param compress: Compression format for the file.
+    :type compress: str
+    """
+    index = (compress == "bgzf" and file_format in FASTA_INDEX_FORMATS)
+
+    fasta_index = []
+    offset = 0
+    with open_compressed(file_path, compress=compress) as file_handle:
+        for text in texts:
+            if index:
+                fasta_index.extend(get_fasta_index(text, offset=offset))
+                offset += len(text.encode("latin-1"))
+            file_handle.write(text)
+
+    if index:
+        write_fasta_index(fasta_index, Path(f"{file_path}.fai"))
+        write_bgzf_index(file_path, Path(f"{file_path}.gzi"))
+
+def open_compressed(file_path, compress=None):
+    """Opens a file for writing text through a compressor.
+
+    :param file_path: Path to the file.
+    :type file_path: Path
+    :param compress: Compression format, or None to write uncompressed text.
+    :type compress: str
+    :returns: Writable text file handle.
+    """
+    if compress is None:
+        return file_path.open(mode='w')
+    elif compress == "gz":
+        return gzip.open(file_path, mode="wt")
+    elif compress == "bgzf":
+        return bgzf.BgzfWriter(str(file_path), mode="w")
+    elif compress == "zst":
+        if zstandard is None:
+            raise ImportError("zst compression requires the 'zstandard' "
+                              "package to be installed.")
+        return zstandard.open(file_path, mode="wt")
     else:
-        for record in seqrecord_list:
-            record_dictionary.update({record.name:record})
+        raise ValueError(f"Compression format '{compress}' is not supported.")
+
+def get_fasta_index(text, offset=0):
+    """Computes .fai index entries for FASTA formatted records.
+
+    :param text: FASTA formatted records.
+    :type text: str
+    :param offset: Uncompressed file offset the text is written at.
+    :type offset: int
+    :returns:
+        List of lists of the name, length, sequence offset, bases per line
+        and bytes per line of each record.
+    :rtype: list[list]
+    """
+    fasta_index = []
+    entry = None
+    position = offset
+    for line in text.splitlines(keepends=True):
+        if line.startswith(">"):
+            fields = line[1:].split(maxsplit=1)
+            name = fields[0] if fields else ""
+            entry = [name, 0, position + len(line), 0, 0]
+            fasta_index.append(entry)
+        elif entry is not None:
+            bases = len(line.rstrip("\r\n"))
+            if entry[3] == 0:
+                entry[3] = bases
+                entry[4] = len(line)
+            entry[1] += bases
+        position += len(line)
+
+    return fasta_index
+
+def write_fasta_index(fasta_index, index_path):
+    """Writes a samtools compatible .fai index file.
+
+    :param fasta_index: List of .fai index entries.
+    :type fasta_index: list[list]
+    :param index_path: Path to the index file.
+    :type index_path: Path
+    """
+    with index_path.open(mode="w") as index_handle:
+        for entry in fasta_index:
+            index_handle.write("\t".join([str(field) for field in entry]))
+            index_handle.write("\n")
+
+def write_bgzf_index(file_path, index_path):
+    """Writes a samtools compatible .gzi index of the blocks of a bgzf file.
+
+    :param file_path: Path to the bgzf compressed file.
+    :type file_path: Path
+    :param index_path: Path to the index file.
+    :type index_path: Path
+    """
+    with file_path.open(mode="rb") as file_handle:
+        blocks = [(start, data_start)
+                  for start, raw_length, data_start, data_length
+                                            in bgzf.BgzfBlocks(file_handle)
+                  if start > 0 and data_length > 0]
+
+    with index_path.open(mode="wb") as index_handle:
+        index_handle.write(struct.pack("<Q", len(blocks)))
+        for start, data_start in blocks:
+            index_handle.write(struct.pack("<QQ", start, data_start))
+
+def format_seqrecords(task):
+    """Formats SeqRecords as they would be written to a file.
+
+    :param task: Tuple of a list of SeqRecords and Biopython file format.
+    :type task: tuple
+    :returns: Formatted SeqRecords.
+    :rtype: str
+    """
+    records, file_format = task
+    handle = StringIO()
+    SeqIO.write(records, handle, file_format)
+    return handle.getvalue()
+
+def format_hashed_seqrecords(task):
+    """Formats SeqRecords and computes a content hash of the formatted text.
+
+    :param task: Tuple of a list of SeqRecords and Biopython file format.
+    :type task: tuple
+    :returns: Tuple of the formatted SeqRecords and their SHA-256 hex digest.
+    :rtype: tuple
+    """
+    text = format_seqrecords(task)
+    return (text, hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+def map_processes(function, inputs, processes):
+    """Applies a function to each input, optionally in a process pool.
+
+    :param function: Module-level function taking a single input.
+    :type function: function
+    :param inputs: List of inputs.
+    :type inputs: list
+    :param processes: Number of processes.
+    :type processes: int
+    :returns: Results in the order of the inputs.
+    :rtype: list
+    """
+    processes = min(processes, len(inputs))
+    if processes <= 1:
+        return [function(item) for item in inputs]
+
+    #Inputs are sent to the processes in chunks to limit the overhead of
+    #transferring each input and result between processes.
+    chunksize = max(1, len(inputs) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(function, inputs, chunksize=chunksize))
+
+def imap_processes(function, inputs, processes,
+                                     batch_size=PROCESS_BATCH_SIZE):
+    """Lazily applies a function to each input, optionally in a process pool.
+
+    Inputs are consumed a batch at a time, so that only one batch of inputs
+    and results is held in memory.
+
+    :param function: Module-level function taking a single input.
+    :type function: function
+    :param inputs: Iterable of inputs.
+    :type inputs: Iterable
+    :param processes: Number of processes.
+    :type processes: int
+    :param batch_size: Number of inputs sent to the processes at a time.
+    :type batch_size: int
+    :returns: Generator of results in the order of the inputs.
+    :rtype: generator
+    """
+    if processes <= 1:
+        for item in inputs:
+            yield function(item)
+        return
 
-    for record_name in record_dictionary.keys():
-        if verbose:
-            print(f"...Writing {record_name}...")
-        file_name = f"{record_name}.{file_format}"
-        file_path = export_path.joinpath(file_name)
-        file_handle = file_path.open(mode='w')
-        SeqIO.write(record_dictionary[record_name], file_handle, file_format)
-        file_handle.close()
+    inputs = iter(inputs)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        batch = list(itertools.islice(inputs, batch_size))
+        while batch:
+            chunksize = max(1, len(batch) // (processes * 4))
+            yield from executor.map(function, batch, chunksize=chunksize)
+            batch = list(itertools.islice(inputs, batch_size))
 
 def write_database(alchemist, version, export_path):
     """Output .sql file from the selected database.
@@ -533,6 +1242,20 @@ def convert_dir_path(path: str):
     """
     return basic.set_path(Path(path), kind="dir")
 
+def convert_export_dir_path(path: str):
+    """Function to convert argparse input to an export directory path,
+    which may not exist yet.
+
+    :param path: A string to be converted into a Path object.
+    :type path: str
+    :returns: A Path object converted from the inputed string.
+    :rtype: Path
+    """
+    path = Path(path).expanduser().resolve()
+    if path.exists():
+        return basic.set_path(path, kind="dir")
+    return path
+
 def convert_file_path(path: str):
     """Function to convert argparse input to a working file path.
 
@@ -574,54 +1297,118 @@ def _(value_list_input):
 #EXPORT-SPECIFIC HELPER FUNCTIONS
 #-----------------------------------------------------------------------------
 
-def get_genome_seqrecords(alchemist, values=[], verbose=False):
-    genomes = mysqldb.parse_genome_data(alchemist.engine,
-                                        phage_id_list=values,
-                                        phage_query=PHAGE_QUERY,
-                                        gene_query=GENE_QUERY)
+def get_genome_seqrecords(alchemist, values=[], verbose=False, processes=1):
+    """Streams genomes from a MySQL database and converts them to SeqRecords.
 
-    seqrecords = []
-    for gnm in genomes:
-        process_cds_features(gnm)
-        if verbose:
-            print(f"Converting {gnm.name}...")
-        seqrecords.append(flat_files.genome_to_seqrecord(gnm))
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param values: List of PhageIDs of the genomes.
+    :type values: list[str]
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    :param processes: Number of processes used to convert SeqRecords.
+    :type processes: int
+    :returns: Generator of SeqRecords, in order of PhageID.
+    :rtype: generator
+    """
+    def iter_genomes():
+        for gnm in mysqldb.iter_genome_data(alchemist.engine,
+                                            phage_id_list=values,
+                                            phage_query=PHAGE_QUERY,
+                                            gene_query=GENE_QUERY):
+            if verbose:
+                print(f"Converting {gnm.name}...")
+            yield gnm
 
-    return seqrecords
+    return imap_processes(genome_to_seqrecord, iter_genomes(), processes)
+
+def genome_to_seqrecord(gnm):
+    """Sorts the Cds features of a Genome object and converts it to a
+    SeqRecord.
 
-def get_cds_seqrecords(alchemist, values=[], nucleotide=False, verbose=False):
+    :param gnm: Genome object containing Cds objects.
+    :type gnm: Genome
+    :returns: Populated SeqRecord.
+    :rtype: SeqRecord
+    """
+    process_cds_features(gnm)
+    return flat_files.genome_to_seqrecord(gnm)
+
+def genome_to_keyed_seqrecord(gnm):
+    """Converts a Genome object to a SeqRecord paired with its PhageID.
+
+    :param gnm: Genome object containing Cds objects.
+    :type gnm: Genome
+    :returns: Tuple of the PhageID and the populated SeqRecord.
+    :rtype: tuple
+    """
+    return (gnm.id, genome_to_seqrecord(gnm))
+
+def get_cds_seqrecords(alchemist, values=[], nucleotide=False, verbose=False,
+                                                               processes=1):
     cds_list = parse_feature_data(alchemist, values=values)
 
-    seqrecords = []
-    genomes_dict = {}
-    for cds in cds_list:
-        if not cds.genome_id in genomes_dict.keys():
-            if verbose:
-                print(f"...Retrieving parent genome for {cds.id}...")
-            phage_id_obj = querying.get_column(alchemist.metadata,
-                                               "phage.PhageID")
-            phage_obj = phage_id_obj.table
-
-            parent_genome_query = querying.build_select(
-                                                alchemist.graph,
-                                                phage_obj,
-                                                where=\
-                                                phage_id_obj==cds.genome_id)
-            parent_genome_data = mysqldb_basic.first(alchemist.engine,
-                                                     parent_genome_query)
-            parent_genome = mysqldb.parse_phage_table_data(parent_genome_data)
-            genomes_dict.update({cds.genome_id : parent_genome})
+    if verbose:
+        print("...Retrieving parent genomes...")
+    genome_ids = list(dict.fromkeys([cds.genome_id for cds in cds_list]))
+    genomes_dict = get_cds_parent_genomes(alchemist, genome_ids)
 
+    tasks = []
+    for cds in cds_list:
         if verbose:
             print(f"Converting {cds.id}...")
-        cds.genome_length = genomes_dict[cds.genome_id].length
-        cds.set_seqfeature()
-
-        record = cds_to_seqrecord(cds, genomes_dict[cds.genome_id])
-        seqrecords.append(record)
+        tasks.append((cds, genomes_dict[cds.genome_id]))
+    seqrecords = map_processes(convert_cds, tasks, processes)
 
     return seqrecords
 
+def convert_cds(task):
+    """Converts a Cds object to a SeqRecord.
+
+    :param task: Tuple of a Cds object and its parent Genome object.
+    :type task: tuple
+    :returns: Populated SeqRecord.
+    :rtype: SeqRecord
+    """
+    cds, parent_genome = task
+    cds.genome_length = parent_genome.length
+    cds.set_seqfeature()
+    return cds_to_seqrecord(cds, parent_genome)
+
+def get_cds_parent_genomes(alchemist, genome_ids):
+    """Retrieves the parent genome data used to annotate CDS SeqRecords.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param genome_ids: List of PhageIDs of parent genomes.
+    :type genome_ids: list[str]
+    :returns: Genome objects without sequences, keyed by PhageID.
+    :rtype: dict{str:Genome}
+    """
+    if not genome_ids:
+        return {}
+
+    columns = [querying.get_column(alchemist.metadata, column)
+                                            for column in CDS_PARENT_COLUMNS]
+    phage_id_obj = columns[0]
+
+    #Parent genomes are retrieved together, without their sequences.
+    parent_genome_query = querying.build_select(alchemist.graph, columns)
+    results = querying.execute(alchemist.engine, parent_genome_query,
+                               in_column=phage_id_obj, values=genome_ids)
+
+    genomes_dict = {}
+    for data_dict in results:
+        parent_genome = mysqldb.parse_phage_table_data(data_dict)
+        genomes_dict[data_dict["PhageID"]] = parent_genome
+
+    #CDS features without a parent genome are annotated with empty data.
+    for genome_id in genome_ids:
+        if genome_id not in genomes_dict:
+            genomes_dict[genome_id] = mysqldb.parse_phage_table_data({})
+
+    return genomes_dict
+
 def apply_filters(alchemist, table, filters, values=None,
                                                      verbose=False):
     """Applies MySQL WHERE clause filters using a Filter.
@@ -2,6 +2,9 @@
 
 import argparse
 import sys
+import time
+
+from sqlalchemy.exc import DBAPIError
 
 from pdm_utils.functions import basic
 from pdm_utils.functions import mysqldb, mysqldb_basic
@@ -13,12 +16,30 @@ from pdm_utils.classes.filter import Filter
 RESET_VERSION = "UPDATE version SET Version = 0"
 TARGET_TABLE = "phage"
 
+# Tables copied in subset mode, in foreign key dependency order, and the
+# conditions selecting rows reachable from the retained genomes.
+# {ref} and {new} are replaced with the reference and new database names,
+# and {ids} with the set of retained PhageIDs.
+SUBSET_TABLES = [
+    ("phage", "PhageID IN {ids}"),
+    ("pham", "PhamID IN (SELECT PhamID FROM `{ref}`.gene "
+             "WHERE PhageID IN {ids})"),
+    ("gene", "PhageID IN {ids}"),
+    ("trna", "PhageID IN {ids}"),
+    ("tmrna", "PhageID IN {ids}"),
+    ("domain", "HitID IN (SELECT HitID FROM `{ref}`.gene_domain "
+               "WHERE GeneID IN (SELECT GeneID FROM `{new}`.gene))"),
+    ("gene_domain", "GeneID IN (SELECT GeneID FROM `{new}`.gene)"),
+    ("version", None)
+    ]
+
 # TODO unittest.
 def main(unparsed_args_list):
     """Run main freeze database pipeline."""
     args = parse_args(unparsed_args_list)
     ref_database = args.database
     reset = args.reset
+    subset = args.subset
     new_database = args.new_database_name
     prefix = args.prefix
 
@@ -78,15 +99,19 @@ def main(unparsed_args_list):
     if result == 0:
         print(f"Reference database: {ref_database}")
         print(f"New database: {new_database}")
-        result = mysqldb_basic.copy_db(engine1, new_database)
+        if subset:
+            result = copy_subset(engine1, new_database, keep_set)
+        else:
+            result = mysqldb_basic.copy_db(engine1, new_database)
         if result == 0:
-            print(f"Deleting genomes...")
             alchemist2 = AlchemyHandler(database=new_database,
                                         username=engine1.url.username,
                                         password=engine1.url.password)
             alchemist2.connect(pipeline=True)
             engine2 = alchemist2.engine
-            engine2.execute(delete_stmt)
+            if not subset:
+                print(f"Deleting genomes...")
+                engine2.execute(delete_stmt)
             if reset:
                 engine2.execute(RESET_VERSION)
 
@@ -112,6 +137,10 @@ def parse_args(unparsed_args_list):
     new_database_name_help = "The new name of the frozen database"
     prefix_help = "The prefix used in the new name of the frozen database"
     reset_help = "Reset version to 0 in new database."
+    subset_help = (
+        "Create the new database schema and only copy data of the retained "
+        "genomes, instead of copying the entire database and "
+        "deleting genomes.")
 
     parser = argparse.ArgumentParser(description=freeze_help)
     parser.add_argument("database", type=str, help=database_help)
@@ -124,6 +153,8 @@ def parse_args(unparsed_args_list):
         help=prefix_help)
     parser.add_argument("-r", "--reset", action="store_true",
         default=False, help=reset_help)
+    parser.add_argument("-s", "--subset", action="store_true",
+        default=False, help=subset_help)
 
     # Assumed command line arg structure:
     # python3 -m pdm_utils.run <pipeline> <additional args...>
@@ -156,6 +187,84 @@ def get_prefix():
         prefix = input("Provide the custom database prefix: ")
     return prefix
 
+def construct_subset_stmts(ref_database, new_database, phage_id_set):
+    """Construct SQL statements to copy data of retained genomes.
+
+    :param ref_database: Name of the reference database.
+    :type ref_database: str
+    :param new_database: Name of the new database.
+    :type new_database: str
+    :param phage_id_set: PhageIDs of the retained genomes.
+    :type phage_id_set: set
+    :returns: List of (table, statement) tuples in dependency order.
+    :rtype: list
+    """
+    phage_id_string = construct_set_string(phage_id_set)
+    stmts = []
+    for table, condition in SUBSET_TABLES:
+        statement = (f"INSERT INTO `{new_database}`.{table} "
+                     f"SELECT * FROM `{ref_database}`.{table}")
+        if condition is not None:
+            condition = condition.format(ref=ref_database,
+                                         new=new_database,
+                                         ids=phage_id_string)
+            statement = statement + f" WHERE {condition}"
+        stmts.append((table, statement))
+    return stmts
+
+def copy_subset(engine, new_database, phage_id_set):
+    """Copy the schema and the data of retained genomes into a new database.
+
+    :param engine:
+        SQLAlchemy Engine object able to connect to the reference database.
+    :type engine: Engine
+    :param new_database: Name of the existing, empty database.
+    :type new_database: str
+    :param phage_id_set: PhageIDs of the retained genomes.
+    :type phage_id_set: set
+    :returns: Indicates if copy was successful (0) or failed (1).
+    :rtype: int
+    """
+    print("Copying retained genomes...")
+    start = time.time()
+    counts = []
+    try:
+        tables = mysqldb_basic.copy_schema(engine, new_database)
+        unknown = get_unknown_tables(tables)
+        if len(unknown) > 0:
+            print("Unable to copy a subset of the database, since there "
+                  "is no rule to select rows from the following "
+                  f"table(s): {', '.join(unknown)}")
+            return 1
+        stmts = construct_subset_stmts(engine.url.database, new_database,
+                                       phage_id_set)
+        with engine.begin() as connection:
+            for table, statement in stmts:
+                if table in tables:
+                    result = connection.execute(statement)
+                    counts.append((table, result.rowcount))
+    except DBAPIError as err:
+        print(f"Unable to copy {engine.url.database} to "
+              f"{new_database} in MySQL due to copying error:")
+        print(err.orig)
+        return 1
+
+    for table, count in counts:
+        print(f"{table}: {count} rows copied.")
+    print(f"Copy complete in {time.time() - start:.1f} seconds.")
+    return 0
+
+def get_unknown_tables(tables):
+    """Identify tables that cannot be copied in subset mode.
+
+    :param tables: Names of tables in the reference database.
+    :type tables: set
+    :returns: Sorted names of tables not listed in SUBSET_TABLES.
+    :rtype: list
+    """
+    subset_tables = {table for table, condition in SUBSET_TABLES}
+    return sorted(set(tables) - subset_tables)
+
 # TODO test.
 def construct_set_string(phage_id_set):
     """Convert set of phage_ids to string formatted for MySQL.
@@ -191,8 +300,9 @@ def add_filters(filter_obj, filters):
             # Catch the error if it is an invalid table.column
             try:
                 filter_obj.add(filter)
-            except:
+            except (ValueError, TypeError) as err:
                 print(f"Invalid filter: {filter}")
+                print(err)
                 errors += 1
     if errors > 0:
         print("Unable to create new database.")
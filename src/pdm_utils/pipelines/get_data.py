@@ -153,16 +153,14 @@ def main(unparsed_args_list):
              "DateLastModified, Accession, RetrieveRecord, Subcluster, "
              "AnnotationAuthor FROM phage")
 
-    mysqldb_genome_list =  mysqldb.parse_genome_data(engine=engine,
-                                                     phage_query=query,
-                                                     gnm_type="mysqldb")
-    engine.dispose()
     mysqldb_genome_dict = {}
-    for gnm in mysqldb_genome_list:
+    for gnm in mysqldb.iter_genome_data(engine=engine, phage_query=query,
+                                        gnm_type="mysqldb"):
         # With default date, the date of all records retrieved will be newer.
         if force:
             gnm.date = constants.EMPTY_DATE
         mysqldb_genome_dict[gnm.id] = gnm
+    engine.dispose()
 
     # Get data from PhagesDB
     if (args.updates or args.final or args.draft) is True:
@@ -4,6 +4,7 @@ into the MySQL database."""
 import argparse
 import csv
 from datetime import datetime, date
+import hashlib
 import logging
 import os
 import pathlib
@@ -16,6 +17,9 @@ import pdm_utils # to get version number.
 from pdm_utils.classes.alchemyhandler import AlchemyHandler
 from pdm_utils.classes import bundle
 from pdm_utils.classes import genomepair
+from pdm_utils.classes import toolcache
+from pdm_utils.classes.evalcache import EvalCache
+from pdm_utils.classes.sequencestore import SequenceStore
 from pdm_utils.constants import constants, eval_descriptions
 from pdm_utils.functions import basic
 from pdm_utils.functions import tickets
@@ -97,6 +101,18 @@ def main(unparsed_args_list):
     mysqldb.check_schema_compatibility(engine, "the import pipeline")
     logger.info(f"Schema version is compatible.")
 
+    if args.eval_cache:
+        eval_cache = EvalCache()
+        logger.info(f"Using evaluation cache: {eval_cache.cache_dir}.")
+    else:
+        eval_cache = None
+
+    if args.seq_store:
+        seq_store = SequenceStore()
+        logger.info(f"Using genome sequence store: {seq_store.path}.")
+    else:
+        seq_store = None
+
     # If everything checks out, pass on args for data input/output.
     data_io(engine=engine,
             genome_folder=args.input_folder,
@@ -107,7 +123,9 @@ def main(unparsed_args_list):
             description_field=args.description_field,
             eval_mode=args.eval_mode,
             output_folder=results_path,
-            interactive=args.interactive)
+            interactive=args.interactive,
+            eval_cache=eval_cache,
+            seq_store=seq_store)
 
     logger.info("Import complete.")
 
@@ -153,6 +171,13 @@ def parse_args(unparsed_args_list):
         "to store the gene description.")
     interactive_help = (
         "Indicates whether interactive evaluation of data is permitted.")
+    eval_cache_help = (
+        "Indicates whether evaluation results of flat files that have not "
+        "changed since a previous import run should be reused.")
+    seq_store_help = (
+        "Indicates whether genome sequences in the database should be "
+        "checked against a local snapshot, which is only refreshed when "
+        "the phage table changes.")
 
     parser = argparse.ArgumentParser(description=import_help)
     parser.add_argument("database", type=str, help=database_help)
@@ -182,6 +207,10 @@ def parse_args(unparsed_args_list):
         default=pathlib.Path(DEFAULT_OUTPUT_FOLDER), help=output_folder_help)
     parser.add_argument("-i", "--interactive", action="store_true",
         default=False, help=interactive_help)
+    parser.add_argument("-ec", "--eval_cache", action="store_true",
+        default=False, help=eval_cache_help)
+    parser.add_argument("-ss", "--seq_store", action="store_true",
+        default=False, help=seq_store_help)
 
     # Assumed command line arg structure:
     # python3 -m pdm_utils.run <pipeline> <additional args...>
@@ -196,7 +225,8 @@ def parse_args(unparsed_args_list):
 def data_io(engine=None, genome_folder=pathlib.Path(),
     import_table_file=pathlib.Path(), genome_id_field="", host_genus_field="",
     prod_run=False, description_field="", eval_mode="",
-    output_folder=pathlib.Path(), interactive=False):
+    output_folder=pathlib.Path(), interactive=False, eval_cache=None,
+    seq_store=None):
     """Set up output directories, log files, etc. for import.
 
     :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
@@ -225,6 +255,15 @@ def data_io(engine=None, genome_folder=pathlib.Path(),
         Indicates whether user is able to interact with genome evaluations
         at run time.
     :type interactive: bool
+    :param eval_cache:
+        Cache of evaluation results from previous import runs.
+        If None, all flat files are fully evaluated.
+    :type eval_cache: EvalCache
+    :param seq_store:
+        Local snapshot of the genome sequences in the database.
+        If None, sequences are retrieved from the database for every
+        flat file.
+    :type seq_store: SequenceStore
     """
 
     logger.info("Setting up environment.")
@@ -281,7 +320,9 @@ def data_io(engine=None, genome_folder=pathlib.Path(),
                         genome_id_field=genome_id_field,
                         host_genus_field=host_genus_field,
                         interactive=interactive,
-                        log_folder_paths_dict=log_folder_paths_dict)
+                        log_folder_paths_dict=log_folder_paths_dict,
+                        eval_cache=eval_cache,
+                        seq_store=seq_store)
     success_ticket_list = results_tuple[0]
     failed_ticket_list = results_tuple[1]
     success_filepath_list = results_tuple[2]
@@ -299,6 +340,18 @@ def data_io(engine=None, genome_folder=pathlib.Path(),
         f"{len(success_ticket_list)} ticket(s) successfully processed.",
         f"{len(success_filepath_list)} genome(s) successfully processed."
         ]
+    if eval_cache is not None:
+        cached_count = eval_cache.full_hits + eval_cache.partial_hits
+        summary.append(
+            f"{cached_count} bundle(s) evaluated from cache "
+            f"({eval_cache.full_hits} fully, "
+            f"{eval_cache.partial_hits} partially).")
+
+    tool_cache = toolcache.get_shared_cache()
+    if tool_cache.hits > 0 or tool_cache.misses > 0:
+        summary.append(
+            f"{tool_cache.hits} tool result(s) retrieved from cache, "
+            f"{tool_cache.misses} tool run(s) not cached.")
 
     headers = constants.IMPORT_TABLE_STRUCTURE["order"]
     if (len(success_ticket_list) > 0 or len(success_filepath_list) > 0):
@@ -498,7 +551,8 @@ def prepare_tickets(import_table_file=pathlib.Path(), eval_data_dict=None,
 def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
                               prod_run=False, genome_id_field="",
                               host_genus_field="", interactive=False,
-                              log_folder_paths_dict=None):
+                              log_folder_paths_dict=None, eval_cache=None,
+                              seq_store=None):
     """Process GenBank-formatted flat files and import tickets.
 
     :param ticket_dict:
@@ -517,6 +571,8 @@ def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
     :param log_folder_paths_dict:
         Dictionary indicating paths to success and fail folders.
     :type log_folder_paths_dict: dict
+    :param eval_cache: same as for data_io().
+    :param seq_store: same as for data_io().
     :returns:
         tuple of five objects
         WHERE
@@ -579,18 +635,24 @@ def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
         # database one file at a time, these sets are not static.
         # So these sets should be recomputed for every flat file evaluated.
         # Retrieve valid data from MySQL and merge with the valid external data.
-        mysql_ref_data = get_mysql_reference_sets(engine)
+        mysql_ref_data = get_mysql_reference_sets(engine, seq_store=seq_store)
         ref_data = basic.merge_set_dicts(external_ref_data, mysql_ref_data)
         logger.info(f"Checking file: {filepath.name}.")
-        run_checks(bndl,
-                   accession_set=ref_data["accession_set"],
-                   phage_id_set=ref_data["phage_id_set"],
-                   seq_set=ref_data["seq_set"],
-                   host_genus_set=ref_data["host_genera_set"],
-                   cluster_set=ref_data["cluster_set"],
-                   subcluster_set=ref_data["subcluster_set"],
-                   file_ref=file_ref, ticket_ref=ticket_ref,
-                   retrieve_ref=retrieve_ref, retain_ref=retain_ref)
+        if eval_cache is None:
+            run_checks(bndl,
+                       accession_set=ref_data["accession_set"],
+                       phage_id_set=ref_data["phage_id_set"],
+                       seq_set=ref_data["seq_set"],
+                       host_genus_set=ref_data["host_genera_set"],
+                       cluster_set=ref_data["cluster_set"],
+                       subcluster_set=ref_data["subcluster_set"],
+                       file_ref=file_ref, ticket_ref=ticket_ref,
+                       retrieve_ref=retrieve_ref, retain_ref=retain_ref)
+        else:
+            run_cached_checks(bndl, eval_cache, filepath=filepath,
+                              ref_data=ref_data,
+                              file_ref=file_ref, ticket_ref=ticket_ref,
+                              retrieve_ref=retrieve_ref, retain_ref=retain_ref)
 
         review_bundled_objects(bndl, interactive=interactive)
 
@@ -603,6 +665,12 @@ def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
         result = import_into_db(bndl, engine=engine,
                                 gnm_key=file_ref, prod_run=prod_run)
         bndl.check_for_errors()
+
+        # Record the imported sequence in the snapshot, so that it does not
+        # need to be rewritten from the database for the next flat file.
+        if result and prod_run and seq_store is not None:
+            import_gnm = bndl.genome_dict[file_ref]
+            seq_store.update(engine, {import_gnm.id: import_gnm.seq})
         dict_of_eval_lists = bndl.get_evaluations()
         logfile_path = get_logfile_path(bndl, paths_dict=log_folder_paths_dict,
                                         filepath=filepath, file_ref=file_ref)
@@ -619,6 +687,9 @@ def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
         bundle_count += 1
         file_count += 1
 
+    if seq_store is not None:
+        seq_store.flush()
+
     # Tickets were popped off the ticket dictionary as they were matched
     # to flat files. If there are any tickets left, errors need to be counted.
     if len(ticket_dict.keys()) > 0:
@@ -670,10 +741,11 @@ def get_phagesdb_reference_sets():
     return dict
 
 
-def get_mysql_reference_sets(engine):
+def get_mysql_reference_sets(engine, seq_store=None):
     """Get multiple sets of data from the MySQL database for reference.
 
     :param engine: same as for data_io().
+    :param seq_store: same as for data_io().
     :returns:
         Dictionary of unique PhageIDs, clusters, subclusters,
         host genera, accessions, and sequences stored in the MySQL database.
@@ -689,7 +761,7 @@ def get_mysql_reference_sets(engine):
     subclusters = mysqldb_basic.get_distinct(engine, "phage", "Subcluster",
                                             null="none")
     host_genera = mysqldb_basic.get_distinct(engine, "phage", "HostGenus")
-    seqs = mysqldb.create_seq_set(engine)
+    seqs = mysqldb.create_seq_set(engine, seq_store=seq_store)
     dict = {"phage_id_set": phage_ids,
             "accession_set": accessions,
             "seq_set": seqs,
@@ -879,7 +951,8 @@ def prepare_bundle(filepath=pathlib.Path(), ticket_dict={}, engine=None,
 def run_checks(bndl, accession_set=set(), phage_id_set=set(),
                seq_set=set(), host_genus_set=set(), cluster_set=set(),
                subcluster_set=set(), file_ref="", ticket_ref="",
-               retrieve_ref="", retain_ref=""):
+               retrieve_ref="", retain_ref="", genome_checks=True,
+               feature_checks=True):
     """Run checks on the different types of data in a Bundle object.
 
     :param bndl: A pdm_utils Bundle object containing bundled data.
@@ -900,30 +973,48 @@ def run_checks(bndl, accession_set=set(), phage_id_set=set(),
     :param ticket_ref: same as for prepare_bundle().
     :param retrieve_ref: same as for prepare_bundle().
     :param retain_ref: same as for prepare_bundle().
+    :param genome_checks:
+        Indicates whether bundle-, genome-, and genome pair-level
+        checks should be run.
+    :type genome_checks: bool
+    :param feature_checks:
+        Indicates whether checks of the features of the 'file_ref' genome
+        should be run.
+    :type feature_checks: bool
     """
     logger.info("Checking data.")
-    check_bundle(bndl, ticket_ref=ticket_ref, file_ref=file_ref,
-                 retrieve_ref=retrieve_ref, retain_ref=retain_ref)
+    if genome_checks:
+        check_bundle(bndl, ticket_ref=ticket_ref, file_ref=file_ref,
+                     retrieve_ref=retrieve_ref, retain_ref=retain_ref)
     tkt = bndl.ticket
     if tkt is not None:
         eval_flags = tkt.eval_flags
         gnm_pair_key = file_ref + "_" + retain_ref
-        if (tkt.type == "replace" and
+        if (genome_checks and tkt.type == "replace" and
                 gnm_pair_key in bndl.genome_pair_dict.keys()):
             genome_pair = bndl.genome_pair_dict[gnm_pair_key]
             compare_genomes(genome_pair, eval_flags)
 
         if file_ref in bndl.genome_dict.keys():
             gnm = bndl.genome_dict[file_ref]
-            check_genome(gnm, tkt.type, eval_flags,
-                         accession_set=accession_set, phage_id_set=phage_id_set,
-                         seq_set=seq_set, host_genus_set=host_genus_set,
-                         cluster_set=cluster_set, subcluster_set=subcluster_set)
+            if genome_checks:
+                check_genome(gnm, tkt.type, eval_flags,
+                             accession_set=accession_set,
+                             phage_id_set=phage_id_set,
+                             seq_set=seq_set, host_genus_set=host_genus_set,
+                             cluster_set=cluster_set,
+                             subcluster_set=subcluster_set)
+
+        if feature_checks and file_ref in bndl.genome_dict.keys():
+            gnm = bndl.genome_dict[file_ref]
 
-            # Check each type of feature.
+            # Check each type of feature. Expected CDS translations are
+            # generated for the entire genome at once.
+            translations = gnm.translate_cds_features()
             for x in range(len(gnm.cds_features)):
                 check_cds(gnm.cds_features[x], eval_flags,
-                          description_field=tkt.description_field)
+                          description_field=tkt.description_field,
+                          translation=translations[x][0])
 
             for x in range(len(gnm.trna_features)):
                 check_trna(gnm.trna_features[x], eval_flags)
@@ -935,11 +1026,233 @@ def run_checks(bndl, accession_set=set(), phage_id_set=set(),
                 check_source(gnm.source_features[x], eval_flags,
                              host_genus=gnm.host_genus)
 
-        if retain_ref in bndl.genome_dict.keys():
+        if genome_checks and retain_ref in bndl.genome_dict.keys():
             gnm2 = bndl.genome_dict[retain_ref]
             check_retain_genome(gnm2, tkt.type, eval_flags)
 
 
+def run_cached_checks(bndl, eval_cache, filepath=None, ref_data=None,
+                      file_ref="", ticket_ref="", retrieve_ref="",
+                      retain_ref=""):
+    """Run checks on a Bundle object, reusing cached evaluation results.
+
+    Feature-level evaluations are reused if the flat file, ticket, and
+    evaluation flags are unchanged since they were cached. Bundle-,
+    genome-, and genome pair-level evaluations are also reused if the
+    reference data sets and genome data from other sources are unchanged.
+    Otherwise, only those checks are re-run.
+
+    :param bndl: same as for run_checks().
+    :param eval_cache: same as for data_io().
+    :param filepath: Path to the flat file from which the bundle was prepared.
+    :type filepath: Path
+    :param ref_data:
+        Dictionary of reference data sets, as returned by
+        get_mysql_reference_sets().
+    :type ref_data: dict
+    :param file_ref: same as for prepare_bundle().
+    :param ticket_ref: same as for prepare_bundle().
+    :param retrieve_ref: same as for prepare_bundle().
+    :param retain_ref: same as for prepare_bundle().
+    :returns:
+        Indicates how the bundle was evaluated: 'full' if all evaluations
+        were retrieved from the cache, 'partial' if only feature
+        evaluations were retrieved, and 'miss' if no evaluations were
+        retrieved.
+    :rtype: str
+    """
+    if ref_data is None:
+        ref_data = {}
+    ref_sets = {"accession_set": ref_data.get("accession_set", set()),
+                "phage_id_set": ref_data.get("phage_id_set", set()),
+                "seq_set": ref_data.get("seq_set", set()),
+                "host_genus_set": ref_data.get("host_genera_set", set()),
+                "cluster_set": ref_data.get("cluster_set", set()),
+                "subcluster_set": ref_data.get("subcluster_set", set())}
+    refs = {"file_ref": file_ref, "ticket_ref": ticket_ref,
+            "retrieve_ref": retrieve_ref, "retain_ref": retain_ref}
+
+    feature_objs, genome_objs = get_evaluated_objects(bndl, file_ref)
+    feature_key, genome_key = get_eval_cache_keys(bndl, filepath, ref_data,
+                                                  file_ref=file_ref)
+
+    # Evaluations that were created before checking (e.g. while parsing
+    # the ticket) are not cached.
+    eval_counts = {}
+    for objs in (feature_objs, genome_objs):
+        for path, obj in objs.items():
+            eval_counts[path] = len(obj.evaluations)
+
+    entry = None
+    if feature_key is not None:
+        entry = eval_cache.get_entry(feature_key)
+
+    if entry is None:
+        logger.info("No cached evaluations are available.")
+        run_checks(bndl, **ref_sets, **refs)
+        status = "miss"
+    else:
+        restore_evaluations(feature_objs, entry["features"])
+        if entry["genome_key"] == genome_key:
+            logger.info("Retrieved all evaluations from cache.")
+            restore_evaluations(genome_objs, entry["genomes"])
+            status = "full"
+            eval_cache.full_hits += 1
+        else:
+            logger.info("Retrieved feature evaluations from cache.")
+            run_checks(bndl, **ref_sets, **refs, feature_checks=False)
+            status = "partial"
+            eval_cache.partial_hits += 1
+
+    if feature_key is not None and status != "full":
+        entry = {"genome_key": genome_key,
+                 "features": collect_evaluations(feature_objs, eval_counts),
+                 "genomes": collect_evaluations(genome_objs, eval_counts)}
+        eval_cache.put_entry(feature_key, entry)
+    return status
+
+
+def get_evaluated_objects(bndl, file_ref=""):
+    """Get all objects in a Bundle that store evaluations.
+
+    :param bndl: same as for run_checks().
+    :param file_ref: same as for prepare_bundle().
+    :returns:
+        tuple of two dictionaries of objects keyed by a path that
+        identifies each object within the bundle
+        WHERE
+        [0] contains the features of the 'file_ref' genome.
+        [1] contains the bundle, ticket, genomes, and genome pairs.
+    :rtype: tuple
+    """
+    feature_objs = {}
+    genome_objs = {"bundle": bndl}
+    if bndl.ticket is not None:
+        genome_objs["ticket"] = bndl.ticket
+
+    for key, gnm in bndl.genome_dict.items():
+        genome_objs[f"genome_{key}"] = gnm
+
+    # Features are identified by their index, since the same flat file
+    # always produces the same features in the same order.
+    if file_ref in bndl.genome_dict.keys():
+        gnm = bndl.genome_dict[file_ref]
+        feature_lists = {"src": gnm.source_features,
+                         "cds": gnm.cds_features,
+                         "trna": gnm.trna_features,
+                         "tmrna": gnm.tmrna_features}
+        for prefix, feature_list in feature_lists.items():
+            for x in range(len(feature_list)):
+                feature_objs[f"{prefix}_{x}"] = feature_list[x]
+
+    for key, genome_pair in bndl.genome_pair_dict.items():
+        genome_objs[f"genome_pair_{key}"] = genome_pair
+
+    return (feature_objs, genome_objs)
+
+
+def get_eval_cache_keys(bndl, filepath, ref_data, file_ref=""):
+    """Compute the keys used to store evaluations of a Bundle object.
+
+    :param bndl: same as for run_checks().
+    :param filepath: same as for run_cached_checks().
+    :param ref_data: same as for run_cached_checks().
+    :param file_ref: same as for prepare_bundle().
+    :returns:
+        tuple of two keys
+        WHERE
+        [0] identifies the flat file, ticket, and evaluation settings,
+        or is None if the bundle can't be cached.
+        [1] identifies the reference data and other genomes in the bundle.
+    :rtype: tuple
+    """
+    tkt = bndl.ticket
+    if (filepath is None or tkt is None
+            or file_ref not in bndl.genome_dict.keys()):
+        return (None, None)
+
+    try:
+        with open(filepath, "rb") as fh:
+            file_digest = hashlib.sha256(fh.read()).hexdigest()
+    except OSError:
+        return (None, None)
+
+    # Feature checks depend on the flat file, the ticket, the
+    # evaluation flags, and on data added to the genome after parsing.
+    gnm = bndl.genome_dict[file_ref]
+    descriptions = [cds_ftr.description for cds_ftr in gnm.cds_features]
+    feature_data = [VERSION, file_digest, tkt.type, tkt.eval_mode,
+                    tkt.description_field, sorted(tkt.eval_flags.items()),
+                    sorted(tkt.data_dict.items()), gnm.host_genus,
+                    descriptions]
+    feature_key = _digest(repr(feature_data))
+
+    # Genome checks also depend on the reference data and on the
+    # data of all genomes in the bundle. Genome sequences are only checked
+    # for membership in the set of database sequences, so only membership
+    # is recorded instead of hashing every sequence in the database.
+    genome_data = []
+    for key in sorted(ref_data.keys()):
+        if key == "seq_set":
+            continue
+        values = sorted(_digest(str(value)) for value in ref_data[key])
+        genome_data.append((key, values))
+    seq_set = ref_data.get("seq_set", set())
+    for key in sorted(bndl.genome_dict.keys()):
+        other_gnm = bndl.genome_dict[key]
+        genome_data.append((key, other_gnm.id, other_gnm.name,
+                            _digest(str(other_gnm.seq)),
+                            other_gnm.seq in seq_set, other_gnm.length,
+                            other_gnm.host_genus, other_gnm.cluster,
+                            other_gnm.subcluster, other_gnm.accession,
+                            other_gnm.annotation_status,
+                            other_gnm.annotation_author,
+                            other_gnm.retrieve_record,
+                            other_gnm.translation_table, str(other_gnm.date)))
+    genome_data.append(sorted(bndl.genome_pair_dict.keys()))
+    genome_key = _digest(repr(genome_data))
+
+    return (feature_key, genome_key)
+
+
+def collect_evaluations(objs, eval_counts):
+    """Collect evaluations added to objects since they were counted.
+
+    :param objs: Dictionary of objects, as returned by get_evaluated_objects().
+    :type objs: dict
+    :param eval_counts:
+        Dictionary of the number of evaluations of each object before
+        checking.
+    :type eval_counts: dict
+    :returns: Dictionary of evaluation lists.
+    :rtype: dict
+    """
+    dict_of_lists = {}
+    for path, obj in objs.items():
+        new_evals = obj.evaluations[eval_counts.get(path, 0):]
+        if len(new_evals) > 0:
+            dict_of_lists[path] = new_evals
+    return dict_of_lists
+
+
+def restore_evaluations(objs, dict_of_lists):
+    """Add cached evaluations to objects.
+
+    :param objs: Dictionary of objects, as returned by get_evaluated_objects().
+    :type objs: dict
+    :param dict_of_lists: Dictionary of evaluation lists.
+    :type dict_of_lists: dict
+    """
+    for path, evl_list in dict_of_lists.items():
+        if path in objs.keys():
+            objs[path].evaluations.extend(evl_list)
+
+
+def _digest(value):
+    """Compute a hexadecimal digest of a string."""
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
 def review_bundled_objects(bndl, interactive=False):
     """Review all evaluations of all bundled objects.
 
@@ -1634,7 +1947,8 @@ def check_source(src_ftr, eval_flags, host_genus=""):
                                     fail="warning", eval_def=EDD["SRC-EVAL-004"])
 
 
-def check_cds(cds_ftr, eval_flags, description_field="product"):
+def check_cds(cds_ftr, eval_flags, description_field="product",
+              translation=None):
     """Check a Cds object for errors.
 
     :param cds_ftr: A pdm_utils Cds object.
@@ -1643,6 +1957,10 @@ def check_cds(cds_ftr, eval_flags, description_field="product"):
     :type eval_flags: dicts
     :param description_field: Description field to check against.
     :type description_field: str
+    :param translation:
+        Expected translation. If not provided, it is generated from the
+        CDS nucleotide sequence.
+    :type translation: Seq
     """
     logger.info(f"Checking CDS feature: {cds_ftr.id}.")
 
@@ -1652,7 +1970,8 @@ def check_cds(cds_ftr, eval_flags, description_field="product"):
     cds_ftr.check_amino_acids(check_set=constants.PROTEIN_ALPHABET,
                               fail="warning", eval_id="CDS-EVAL-001",
                               eval_def=EDD["CDS-EVAL-001"])
-    cds_ftr.check_translation(eval_id="CDS-EVAL-002",
+    cds_ftr.check_translation(translation=translation,
+                              eval_id="CDS-EVAL-002",
                               eval_def=EDD["CDS-EVAL-002"])
     cds_ftr.check_attribute("translation_table", {11},
                             expect=True, eval_id="CDS-EVAL-004", fail="warning",
@@ -3,8 +3,11 @@ It verifies a valid pipeline is selected,
 then passes all command line arguments to the main pipeline module.
 """
 import argparse
+import os
 import sys
 
+from pdm_utils.classes import alchemyhandler
+from pdm_utils.pipelines import clear_cache
 from pdm_utils.pipelines import compare_db
 from pdm_utils.pipelines import convert_db
 from pdm_utils.pipelines import export_db
@@ -21,12 +24,15 @@ from pdm_utils.pipelines import review
 from pdm_utils.pipelines import update_field
 
 VALID_PIPELINES = {
-    "compare", "convert", "export", "find_domains", "freeze", "get_data",
-    "get_db", "get_gb_records", "import", "phamerate", "push", "resubmit",
-    "review", "update"}
+    "clear_cache", "compare", "convert", "export", "find_domains", "freeze",
+    "get_data", "get_db", "get_gb_records", "import", "phamerate", "push",
+    "resubmit", "review", "update"}
 
 def main(unparsed_args):
     """Run a pdm_utils pipeline."""
+    unparsed_args = parse_profile_args(unparsed_args)
+    unparsed_args = parse_schema_args(unparsed_args)
+    unparsed_args = parse_pool_args(unparsed_args)
     args = parse_args(unparsed_args)
 
     if args.pipeline == "get_data":
@@ -57,6 +63,8 @@ def main(unparsed_args):
         resubmit.main(unparsed_args)
     elif args.pipeline == "review":
         review.main(unparsed_args)
+    elif args.pipeline == "clear_cache":
+        clear_cache.main(unparsed_args)
     else:
         pass
     print("\n\n\nPipeline completed")
@@ -77,3 +85,112 @@ def parse_args(unparsed_args):
     # sys.argv:      [0]            [1]         [2...]
     args = parser.parse_args(unparsed_args[1:2])
     return args
+
+def parse_profile_args(unparsed_args):
+    """Parse the query profiling args accepted by every pipeline.
+
+    Profiling settings are stored in environment variables read by
+    AlchemyHandler objects, so they also apply to subprocesses.
+
+    :param unparsed_args: Command line args.
+    :type unparsed_args: list
+    :returns: Command line args without the profiling args.
+    :rtype: list
+    """
+    PROFILE_HELP = ("Record the SQL statements executed by the pipeline and "
+                    "report the most expensive ones at exit. Profiling can "
+                    f"also be enabled with the {alchemyhandler.PROFILE_ENV} "
+                    "environment variable.")
+    PROFILE_REPORT_HELP = ("Path to the query profile report, written as CSV "
+                           "if it has a '.csv' suffix and as JSON otherwise.")
+    PROFILE_EXPLAIN_HELP = ("Number of the slowest reported statements "
+                            "for which MySQL EXPLAIN output is included.")
+
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--profile", action="store_true", help=PROFILE_HELP)
+    parser.add_argument("--profile_report", type=str,
+                        help=PROFILE_REPORT_HELP)
+    parser.add_argument("--profile_explain", type=int,
+                        help=PROFILE_EXPLAIN_HELP)
+
+    args, remaining_args = parser.parse_known_args(unparsed_args[2:])
+
+    if args.profile:
+        os.environ[alchemyhandler.PROFILE_ENV] = "1"
+    if args.profile_report is not None:
+        os.environ[alchemyhandler.PROFILE_REPORT_ENV] = args.profile_report
+    if args.profile_explain is not None:
+        os.environ[alchemyhandler.PROFILE_EXPLAIN_ENV] = \
+                                                str(args.profile_explain)
+
+    return unparsed_args[:2] + remaining_args
+
+def parse_schema_args(unparsed_args):
+    """Parse the schema cache args accepted by every pipeline.
+
+    The refresh setting is stored in an environment variable read by
+    AlchemyHandler objects, so it also applies to subprocesses.
+
+    :param unparsed_args: Command line args.
+    :type unparsed_args: list
+    :returns: Command line args without the schema cache args.
+    :rtype: list
+    """
+    REFRESH_SCHEMA_HELP = ("Reflect the database schema instead of loading "
+                           "it from the schema cache, and replace the cached "
+                           "schema. A refresh can also be forced with the "
+                           f"{alchemyhandler.REFRESH_SCHEMA_ENV} environment "
+                           "variable.")
+
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--refresh_schema", action="store_true",
+                        help=REFRESH_SCHEMA_HELP)
+
+    args, remaining_args = parser.parse_known_args(unparsed_args[2:])
+
+    if args.refresh_schema:
+        os.environ[alchemyhandler.REFRESH_SCHEMA_ENV] = "1"
+
+    return unparsed_args[:2] + remaining_args
+
+def parse_pool_args(unparsed_args):
+    """Parse the connection pool args accepted by every pipeline.
+
+    Pool settings are stored in environment variables read by
+    AlchemyHandler objects, so they also apply to subprocesses.
+
+    :param unparsed_args: Command line args.
+    :type unparsed_args: list
+    :returns: Command line args without the connection pool args.
+    :rtype: list
+    """
+    POOL_SIZE_HELP = ("Number of MySQL connections kept open in the "
+                      "connection pool, which also limits the number of "
+                      "queries run concurrently.")
+    MAX_OVERFLOW_HELP = ("Number of MySQL connections that can be opened "
+                         "in addition to the pool size.")
+    POOL_RECYCLE_HELP = ("Number of seconds after which pooled MySQL "
+                         "connections are replaced. This should be lower "
+                         "than the MySQL wait_timeout.")
+    NO_POOL_PRE_PING_HELP = ("Do not test pooled MySQL connections before "
+                             "they are used.")
+
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--pool_size", type=int, help=POOL_SIZE_HELP)
+    parser.add_argument("--max_overflow", type=int, help=MAX_OVERFLOW_HELP)
+    parser.add_argument("--pool_recycle", type=int, help=POOL_RECYCLE_HELP)
+    parser.add_argument("--no_pool_pre_ping", action="store_true",
+                        help=NO_POOL_PRE_PING_HELP)
+
+    args, remaining_args = parser.parse_known_args(unparsed_args[2:])
+
+    if args.pool_size is not None:
+        os.environ[alchemyhandler.POOL_SIZE_ENV] = str(args.pool_size)
+    if args.max_overflow is not None:
+        os.environ[alchemyhandler.MAX_OVERFLOW_ENV] = str(args.max_overflow)
+    if args.pool_recycle is not None:
+        os.environ[alchemyhandler.POOL_RECYCLE_ENV] = str(args.pool_recycle)
+    if args.no_pool_pre_ping:
+        os.environ[alchemyhandler.POOL_PRE_PING_ENV] = "0"
+
+    return unparsed_args[:2] + remaining_args
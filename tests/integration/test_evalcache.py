@@ -0,0 +1,55 @@
+"""Integration tests for the EvalCache class."""
+
+from pathlib import Path
+import tempfile
+import unittest
+from pdm_utils.classes.evalcache import EvalCache
+from pdm_utils.classes.evaluation import Evaluation
+
+TMPDIR_PREFIX = "pdm_utils_tests_evalcache_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location.
+TMPDIR_BASE = "/tmp"
+
+
+class TestEvalCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory(prefix=TMPDIR_PREFIX,
+                                                  dir=TMPDIR_BASE)
+        self.cache = EvalCache(cache_dir=Path(self.tmpdir.name, "cache"))
+        self.evl = Evaluation(id="CDS-EVAL-001", definition="Check CDS.",
+                              result="The CDS is correct.", status="correct")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+
+
+
+    def test_get_entry_1(self):
+        """Verify None is returned for an uncached key."""
+        self.assertIsNone(self.cache.get_entry("abcd"))
+
+    def test_get_entry_2(self):
+        """Verify stored evaluations are returned for a cached key."""
+        entry = {"genome_key": "efgh", "features": {"cds_0": [self.evl]},
+                 "genomes": {}}
+        self.cache.put_entry("abcd", entry)
+        cached_entry = self.cache.get_entry("abcd")
+        cached_evl = cached_entry["features"]["cds_0"][0]
+        with self.subTest():
+            self.assertEqual(cached_entry["genome_key"], "efgh")
+        with self.subTest():
+            self.assertEqual(cached_entry["genomes"], {})
+        with self.subTest():
+            self.assertEqual(cached_evl.id, self.evl.id)
+        with self.subTest():
+            self.assertEqual(cached_evl.definition, self.evl.definition)
+        with self.subTest():
+            self.assertEqual(cached_evl.result, self.evl.result)
+        with self.subTest():
+            self.assertEqual(cached_evl.status, self.evl.status)
+
+
+if __name__ == '__main__':
+    unittest.main()
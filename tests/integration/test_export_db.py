@@ -261,6 +261,51 @@ class TestFileExport(unittest.TestCase):
                 self.assertTrue(flat_file_path.is_file())
 
                 shutil.rmtree(str(self.export_test_dir))
+
+    def test_execute_export_13(self):
+        """Verify execute_export() compress parameter functions as expected.
+        """
+        export_db.execute_export(self.alchemist, self.test_dir,
+                                 self.export_test_dir.name, "fasta",
+                                 compress="bgzf")
+
+        flat_file_path = self.export_test_dir.joinpath("Trixie.fasta.gz")
+        fai_file_path = self.export_test_dir.joinpath("Trixie.fasta.gz.fai")
+        gzi_file_path = self.export_test_dir.joinpath("Trixie.fasta.gz.gzi")
+
+        self.assertTrue(flat_file_path.is_file())
+        self.assertTrue(fai_file_path.is_file())
+        self.assertTrue(gzi_file_path.is_file())
+        self.assertFalse(self.export_test_dir.joinpath(
+                                                "Trixie.fasta").is_file())
+
+    def test_execute_export_14(self):
+        """Verify execute_export() incremental parameter functions as expected.
+        """
+        export_db.execute_export(self.alchemist, self.test_dir,
+                                 self.export_test_dir.name, "fasta",
+                                 incremental=self.export_test_dir)
+
+        manifest_path = self.export_test_dir.joinpath(export_db.MANIFEST_NAME)
+        Trixie_file_path = self.export_test_dir.joinpath("Trixie.fasta")
+        with self.subTest():
+            self.assertTrue(manifest_path.is_file())
+        with self.subTest():
+            self.assertTrue(Trixie_file_path.is_file())
+
+        modified_time = Trixie_file_path.stat().st_mtime_ns
+        filters = "phage.PhageID!=D29"
+        export_db.execute_export(self.alchemist, self.test_dir,
+                                 self.export_test_dir.name, "fasta",
+                                 filters=filters,
+                                 incremental=self.export_test_dir)
+
+        with self.subTest():
+            self.assertEqual(Trixie_file_path.stat().st_mtime_ns,
+                             modified_time)
+        with self.subTest():
+            self.assertFalse(self.export_test_dir.joinpath(
+                                                    "D29.fasta").is_file())
  
 if __name__ == "__main__":
     unittest.main()
@@ -227,5 +227,61 @@ class TestFreeze(unittest.TestCase):
         with self.subTest():
             self.assertEqual(version[0]["Version"], 0)
 
+    @patch("pdm_utils.classes.alchemyhandler.getpass")
+    def test_main_14(self, getpass_mock):
+        """Verify frozen database is created in subset mode with only
+        the features of one 'final' genome."""
+        getpass_mock.side_effect = [USER, PWD]
+        stmt = create_update("phage", "Status", "final", "Trixie")
+        test_db_utils.execute(stmt)
+        self.unparsed_args.extend(["-f", "phage.Status!=draft", "-s"])
+        run.main(self.unparsed_args)
+        count = test_db_utils.get_data(COUNT_PHAGE, db=DB2)
+        genes = test_db_utils.get_data("SELECT DISTINCT PhageID FROM gene",
+                                       db=DB2)
+        version = test_db_utils.get_data(test_db_utils.version_table_query,
+                                         db=DB2)
+        with self.subTest():
+            self.assertEqual(count[0]["count"], 1)
+        with self.subTest():
+            self.assertEqual({row["PhageID"] for row in genes}, {"Trixie"})
+        with self.subTest():
+            self.assertEqual(version[0]["Version"], 1)
+
+    @patch("pdm_utils.classes.alchemyhandler.getpass")
+    def test_main_15(self, getpass_mock):
+        """Verify frozen database is created in subset mode with all
+        genomes when no filters are provided."""
+        getpass_mock.side_effect = [USER, PWD]
+        self.unparsed_args.append("-s")
+        run.main(self.unparsed_args)
+        count1 = test_db_utils.get_data(COUNT_PHAGE, db=DB)
+        count2 = test_db_utils.get_data(COUNT_PHAGE, db=DB2)
+        self.assertEqual(count1[0]["count"], count2[0]["count"])
+
+
+
+
+class TestFreezeFunctions(unittest.TestCase):
+
+    def test_construct_subset_stmts_1(self):
+        """Verify subset statements are constructed in dependency order."""
+        stmts = freeze_db.construct_subset_stmts(DB, DB2, {"Trixie"})
+        tables = [table for table, statement in stmts]
+        with self.subTest():
+            self.assertTrue(tables.index("pham") < tables.index("gene"))
+        with self.subTest():
+            self.assertTrue(tables.index("domain") <
+                            tables.index("gene_domain"))
+        with self.subTest():
+            self.assertEqual(stmts[0][1],
+                             f"INSERT INTO `{DB2}`.phage "
+                             f"SELECT * FROM `{DB}`.phage "
+                             "WHERE PhageID IN ('Trixie')")
+        with self.subTest():
+            self.assertEqual(stmts[-1][1],
+                             f"INSERT INTO `{DB2}`.version "
+                             f"SELECT * FROM `{DB}`.version")
+
 if __name__ == '__main__':
     unittest.main()
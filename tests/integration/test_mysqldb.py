@@ -279,6 +279,32 @@ class TestMysqldbFunctions1(unittest.TestCase):
         with self.subTest():
             self.assertEqual(genome_dict["L5"].tmrna_features[0].id, "L5_1")
 
+    def test_parse_genome_data_5(self):
+        """Verify that genome sequences are retrieved in one batch the
+        first time they are accessed when lazy_seq is True."""
+        query = "SELECT PhageID, Length FROM phage"
+        genome_list = mysqldb.parse_genome_data(self.engine,
+                                                phage_query=query,
+                                                lazy_seq=True)
+        genome_dict = {}
+        for gnm in genome_list:
+            genome_dict[gnm.id] = gnm
+        loader = genome_dict["Trixie"]._seq_loader
+        with self.subTest():
+            self.assertEqual(loader.queries, 0)
+        with self.subTest():
+            self.assertEqual(genome_dict["Trixie"].seq, "AATT")
+        with self.subTest():
+            self.assertEqual(genome_dict["Trixie"].length, 4)
+        with self.subTest():
+            self.assertIsNotNone(genome_dict["D29"]._seq_loader)
+        with self.subTest():
+            self.assertIsNone(genome_dict["Trixie"]._seq_loader)
+        for gnm in genome_list:
+            gnm.seq
+        with self.subTest():
+            self.assertEqual(loader.queries, 1)
+
 
 
 
@@ -262,9 +262,51 @@ class TestMysqldbBasic2(unittest.TestCase):
         # Raise an error instead of calling pipe_commands() so that
         # the exception block is entered.
         pc_mock.side_effect = ValueError("Error raised")
-        result = mysqldb_basic.copy_db(self.engine, DB2)
+        result = mysqldb_basic.copy_db(self.engine, DB2, native=False)
         self.assertEqual(result, 1)
 
+    @patch("pdm_utils.functions.mysqldb_basic.pipe_commands")
+    def test_copy_db_5(self, pc_mock):
+        """Verify data is copied within MySQL without piping mysqldump
+        into mysql."""
+        result = mysqldb_basic.copy_db(self.engine, DB2)
+        after_v1 = test_db_utils.get_data(test_db_utils.version_table_query)
+        after_v2 = test_db_utils.get_data(test_db_utils.version_table_query, db=DB2)
+        with self.subTest():
+            self.assertEqual(result, 0)
+        with self.subTest():
+            self.assertEqual(after_v1[0]["Version"], after_v2[0]["Version"])
+        with self.subTest():
+            pc_mock.assert_not_called()
+
+    @patch("pdm_utils.functions.mysqldb_basic.copy_db_native")
+    @patch("pdm_utils.functions.mysqldb_basic.pipe_commands")
+    def test_copy_db_6(self, pc_mock, native_mock):
+        """Verify mysqldump is piped into mysql if the native copy fails."""
+        native_mock.return_value = 1
+        result = mysqldb_basic.copy_db(self.engine, DB2)
+        with self.subTest():
+            self.assertEqual(result, 0)
+        with self.subTest():
+            pc_mock.assert_called()
+
+
+
+
+    def test_copy_db_native_1(self):
+        """Verify all tables and rows are copied."""
+        result = mysqldb_basic.copy_db_native(self.engine, DB2, threads=2)
+        tables1 = mysqldb_basic.get_tables(self.engine, DB)
+        tables2 = mysqldb_basic.get_tables(self.engine, DB2)
+        version = test_db_utils.get_data(test_db_utils.version_table_query,
+                                         db=DB2)
+        with self.subTest():
+            self.assertEqual(result, 0)
+        with self.subTest():
+            self.assertEqual(tables1, tables2)
+        with self.subTest():
+            self.assertEqual(version[0]["Version"], 1)
+
 
 
 
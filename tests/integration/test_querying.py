@@ -4,6 +4,8 @@ import unittest
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
+import tempfile
+import threading
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -12,12 +14,14 @@ from networkx import shortest_path
 from sqlalchemy import Column
 from sqlalchemy import and_
 from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy import MetaData
 from sqlalchemy import or_
 from sqlalchemy import select
 from sqlalchemy.exc import InternalError
 from sqlalchemy.ext.automap import automap_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import func
 from sqlalchemy.sql import functions
 from sqlalchemy.sql.elements import BinaryExpression
@@ -35,6 +39,10 @@ if str(test_dir) not in set(sys.path):
     sys.path.append(str(test_dir))
 import test_db_utils
 
+TMPDIR_PREFIX = "pdm_utils_tests_querying_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location.
+TMPDIR_BASE = "/tmp"
+
 class TestQuerying(unittest.TestCase):
     @classmethod
     def setUpClass(self):
@@ -538,6 +546,26 @@ class TestQuerying(unittest.TestCase):
         self.assertFalse("Alice" in results)
         self.assertFalse("Myrna" in results)
 
+    def test_execute_temp_table_subquery(self):
+        """Verify execute_temp_table_subquery() retrieves expected data.
+        """
+        where_clause = querying.build_where_clause(self.graph,
+                                                   "phage.Cluster=A")
+        phageid = querying.get_column(self.metadata, "phage.PhageID")
+        select = querying.build_select(self.graph, phageid,
+                                       where=where_clause)
+
+        results = querying.execute_temp_table_subquery(self.engine, select,
+                                                       phageid,
+                                                       ["Trixie", "D29",
+                                                        "Alice", "Myrna"])
+        results = [result[0] for result in results]
+
+        self.assertTrue("Trixie" in results)
+        self.assertTrue("D29" in results)
+        self.assertFalse("Alice" in results)
+        self.assertFalse("Myrna" in results)
+
     def test_query_1(self):
         """Verify query() correctly queries for SQLAlchemy ORM instances.
         """
@@ -571,5 +599,90 @@ class TestQuerying(unittest.TestCase):
 
         self.session.close()
 
+class TestExecuteChunks(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory(prefix=TMPDIR_PREFIX,
+                                                  dir=TMPDIR_BASE)
+        db_path = Path(self.tmpdir.name, "chunks.db")
+
+        # Chunks are executed on a pooled file database, so that each
+        # thread can check out its own connection as from MySQL.
+        self.engine = create_engine(f"sqlite:///{db_path}",
+                                    poolclass=QueuePool, pool_size=4,
+                                    connect_args={"check_same_thread" : False})
+        self.engine.execute("CREATE TABLE phage "
+                            "(PhageID VARCHAR(25) PRIMARY KEY, "
+                            "Cluster VARCHAR(5))")
+        self.phage_ids = [f"Phage{i:02d}" for i in range(40)]
+        for phage_id in self.phage_ids:
+            self.engine.execute("INSERT INTO phage VALUES "
+                                f"('{phage_id}', 'A')")
+
+        self.metadata = MetaData(bind=self.engine)
+        self.metadata.reflect()
+        self.phageid = self.metadata.tables["phage"].c.PhageID
+
+        # The first row of each chunk waits until every thread holds a
+        # chunk, so that chunks are known to be executed concurrently.
+        self.barrier = threading.Barrier(4)
+        self.waited = threading.local()
+        self.checkouts = []
+        event.listen(self.engine, "connect", self.register_wait)
+        event.listen(self.engine, "checkout", self.record_checkout)
+        self.engine.dispose()
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmpdir.cleanup()
+
+    def register_wait(self, dbapi_connection, connection_record):
+        dbapi_connection.create_function("wait_for_chunks", 1, self.wait)
+
+    def record_checkout(self, dbapi_connection, connection_record,
+                              connection_proxy):
+        self.checkouts.append((threading.get_ident(), id(dbapi_connection)))
+
+    def wait(self, value):
+        if self.barrier is not None and \
+                not getattr(self.waited, "value", False):
+            self.waited.value = True
+            self.barrier.wait(timeout=10)
+        return value
+
+    def build_subqueries(self):
+        executable = select([func.wait_for_chunks(self.phageid)])
+        return [executable.where(self.phageid.in_(self.phage_ids[i:i+10]))
+                                for i in range(0, len(self.phage_ids), 10)]
+
+    def test_execute_chunks_1(self):
+        """Verify concurrently executed chunks each use their own connection
+        and return the results of serially executed chunks in order.
+        """
+        subqueries = self.build_subqueries()
+        results_list = querying.execute_chunks(self.engine, subqueries,
+                                               threads=4)
+        checkouts = self.checkouts
+
+        self.barrier = None
+        self.checkouts = []
+        serial_results_list = querying.execute_chunks(self.engine,
+                                                      subqueries, threads=1)
+
+        results = [[row[0] for row in results] for results in results_list]
+        serial_results = [[row[0] for row in results]
+                                            for results in serial_results_list]
+        with self.subTest():
+            self.assertEqual(len(set(checkouts)), 4)
+        with self.subTest():
+            self.assertEqual(len({thread for thread, connection
+                                         in checkouts}), 4)
+        with self.subTest():
+            self.assertEqual(results, serial_results)
+        with self.subTest():
+            self.assertEqual(sum(results, []), sorted(self.phage_ids))
+        with self.subTest():
+            self.assertEqual(len({thread for thread, connection
+                                         in self.checkouts}), 1)
+
 if __name__ == "__main__":
     unittest.main()
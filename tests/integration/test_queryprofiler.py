@@ -0,0 +1,104 @@
+"""Integration tests for the QueryProfiler class."""
+
+import csv
+import json
+from pathlib import Path
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine
+
+from pdm_utils.classes.queryprofiler import QueryProfiler
+
+TMPDIR_PREFIX = "pdm_utils_tests_queryprofiler_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location.
+TMPDIR_BASE = "/tmp"
+
+
+class TestQueryProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory(prefix=TMPDIR_PREFIX,
+                                                  dir=TMPDIR_BASE)
+        self.profiler = QueryProfiler()
+
+        # Statements are executed on an in-memory database.
+        self.engine = create_engine("sqlite://")
+        self.engine.execute("CREATE TABLE phage "
+                            "(PhageID VARCHAR(25) PRIMARY KEY, "
+                            "Cluster VARCHAR(5))")
+        self.engine.execute("INSERT INTO phage VALUES ('Trixie', 'A'), "
+                            "('D29', 'A'), ('Myrna', 'C')")
+        self.profiler.attach(self.engine)
+
+        for cluster in ["A", "C", "Z"]:
+            self.engine.execute("SELECT PhageID FROM phage "
+                                f"WHERE Cluster = '{cluster}'").fetchall()
+        self.engine.execute("UPDATE phage SET Cluster = 'B' "
+                            "WHERE PhageID = 'Myrna'")
+
+    def tearDown(self):
+        self.profiler.detach(self.engine)
+        self.engine.dispose()
+        self.tmpdir.cleanup()
+
+
+
+
+    def test_attach_1(self):
+        """Verify statements executed on an attached engine are recorded
+        by fingerprint."""
+        with self.subTest():
+            self.assertEqual(len(self.profiler.stats), 2)
+        with self.subTest():
+            entry = self.profiler.stats[
+                            "SELECT PhageID FROM phage WHERE Cluster = ?"]
+            self.assertEqual(entry["count"], 3)
+
+    def test_detach_1(self):
+        """Verify statements are not recorded after the engine is
+        detached."""
+        self.profiler.detach(self.engine)
+        self.engine.execute("SELECT COUNT(*) FROM phage").fetchall()
+        self.assertEqual(len(self.profiler.stats), 2)
+
+
+
+
+    def test_write_report_1(self):
+        """Verify a JSON report with EXPLAIN output is written."""
+        file_path = Path(self.tmpdir.name, "profile.json")
+        self.profiler.write_report(file_path, explain=2)
+        with file_path.open("r") as handle:
+            report = json.load(handle)
+
+        select = [data for data in report["top"]
+                  if data["fingerprint"].startswith("SELECT")][0]
+        update = [data for data in report["top"]
+                  if data["fingerprint"].startswith("UPDATE")][0]
+        with self.subTest():
+            self.assertEqual(report["executions"], 4)
+        with self.subTest():
+            self.assertIsInstance(select["explain"], list)
+        with self.subTest():
+            self.assertIsNone(update["explain"])
+
+    def test_write_report_2(self):
+        """Verify a CSV report is written for a '.csv' file."""
+        file_path = Path(self.tmpdir.name, "profile.csv")
+        self.profiler.write_report(file_path, top=1)
+        with file_path.open("r") as handle:
+            rows = list(csv.DictReader(handle))
+
+        with self.subTest():
+            self.assertEqual(len(rows), 1)
+        with self.subTest():
+            self.assertEqual(list(rows[0].keys()),
+                             ["fingerprint", "count", "total_time",
+                              "mean_time", "max_time", "rows"])
+
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Integration tests for the SchemaCache class."""
+
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy import MetaData
+
+from pdm_utils.classes.schemacache import SchemaCache
+
+TMPDIR_PREFIX = "pdm_utils_tests_schemacache_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location.
+TMPDIR_BASE = "/tmp"
+
+
+class TestSchemaCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory(prefix=TMPDIR_PREFIX,
+                                                  dir=TMPDIR_BASE)
+        self.cache_dir = Path(self.tmpdir.name, "schemas")
+        self.cache = SchemaCache(cache_dir=self.cache_dir)
+
+        # The schema is reflected from an in-memory database, and the
+        # MySQL-specific version and fingerprint queries are patched.
+        self.engine = create_engine("sqlite://")
+        self.engine.execute("CREATE TABLE phage "
+                            "(PhageID VARCHAR(25) PRIMARY KEY)")
+        self.engine.execute("CREATE TABLE gene "
+                            "(GeneID VARCHAR(35) PRIMARY KEY, "
+                            "PhageID VARCHAR(25) REFERENCES phage(PhageID))")
+        self.metadata = MetaData(bind=self.engine)
+        self.metadata.reflect()
+
+        self.version_patcher = patch.object(SchemaCache, "get_schema_version",
+                                            return_value=10)
+        self.fingerprint_patcher = patch.object(SchemaCache,
+                                                "get_fingerprint",
+                                                return_value="abc")
+        self.version_mock = self.version_patcher.start()
+        self.fingerprint_mock = self.fingerprint_patcher.start()
+
+    def tearDown(self):
+        self.version_patcher.stop()
+        self.fingerprint_patcher.stop()
+        self.engine.dispose()
+        self.tmpdir.cleanup()
+
+
+
+
+    def test_get_1(self):
+        """Verify None is returned if the schema is not cached."""
+        self.assertIsNone(self.cache.get(self.engine))
+
+    def test_get_2(self):
+        """Verify a cached schema graph is returned with MetaData bound
+        to the engine."""
+        self.cache.put(self.engine, self.metadata)
+        graph = SchemaCache(cache_dir=self.cache_dir).get(self.engine)
+        metadata = graph.graph["metadata"]
+        with self.subTest():
+            self.assertEqual(set(metadata.tables.keys()), {"phage", "gene"})
+        with self.subTest():
+            self.assertIs(metadata.bind, self.engine)
+        with self.subTest():
+            self.assertIs(graph.nodes["gene"]["table"],
+                          metadata.tables["gene"])
+        with self.subTest():
+            self.assertTrue(graph.has_edge("gene", "phage"))
+
+    def test_get_3(self):
+        """Verify None is returned if the table definitions changed."""
+        self.cache.put(self.engine, self.metadata)
+        self.fingerprint_mock.return_value = "def"
+        self.assertIsNone(self.cache.get(self.engine))
+
+    def test_get_4(self):
+        """Verify schemas are cached separately for each schema version."""
+        self.cache.put(self.engine, self.metadata)
+        self.version_mock.return_value = 11
+        self.assertIsNone(self.cache.get(self.engine))
+
+
+
+
+    def test_clear_1(self):
+        """Verify all cached schemas are removed."""
+        self.cache.put(self.engine, self.metadata)
+        self.version_mock.return_value = 11
+        self.cache.put(self.engine, self.metadata)
+        with self.subTest():
+            self.assertEqual(self.cache.clear(), 2)
+        with self.subTest():
+            self.assertEqual(self.cache.get_entries(), [])
+
+
+
+
+if __name__ == '__main__':
+    unittest.main()
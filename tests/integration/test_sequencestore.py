@@ -0,0 +1,226 @@
+"""Integration tests for the SequenceStore class."""
+
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from pdm_utils.classes import genome
+from pdm_utils.classes.sequencestore import SequenceStore
+from pdm_utils.classes import sequencestore
+from pdm_utils.functions import mysqldb
+
+TMPDIR_PREFIX = "pdm_utils_tests_sequencestore_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location.
+TMPDIR_BASE = "/tmp"
+
+VERSION = {"database": "Actino_Draft", "version": 10, "count": 3,
+           "modified": "2020-01-01 00:00:00"}
+
+
+class TestSequenceStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory(prefix=TMPDIR_PREFIX,
+                                                  dir=TMPDIR_BASE)
+        self.store_dir = Path(self.tmpdir.name, "sequences")
+        self.store = SequenceStore(path=self.store_dir)
+        self.sequences = [("Trixie", b"ACGTACGTAC"),
+                          ("L5", b"aannnNNRTTG"),
+                          ("D29", b"")]
+        self.store.write(self.sequences, VERSION)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmpdir.cleanup()
+
+
+
+
+    def test_write_1(self):
+        """Verify the store files and index are created."""
+        with self.subTest():
+            self.assertTrue(self.store.exists())
+        with self.subTest():
+            self.assertEqual(self.store.version, VERSION)
+        with self.subTest():
+            self.assertEqual(self.store.get_phage_ids(),
+                             ["Trixie", "L5", "D29"])
+        with self.subTest():
+            # 3 bytes for Trixie, 3 bytes for L5, 0 bytes for D29.
+            self.assertEqual(self.store.data_path.stat().st_size, 6)
+
+    def test_write_2(self):
+        """Verify runs of ambiguous nucleotides are stored as exceptions."""
+        exceptions = self.store.index["L5"]["exceptions"]
+        self.assertEqual(exceptions, [[2, 5, "N"], [7, 1, "R"]])
+
+
+
+
+    def test_get_sequence_1(self):
+        """Verify sequences are returned from a re-opened store."""
+        store = SequenceStore(path=self.store_dir)
+        store.open()
+        with self.subTest():
+            self.assertEqual(store.get_sequence("Trixie"), "ACGTACGTAC")
+        with self.subTest():
+            self.assertEqual(store.get_sequence("L5"), "AANNNNNRTTG")
+        with self.subTest():
+            self.assertEqual(store.get_sequence("D29"), "")
+        with self.subTest():
+            self.assertIsNone(store.get_sequence("EagleEye"))
+        store.close()
+
+    def test_get_sequence_3(self):
+        """Verify the store is opened when a sequence is first retrieved."""
+        store = SequenceStore(path=self.store_dir)
+        self.assertEqual(store.get_sequence("Trixie"), "ACGTACGTAC")
+        store.close()
+
+    def test_get_sequence_2(self):
+        """Verify the store can be used as a Genome sequence loader."""
+        gnm = genome.Genome()
+        gnm.id = "L5"
+        gnm.set_sequence_loader(self.store)
+        self.assertEqual(gnm.seq, "AANNNNNRTTG")
+
+
+
+
+    def test_get_subsequence_1(self):
+        """Verify regions are extracted across byte boundaries and
+        ambiguous nucleotide runs."""
+        regions = {(0, 4): "AANN", (3, 9): "NNNNRT", (5, 11): "NNRTTG",
+                   (6, 7): "N", (9, 20): "TG", (-5, 2): "AA", (8, 8): ""}
+        for coords, expected in regions.items():
+            with self.subTest(coords=coords):
+                region = self.store.get_subsequence("L5", *coords)
+                self.assertEqual(region, expected)
+
+    def test_get_subsequence_2(self):
+        """Verify None is returned for a genome not in the store."""
+        region = self.store.get_subsequence("EagleEye", 0, 5)
+        self.assertIsNone(region)
+
+
+
+
+    def get_engine(self, version, count, modified):
+        """Create a mock engine returning a version stamp."""
+        results = {sequencestore.VERSION_QUERY: (version,),
+                   sequencestore.STAMP_QUERY: (count, modified)}
+        engine = Mock()
+        engine.url.database = "Actino_Draft"
+        engine.execute.side_effect = \
+                    lambda query: Mock(fetchone=Mock(
+                                            return_value=results[query]))
+        return engine
+
+    def test_is_current_1(self):
+        """Verify the store is current only if the database version and
+        phage table stamp match the version stamp."""
+        store = SequenceStore(path=self.store_dir)
+        engine = self.get_engine(10, 3, "2020-01-01 00:00:00")
+        with self.subTest():
+            self.assertTrue(store.is_current(engine))
+        engine = self.get_engine(10, 4, "2020-01-01 00:00:00")
+        with self.subTest():
+            self.assertFalse(store.is_current(engine))
+        engine = self.get_engine(10, 3, "2020-02-01 00:00:00")
+        with self.subTest():
+            self.assertFalse(store.is_current(engine))
+        engine = self.get_engine(11, 3, "2020-01-01 00:00:00")
+        with self.subTest():
+            self.assertFalse(store.is_current(engine))
+        store.close()
+
+    def test_is_current_2(self):
+        """Verify an empty store is not current."""
+        store = SequenceStore(path=Path(self.tmpdir.name, "empty"))
+        self.assertFalse(store.is_current(Mock()))
+
+
+
+
+    def test_update_1(self):
+        """Verify updated sequences are retrieved and the snapshot is
+        stamped with the database version after the update."""
+        engine = self.get_engine(10, 4, "2020-01-01 00:00:00")
+        self.store.update(engine, {"EagleEye": "acgg", "Trixie": "TTTT"})
+        with self.subTest():
+            self.assertTrue(self.store.is_current(engine))
+        with self.subTest():
+            self.assertEqual(self.store.get_phage_ids(),
+                             ["Trixie", "L5", "D29", "EagleEye"])
+        with self.subTest():
+            self.assertEqual(str(self.store.get_sequence("EagleEye")), "ACGG")
+        with self.subTest():
+            self.assertEqual(self.store.get_subsequence("Trixie", 1, 3), "TT")
+
+    def test_flush_1(self):
+        """Verify updated sequences are written to the store files."""
+        engine = self.get_engine(10, 4, "2020-01-01 00:00:00")
+        self.store.update(engine, {"EagleEye": "ACGG", "Trixie": "TTTT"})
+        self.store.flush()
+        store = SequenceStore(path=self.store_dir)
+        with self.subTest():
+            self.assertEqual(self.store.pending, {})
+        with self.subTest():
+            self.assertTrue(store.is_current(engine))
+        with self.subTest():
+            self.assertEqual(str(store.get_sequence("Trixie")), "TTTT")
+        with self.subTest():
+            self.assertEqual(str(store.get_sequence("L5")), "AANNNNNRTTG")
+        with self.subTest():
+            self.assertEqual(str(store.get_sequence("EagleEye")), "ACGG")
+        store.close()
+
+
+
+
+    def test_clear_1(self):
+        """Verify the store files are removed."""
+        removed = self.store.clear()
+        with self.subTest():
+            self.assertEqual(removed, 3)
+        with self.subTest():
+            self.assertFalse(self.store.exists())
+        with self.subTest():
+            self.assertEqual(self.store.get_phage_ids(), [])
+
+
+
+
+    @patch("pdm_utils.classes.sequencestore.SequenceStore.is_current")
+    @patch("pdm_utils.classes.sequencestore.SequenceStore.snapshot")
+    def test_create_seq_set_1(self, snapshot_mock, is_current_mock):
+        """Verify create_seq_set() refreshes a stale store and retrieves
+        sequences from it instead of the database."""
+        engine = Mock()
+        is_current_mock.return_value = False
+        seq_set = mysqldb.create_seq_set(engine, seq_store=self.store)
+        with self.subTest():
+            snapshot_mock.assert_called_once_with(engine)
+        with self.subTest():
+            self.assertEqual(seq_set, {"ACGTACGTAC", "AANNNNNRTTG", ""})
+        with self.subTest():
+            engine.execute.assert_not_called()
+
+
+
+
+class TestSequenceStoreFunctions(unittest.TestCase):
+
+    def test_pack_sequence_1(self):
+        """Verify nucleotides are packed four per byte."""
+        packed, exceptions = sequencestore.pack_sequence(b"ACGTT")
+        with self.subTest():
+            self.assertEqual(packed, bytes([0b00011011, 0b11000000]))
+        with self.subTest():
+            self.assertEqual(exceptions, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
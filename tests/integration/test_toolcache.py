@@ -0,0 +1,150 @@
+"""Integration tests for the ToolCache class."""
+
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import patch
+from pdm_utils.classes.aragornhandler import AragornHandler
+from pdm_utils.classes import toolcache
+from pdm_utils.classes.toolcache import ToolCache
+
+TMPDIR_PREFIX = "pdm_utils_tests_toolcache_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location.
+TMPDIR_BASE = "/tmp"
+
+
+class TestToolCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory(prefix=TMPDIR_PREFIX,
+                                                  dir=TMPDIR_BASE)
+        self.cache_dir = Path(self.tmpdir.name, "cache")
+        self.cache = ToolCache(cache_dir=self.cache_dir, max_size=100)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+
+
+
+    def test_make_key_1(self):
+        """Verify the same inputs produce the same key, regardless of
+        sequence case."""
+        key1 = self.cache.make_key("aragorn", "1.2.38", "-l ", "ACTG")
+        key2 = self.cache.make_key("aragorn", "1.2.38", "-l ", "actg")
+        self.assertEqual(key1, key2)
+
+    def test_make_key_2(self):
+        """Verify different options produce different keys."""
+        key1 = self.cache.make_key("aragorn", "1.2.38", "-l ", "ACTG")
+        key2 = self.cache.make_key("aragorn", "1.2.38", "-m ", "ACTG")
+        self.assertNotEqual(key1, key2)
+
+    def test_make_key_3(self):
+        """Verify different tool versions produce different keys."""
+        key1 = self.cache.make_key("aragorn", "1.2.38", "-l ", "ACTG")
+        key2 = self.cache.make_key("aragorn", "1.2.41", "-l ", "ACTG")
+        self.assertNotEqual(key1, key2)
+
+
+
+
+    def test_get_1(self):
+        """Verify None is returned for an uncached key."""
+        output = self.cache.get("abcd")
+        with self.subTest():
+            self.assertIsNone(output)
+        with self.subTest():
+            self.assertEqual(self.cache.misses, 1)
+
+    def test_get_2(self):
+        """Verify stored output is returned for a cached key."""
+        self.cache.put("abcd", "tRNA-Ala")
+        output = self.cache.get("abcd")
+        with self.subTest():
+            self.assertEqual(output, "tRNA-Ala")
+        with self.subTest():
+            self.assertEqual(self.cache.hits, 1)
+
+
+
+
+    def test_evict_1(self):
+        """Verify least recently used results are evicted once the cache
+        is larger than the maximum size."""
+        self.cache.put("aaaa", "a" * 40)
+        os.utime(self.cache.get_path("aaaa"), (1, 1))
+        self.cache.put("bbbb", "b" * 40)
+        os.utime(self.cache.get_path("bbbb"), (2, 2))
+        self.cache.put("cccc", "c" * 40)
+        with self.subTest():
+            self.assertIsNone(self.cache.get("aaaa"))
+        with self.subTest():
+            self.assertIsNotNone(self.cache.get("bbbb"))
+        with self.subTest():
+            self.assertIsNotNone(self.cache.get("cccc"))
+        with self.subTest():
+            self.assertEqual(self.cache.size(), 80)
+
+    @patch("pdm_utils.classes.toolcache.ToolCache.get_entries")
+    def test_evict_2(self, get_entries_mock):
+        """Verify the cache directory is not scanned while the running
+        size is within the maximum size."""
+        get_entries_mock.return_value = []
+        self.cache.put("aaaa", "a" * 40)
+        self.cache.put("bbbb", "b" * 40)
+        with self.subTest():
+            self.assertEqual(get_entries_mock.call_count, 1)
+        with self.subTest():
+            self.assertEqual(self.cache._size, 80)
+
+
+
+
+    def test_clear_1(self):
+        """Verify all results are removed."""
+        self.cache.put("aaaa", "a")
+        self.cache.put("bbbb", "b")
+        removed = self.cache.clear()
+        with self.subTest():
+            self.assertEqual(removed, 2)
+        with self.subTest():
+            self.assertEqual(self.cache.size(), 0)
+
+
+
+
+    @patch("pdm_utils.classes.aragornhandler.get_tool_version")
+    @patch("pdm_utils.classes.aragornhandler.Popen")
+    def test_run_aragorn_1(self, popen_mock, version_mock):
+        """Verify Aragorn is not run when output for the sequence is
+        already cached."""
+        version_mock.return_value = "1.2.38"
+        ah = AragornHandler("Trixie", "ACTG", cache=self.cache)
+        ah.temp_dir = self.tmpdir.name
+        ah.input = os.path.join(ah.temp_dir, "Trixie.fasta")
+        ah.output = os.path.join(ah.temp_dir, "Trixie.out")
+        key = self.cache.make_key("aragorn", "1.2.38",
+                                  "-gcbact -br -wa -l -t ", "ACTG")
+        self.cache.put(key, "cached output")
+        ah.run_aragorn()
+        ah.read_output()
+        with self.subTest():
+            popen_mock.assert_not_called()
+        with self.subTest():
+            self.assertEqual(ah.out_str, "cached output")
+
+    @patch("pdm_utils.classes.toolcache.SHARED_CACHE", None)
+    def test_get_shared_cache_1(self):
+        """Verify tool handlers share one ToolCache by default."""
+        ah1 = AragornHandler("Trixie", "ACTG")
+        ah2 = AragornHandler("L5", "ACTG")
+        with self.subTest():
+            self.assertIs(ah1.cache, ah2.cache)
+        with self.subTest():
+            self.assertIs(ah1.cache, toolcache.get_shared_cache())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1548,6 +1548,16 @@ class TestCdsClass(unittest.TestCase):
         self.feature.check_translation()
         self.assertEqual(self.feature.evaluations[0].status, "error")
 
+    def test_check_translation_6(self):
+        """Verify a supplied expected translation is used instead of
+        translating the nucleotide sequence."""
+        self.feature.translation = Seq("MF", IUPAC.protein)
+        self.feature.translation_length = 2
+        self.feature.seq = Seq("ATGATGTGA", IUPAC.unambiguous_dna)
+        self.feature.translation_table = 11
+        self.feature.check_translation(translation=Seq("MF", IUPAC.protein))
+        self.assertEqual(self.feature.evaluations[0].status, "correct")
+
 
 
 
@@ -1593,6 +1603,34 @@ class TestCdsClass(unittest.TestCase):
         self.assertEqual(self.feature.evaluations[0].status, "correct")
 
 
+class TestCdsSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.feature = cds.Cds()
+
+    def test_slots_1(self):
+        """Verify declared attributes are not stored in a __dict__."""
+        self.feature.id = "Trixie_1"
+        self.feature.evaluations.append(None)
+        self.assertEqual(self.feature.__dict__, {})
+
+    def test_slots_2(self):
+        """Verify undeclared attributes can still be assigned."""
+        self.feature.misc = "abc"
+        self.assertEqual(self.feature.misc, "abc")
+
+    def test_evaluations_1(self):
+        """Verify the evaluations list is created when first accessed
+        and is retained."""
+        self.feature.evaluations.append(1)
+        self.assertEqual(self.feature.evaluations, [1])
+
+    def test_evaluations_2(self):
+        """Verify the evaluations list is not shared between features."""
+        other = cds.Cds()
+        self.feature.evaluations.append(1)
+        self.assertEqual(other.evaluations, [])
+
 
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 import os
 import unittest
 from argparse import ArgumentError
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import call
 from unittest.mock import Mock
@@ -47,6 +48,9 @@ class TestExportMain(unittest.TestCase):
         self.mock_raw_bytes = Mock()
 
         self.mock_concatenate = Mock()
+        self.mock_processes = Mock()
+        self.mock_compress = Mock()
+        self.mock_incremental = Mock()
 
         type(self.mock_args).pipeline = \
                             PropertyMock(return_value=self.mock_pipeline) 
@@ -82,6 +86,12 @@ class TestExportMain(unittest.TestCase):
 
         type(self.mock_args).concatenate = \
                             PropertyMock(return_value=self.mock_concatenate)
+        type(self.mock_args).processes = \
+                            PropertyMock(return_value=self.mock_processes)
+        type(self.mock_args).compress = \
+                            PropertyMock(return_value=self.mock_compress)
+        type(self.mock_args).incremental = \
+                            PropertyMock(return_value=self.mock_incremental)
         
     @patch("pdm_utils.pipelines.export_db.execute_export")
     @patch("pdm_utils.pipelines.export_db.parse_value_input")
@@ -121,11 +131,289 @@ class TestExportMain(unittest.TestCase):
                                     raw_bytes=self.mock_raw_bytes,
                                     sequence_columns=self.mock_sequence_columns,
                                     concatenate=self.mock_concatenate,
+                                    processes=self.mock_processes,
+                                    compress=self.mock_compress,
+                                    incremental=self.mock_incremental,
                                     verbose=self.mock_verbose)
 
 
 
-                
-        
+
+class TestExportFunctions(unittest.TestCase):
+    def setUp(self):
+        self.mock_alchemist = Mock()
+
+    @patch("pdm_utils.pipelines.export_db.querying.execute")
+    @patch("pdm_utils.pipelines.export_db.querying.build_select")
+    @patch("pdm_utils.pipelines.export_db.querying.get_column")
+    def test_get_cds_parent_genomes_1(self, get_column_mock,
+                                      build_select_mock, execute_mock):
+        """Verify get_cds_parent_genomes() retrieves all parent genomes
+        with one query, without their sequences.
+        """
+        get_column_mock.side_effect = lambda metadata, column: column
+        execute_mock.return_value = [{"PhageID" : "L5",
+                                      "Accession" : "AF022214",
+                                      "HostGenus" : "Mycobacterium",
+                                      "Length" : 52297,
+                                      "DateLastModified" : None}]
+
+        genomes = export_db.get_cds_parent_genomes(self.mock_alchemist,
+                                                   ["L5", "D29"])
+
+        with self.subTest():
+            execute_mock.assert_called_once_with(
+                                    self.mock_alchemist.engine,
+                                    build_select_mock.return_value,
+                                    in_column="phage.PhageID",
+                                    values=["L5", "D29"])
+        with self.subTest():
+            self.assertNotIn("phage.Sequence",
+                             build_select_mock.call_args[0][1])
+        with self.subTest():
+            self.assertEqual(genomes["L5"].length, 52297)
+        with self.subTest():
+            self.assertEqual(genomes["L5"].host_genus, "Mycobacterium")
+        with self.subTest():
+            self.assertEqual(genomes["D29"].accession, "")
+
+    @patch("pdm_utils.pipelines.export_db.querying.execute")
+    def test_get_cds_parent_genomes_2(self, execute_mock):
+        """Verify get_cds_parent_genomes() does not query without PhageIDs.
+        """
+        genomes = export_db.get_cds_parent_genomes(self.mock_alchemist, [])
+
+        with self.subTest():
+            self.assertEqual(genomes, {})
+        with self.subTest():
+            execute_mock.assert_not_called()
+
+    def test_map_processes_1(self):
+        """Verify map_processes() returns results in the order of the inputs.
+        """
+        inputs = [-5, 4, -3, 2, -1, 0]
+        for processes in [1, 2, 10]:
+            with self.subTest(processes=processes):
+                results = export_db.map_processes(abs, inputs, processes)
+                self.assertEqual(results, [5, 4, 3, 2, 1, 0])
+
+    def test_imap_processes_1(self):
+        """Verify imap_processes() lazily yields results in the order of the
+        inputs.
+        """
+        for processes in [1, 2]:
+            with self.subTest(processes=processes):
+                results = export_db.imap_processes(abs, iter(range(-7, 0)),
+                                                   processes, batch_size=3)
+                self.assertEqual(list(results), [7, 6, 5, 4, 3, 2, 1])
+
+    @patch("pdm_utils.pipelines.export_db.write_seqrecord_file")
+    def test_write_seqrecord_1(self, write_seqrecord_file_mock):
+        """Verify write_seqrecord() writes one file per SeqRecord name.
+        """
+        write_seqrecord_file_mock.side_effect = lambda task: (task[1], "a")
+        records = [SeqRecord(Seq("ATG"), name="L5"),
+                   SeqRecord(Seq("ATG"), name="D29"),
+                   SeqRecord(Seq("ATGC"), name="L5")]
+
+        digests = export_db.write_seqrecord(iter(records), "fasta",
+                                            Path("/export"))
+
+        tasks = [call_args[0][0] for call_args
+                        in write_seqrecord_file_mock.call_args_list]
+        with self.subTest():
+            self.assertEqual([task[1] for task in tasks],
+                             [Path("/export/L5.fasta"),
+                              Path("/export/D29.fasta")])
+        with self.subTest():
+            self.assertIs(tasks[0][0], records[0])
+        with self.subTest():
+            self.assertEqual(digests, {"L5.fasta" : "a", "D29.fasta" : "a"})
+
+    @patch("pdm_utils.pipelines.export_db.write_seqrecord_file")
+    def test_write_seqrecord_2(self, write_seqrecord_file_mock):
+        """Verify write_seqrecord() appends the compression suffix.
+        """
+        write_seqrecord_file_mock.side_effect = lambda task: (task[1], "a")
+        records = [SeqRecord(Seq("ATG"), name="L5")]
+
+        export_db.write_seqrecord(records, "fasta", Path("/export"),
+                                  compress="zst",
+                                  digests={"L5.fasta.zst" : "b"})
+
+        write_seqrecord_file_mock.assert_called_once_with(
+                                    (records[0], Path("/export/L5.fasta.zst"),
+                                     "fasta", "zst", "b"))
+
+    @patch("pdm_utils.pipelines.export_db.write_text_file")
+    def test_write_seqrecord_3(self, write_text_file_mock):
+        """Verify write_seqrecord() hashes concatenated files from the
+        formatted SeqRecords.
+        """
+        write_text_file_mock.side_effect = \
+                        lambda texts, *args, **kwargs: list(texts)
+        records = [SeqRecord(Seq("ATG"), id="L5", name="L5"),
+                   SeqRecord(Seq("ATGC"), id="D29", name="D29")]
+
+        digests = export_db.write_seqrecord(records, "fasta",
+                                            Path("/export"),
+                                            concatenate=True)
+
+        record_digests = [export_db.format_hashed_seqrecords(
+                                            ([record], "fasta"))[1]
+                          for record in records]
+        self.assertEqual(digests, {"export.fasta" :
+                                    export_db.get_file_hash(record_digests)})
+
+    @patch("pdm_utils.pipelines.export_db.write_text_file")
+    @patch("pdm_utils.pipelines.export_db.Path.is_file")
+    def test_write_seqrecord_file_1(self, is_file_mock, write_text_file_mock):
+        """Verify write_seqrecord_file() does not rewrite existing files with
+        unchanged content.
+        """
+        is_file_mock.return_value = True
+        record = SeqRecord(Seq("ATG"), id="L5", name="L5")
+        file_path = Path("/export/L5.fasta")
+
+        file_path, digest = export_db.write_seqrecord_file(
+                                    (record, file_path, "fasta", None, None))
+        with self.subTest():
+            write_text_file_mock.assert_called_once_with(
+                                    [">L5 <unknown description>\nATG\n"],
+                                    file_path, "fasta", compress=None)
+
+        write_text_file_mock.reset_mock()
+        export_db.write_seqrecord_file((record, file_path, "fasta", None,
+                                        digest))
+        with self.subTest():
+            write_text_file_mock.assert_not_called()
+
+    def test_get_fasta_index_1(self):
+        """Verify get_fasta_index() computes .fai entries from an offset.
+        """
+        text = ">L5 description\nATGC\nAT\n>D29\nATG\n"
+
+        fasta_index = export_db.get_fasta_index(text, offset=10)
+
+        with self.subTest():
+            self.assertEqual(fasta_index[0], ["L5", 6, 26, 4, 5])
+        with self.subTest():
+            self.assertEqual(fasta_index[1], ["D29", 3, 39, 3, 4])
+
+    def test_open_compressed_1(self):
+        """Verify open_compressed() raises ValueError with an unknown
+        compression format.
+        """
+        with self.assertRaises(ValueError):
+            export_db.open_compressed(Path("/export/L5.fasta"),
+                                      compress="bz2")
+
+    @patch("pdm_utils.pipelines.export_db.querying.execute")
+    @patch("pdm_utils.pipelines.export_db.querying.build_select")
+    @patch("pdm_utils.pipelines.export_db.querying.get_column")
+    def test_get_genome_modified_dates_1(self, get_column_mock,
+                                         build_select_mock, execute_mock):
+        """Verify get_genome_modified_dates() retrieves dates as strings.
+        """
+        get_column_mock.side_effect = lambda metadata, column: column
+        execute_mock.return_value = [
+                    {"PhageID" : "L5",
+                     "DateLastModified" : datetime(2020, 1, 1)},
+                    {"PhageID" : "D29", "DateLastModified" : None}]
+
+        dates = export_db.get_genome_modified_dates(self.mock_alchemist,
+                                                    ["L5", "D29"])
+
+        with self.subTest():
+            execute_mock.assert_called_once_with(
+                                    self.mock_alchemist.engine,
+                                    build_select_mock.return_value,
+                                    in_column="phage.PhageID",
+                                    values=["L5", "D29"])
+        with self.subTest():
+            self.assertEqual(dates, {"L5" : "2020-01-01 00:00:00",
+                                     "D29" : None})
+
+    @patch("pdm_utils.pipelines.export_db.querying.execute")
+    @patch("pdm_utils.pipelines.export_db.querying.build_select")
+    @patch("pdm_utils.pipelines.export_db.querying.get_column")
+    def test_get_gene_genome_keys_1(self, get_column_mock,
+                                    build_select_mock, execute_mock):
+        """Verify get_gene_genome_keys() groups GeneIDs by PhageID in order.
+        """
+        get_column_mock.side_effect = lambda metadata, column: column
+        execute_mock.return_value = [
+                    {"GeneID" : "L5_CDS_1", "PhageID" : "L5"},
+                    {"GeneID" : "D29_CDS_1", "PhageID" : "D29"},
+                    {"GeneID" : "L5_CDS_2", "PhageID" : "L5"}]
+
+        genome_keys = export_db.get_gene_genome_keys(
+                                    self.mock_alchemist,
+                                    ["L5_CDS_2", "D29_CDS_1", "L5_CDS_1"])
+
+        self.assertEqual(list(genome_keys.items()),
+                         [("L5", ["L5_CDS_2", "L5_CDS_1"]),
+                          ("D29", ["D29_CDS_1"])])
+
+    @patch("pdm_utils.pipelines.export_db.PROCESS_BATCH_SIZE", 2)
+    @patch("pdm_utils.pipelines.export_db.get_cds_seqrecords")
+    def test_get_keyed_seqrecords_1(self, get_cds_seqrecords_mock):
+        """Verify get_keyed_seqrecords() lazily creates CDS SeqRecords
+        in batches and pairs them with the PhageID of their genome.
+        """
+        get_cds_seqrecords_mock.side_effect = \
+                lambda alchemist, values=[], **kwargs: \
+                        [SeqRecord(Seq("ATG"), name=value) for value in values]
+        genome_keys = {"L5" : ["L5_1", "L5_2"], "D29" : ["D29_1"]}
+
+        keyed_seqrecords = export_db.get_keyed_seqrecords(
+                                    self.mock_alchemist, "gene",
+                                    ["L5_1", "L5_2", "D29_1"], genome_keys)
+        with self.subTest():
+            get_cds_seqrecords_mock.assert_not_called()
+
+        keys = [(genome_id, record.name)
+                for genome_id, record in keyed_seqrecords]
+        with self.subTest():
+            self.assertEqual(keys, [("L5", "L5_1"), ("L5", "L5_2"),
+                                    ("D29", "D29_1")])
+        with self.subTest():
+            self.assertEqual(get_cds_seqrecords_mock.call_count, 2)
+
+    def test_format_hashed_seqrecords_1(self):
+        """Verify format_hashed_seqrecords() returns the formatted SeqRecords
+        and a hash that changes with their content.
+        """
+        record_1 = SeqRecord(Seq("ATG"), id="L5", name="L5")
+        record_2 = SeqRecord(Seq("ATGC"), id="L5", name="L5")
+
+        text, digest = export_db.format_hashed_seqrecords(([record_1],
+                                                           "fasta"))
+
+        with self.subTest():
+            self.assertEqual(text, export_db.format_seqrecords(([record_1],
+                                                                "fasta")))
+        with self.subTest():
+            self.assertNotEqual(digest, export_db.format_hashed_seqrecords(
+                                                ([record_2], "fasta"))[1])
+
+    def test_get_file_hash_1(self):
+        """Verify get_file_hash() changes with the order of SeqRecords.
+        """
+        self.assertNotEqual(export_db.get_file_hash(["a", "b"]),
+                            export_db.get_file_hash(["b", "a"]))
+
+    def test_get_manifest_files_1(self):
+        """Verify get_manifest_files() returns distinct file names.
+        """
+        manifest = {"genomes" : {"L5" : {"files" : {"all.gb" : "a"}},
+                                 "D29" : {"files" : {"all.gb" : "b"}},
+                                 "Trixie" : {"files" : {"Trixie.gb" : "c"}}}}
+
+        self.assertEqual(export_db.get_manifest_files(manifest),
+                         ["all.gb", "Trixie.gb"])
+
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -287,8 +287,32 @@ class TestFilter(unittest.TestCase):
     
         check_mock.assert_called()
    
+    @patch("pdm_utils.classes.filter.q.iter_execute")
+    @patch("pdm_utils.classes.filter.q.build_select")
+    @patch("pdm_utils.classes.filter.Filter.get_columns")
+    @patch("pdm_utils.classes.filter.Filter.check")
+    def test_iter_select_1(self, check_mock, get_columns_mock,
+                                 build_select_mock, iter_execute_mock):
+        """Verify that iter_select() streams the select conditioned on
+        the Filter values.
+        """
+        self.db_filter._values = ["Trixie", "L5"]
+        get_columns_mock.return_value = ["columns"]
+        build_select_mock.return_value = "select"
+
+        batches = self.db_filter.iter_select("Column", batch_size=10)
+
+        with self.subTest():
+            self.assertIs(batches, iter_execute_mock.return_value)
+        with self.subTest():
+            iter_execute_mock.assert_called_with(
+                                self.db_filter._engine, "select",
+                                in_column=self.db_filter._key,
+                                values=["Trixie", "L5"], limit=8000,
+                                batch_size=10, return_dict=True)
+
     @patch("pdm_utils.classes.filter.q.build_distinct")
-    @patch("pdm_utils.classes.filter.Filter.check") 
+    @patch("pdm_utils.classes.filter.Filter.check")
     def test_retrieve_1(self, check_mock, build_distinct_mock):
         """Verify that retrieve() returns without values.
         """
@@ -297,6 +321,172 @@ class TestFilter(unittest.TestCase):
         check_mock.assert_called()
         build_distinct_mock.assert_not_called()
 
+    @patch("pdm_utils.classes.filter.q.execute")
+    @patch("pdm_utils.classes.filter.q.build_distinct")
+    @patch("pdm_utils.classes.filter.Filter.get_columns")
+    @patch("pdm_utils.classes.filter.Filter.check")
+    def test_retrieve_2(self, check_mock, get_columns_mock,
+                                          build_distinct_mock, execute_mock):
+        """Verify that retrieve() queries each column once for all values
+        and groups the data by value.
+        """
+        self.mock_key.type.python_type = str
+        column_1 = Mock(spec=Column)
+        column_1.name = "Cluster"
+        column_1.type.python_type = str
+        column_2 = Mock(spec=Column)
+        column_2.name = "GeneID"
+        column_2.type.python_type = str
+        get_columns_mock.return_value = [column_1, column_2]
+        execute_mock.side_effect = [[("A", "Trixie"), ("A", "L5")],
+                                    [("L5_1", "L5"), ("L5_2", "L5"),
+                                     ("L5_1", "L5")]]
+
+        self.db_filter._values = ["Trixie", "L5", "D29"]
+        data = self.db_filter.retrieve(["Cluster", "GeneID"])
+
+        with self.subTest():
+            self.assertEqual(execute_mock.call_count, 2)
+        with self.subTest():
+            self.assertEqual(data["Trixie"], {"Cluster" : ["A"],
+                                              "GeneID" : []})
+        with self.subTest():
+            self.assertEqual(data["L5"]["GeneID"], ["L5_1", "L5_2"])
+        with self.subTest():
+            self.assertEqual(data["D29"], {"Cluster" : [], "GeneID" : []})
+
+    @patch("pdm_utils.classes.filter.q.execute")
+    @patch("pdm_utils.classes.filter.q.build_distinct")
+    @patch("pdm_utils.classes.filter.Filter.get_columns")
+    @patch("pdm_utils.classes.filter.Filter.check")
+    def test_retrieve_3(self, check_mock, get_columns_mock,
+                                          build_distinct_mock, execute_mock):
+        """Verify that retrieve() executes chunks with the Filter's number
+        of threads unless a number of threads is given.
+        """
+        self.mock_key.type.python_type = str
+        column = Mock(spec=Column)
+        column.name = "Cluster"
+        column.type.python_type = str
+        get_columns_mock.return_value = [column]
+        execute_mock.return_value = []
+
+        self.db_filter._values = ["Trixie"]
+        self.db_filter.threads = 4
+
+        with self.subTest():
+            self.db_filter.retrieve("Cluster")
+            self.assertEqual(execute_mock.call_args[1]["threads"], 4)
+        with self.subTest():
+            self.db_filter.retrieve("Cluster", threads=2)
+            self.assertEqual(execute_mock.call_args[1]["threads"], 2)
+
+    @patch("pdm_utils.classes.filter.q.execute")
+    @patch("pdm_utils.classes.filter.q.build_distinct")
+    @patch("pdm_utils.classes.filter.Filter.get_columns")
+    @patch("pdm_utils.classes.filter.Filter.check")
+    def test_retrieve_4(self, check_mock, get_columns_mock,
+                                          build_distinct_mock, execute_mock):
+        """Verify that retrieve() matches mixed-case values to the
+        database values case-insensitively, as MySQL compares them.
+        """
+        self.mock_key.type.python_type = str
+        column = Mock(spec=Column)
+        column.name = "Cluster"
+        column.type.python_type = str
+        get_columns_mock.return_value = [column]
+        execute_mock.return_value = [("A", "Trixie"), ("C", "Myrna")]
+
+        self.db_filter._values = ["trixie", "MYRNA ", "D29"]
+        data = self.db_filter.retrieve("Cluster")
+
+        with self.subTest():
+            self.assertEqual(list(data.keys()), ["trixie", "MYRNA ", "D29"])
+        with self.subTest():
+            self.assertEqual(data["trixie"], {"Cluster" : ["A"]})
+        with self.subTest():
+            self.assertEqual(data["MYRNA "], {"Cluster" : ["C"]})
+        with self.subTest():
+            self.assertEqual(data["D29"], {"Cluster" : []})
+
+    @patch("pdm_utils.classes.filter.q.execute")
+    @patch("pdm_utils.classes.filter.q.build_distinct")
+    @patch("pdm_utils.classes.filter.Filter.get_columns")
+    @patch("pdm_utils.classes.filter.Filter.check")
+    def test_retrieve_5(self, check_mock, get_columns_mock,
+                                          build_distinct_mock, execute_mock):
+        """Verify that retrieve() matches values of a binary key exactly.
+        """
+        self.mock_key.type.python_type = bytes
+        column = Mock(spec=Column)
+        column.name = "Cluster"
+        column.type.python_type = str
+        get_columns_mock.return_value = [column]
+        execute_mock.return_value = [("A", b"Trixie")]
+
+        self.db_filter._values = ["Trixie", "trixie"]
+        data = self.db_filter.retrieve("Cluster")
+
+        with self.subTest():
+            self.assertEqual(data["Trixie"], {"Cluster" : ["A"]})
+        with self.subTest():
+            self.assertEqual(data["trixie"], {"Cluster" : []})
+
+    @patch("pdm_utils.classes.filter.q.execute")
+    @patch("pdm_utils.classes.filter.q.build_distinct")
+    @patch("pdm_utils.classes.filter.Filter.transpose")
+    @patch("pdm_utils.classes.filter.Filter.get_column")
+    @patch("pdm_utils.classes.filter.Filter.check")
+    def test_group_1(self, check_mock, get_column_mock, transpose_mock,
+                                       build_distinct_mock, execute_mock):
+        """Verify that group() queries once for all groups and buckets
+        values in order of the Filter's values.
+        """
+        self.mock_key.type.python_type = str
+        transpose_mock.return_value = ["A", "C", "B"]
+        execute_mock.return_value = [("A", "Trixie"), ("C", "Myrna"),
+                                     ("A", "D29"), ("A", "Trixie")]
+
+        self.db_filter._values = ["Trixie", "Myrna", "D29"]
+        group_results = self.db_filter.group("Cluster")
+
+        with self.subTest():
+            execute_mock.assert_called_once()
+        with self.subTest():
+            self.assertEqual(list(group_results.keys()), ["A", "C", "B"])
+        with self.subTest():
+            self.assertEqual(group_results["A"], ["Trixie", "D29"])
+        with self.subTest():
+            self.assertEqual(group_results["B"], [])
+
+    @patch("pdm_utils.classes.filter.q.execute")
+    @patch("pdm_utils.classes.filter.q.build_distinct")
+    @patch("pdm_utils.classes.filter.Filter.transpose")
+    @patch("pdm_utils.classes.filter.Filter.get_column")
+    @patch("pdm_utils.classes.filter.Filter.check")
+    def test_group_2(self, check_mock, get_column_mock, transpose_mock,
+                                       build_distinct_mock, execute_mock):
+        """Verify that group() matches groups case-insensitively, as MySQL
+        compares them, and orders values as the sorted Filter values.
+        """
+        self.mock_key.type.python_type = str
+        column = Mock(spec=Column)
+        column.type.python_type = str
+        get_column_mock.return_value = column
+        transpose_mock.return_value = ["A", "C"]
+        execute_mock.return_value = [("A", "Trixie"), ("a", "D29"),
+                                     ("c ", "Myrna"), ("A", "L5")]
+
+        self.db_filter._values = ["L5", "Myrna", "D29", "Trixie"]
+        group_results = self.db_filter.group("Cluster")
+
+        with self.subTest():
+            self.assertEqual(list(group_results.keys()), ["A", "C"])
+        with self.subTest():
+            self.assertEqual(group_results["A"], ["L5", "D29", "Trixie"])
+        with self.subTest():
+            self.assertEqual(group_results["C"], ["Myrna"])
+
     @patch("pdm_utils.classes.filter.Filter.check")
     @patch("pdm_utils.classes.filter.Filter.build_values")
     def test_refresh_1(self, build_values_mock, check_mock):
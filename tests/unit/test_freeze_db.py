@@ -0,0 +1,74 @@
+"""Tests the functionality of the unique functions in the freeze_db pipeline"""
+import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from sqlalchemy.exc import OperationalError
+
+from pdm_utils.pipelines import freeze_db
+
+class TestFreezeFunctions(unittest.TestCase):
+    def setUp(self):
+        self.mock_engine = MagicMock()
+        self.mock_engine.url.database = "Actinobacteriophage"
+        self.tables = {table for table, condition in freeze_db.SUBSET_TABLES}
+
+    def test_get_unknown_tables_1(self):
+        """Verify get_unknown_tables() returns nothing for the subset
+        tables."""
+        unknown = freeze_db.get_unknown_tables(self.tables)
+        self.assertEqual(unknown, [])
+
+    def test_get_unknown_tables_2(self):
+        """Verify get_unknown_tables() returns sorted unlisted tables."""
+        self.tables.update({"tmp_b", "tmp_a"})
+        unknown = freeze_db.get_unknown_tables(self.tables)
+        self.assertEqual(unknown, ["tmp_a", "tmp_b"])
+
+    @patch("pdm_utils.pipelines.freeze_db.mysqldb_basic.copy_schema")
+    def test_copy_subset_1(self, copy_schema_mock):
+        """Verify copy_subset() copies rows of every subset table."""
+        copy_schema_mock.return_value = self.tables
+        result = freeze_db.copy_subset(self.mock_engine, "new", {"Trixie"})
+        connection = self.mock_engine.begin.return_value.__enter__.return_value
+        with self.subTest():
+            self.assertEqual(result, 0)
+        with self.subTest():
+            self.assertEqual(connection.execute.call_count,
+                             len(freeze_db.SUBSET_TABLES))
+
+    @patch("pdm_utils.pipelines.freeze_db.mysqldb_basic.copy_schema")
+    def test_copy_subset_2(self, copy_schema_mock):
+        """Verify copy_subset() fails without copying rows when the
+        schema contains a table not listed in SUBSET_TABLES."""
+        copy_schema_mock.return_value = self.tables | {"new_table"}
+        result = freeze_db.copy_subset(self.mock_engine, "new", {"Trixie"})
+        with self.subTest():
+            self.assertEqual(result, 1)
+        with self.subTest():
+            self.mock_engine.begin.assert_not_called()
+
+    @patch("builtins.print")
+    @patch("pdm_utils.pipelines.freeze_db.mysqldb_basic.copy_schema")
+    def test_copy_subset_3(self, copy_schema_mock, print_mock):
+        """Verify copy_subset() reports the message of a database error."""
+        copy_schema_mock.side_effect = OperationalError(
+                                        "", "", Exception("Disk full"))
+        result = freeze_db.copy_subset(self.mock_engine, "new", {"Trixie"})
+        messages = [str(args[0][0]) for args in print_mock.call_args_list]
+        with self.subTest():
+            self.assertEqual(result, 1)
+        with self.subTest():
+            self.assertIn("Disk full", messages)
+
+    @patch("pdm_utils.pipelines.freeze_db.mysqldb_basic.copy_schema")
+    def test_copy_subset_4(self, copy_schema_mock):
+        """Verify copy_subset() does not hide errors unrelated to the
+        database."""
+        copy_schema_mock.side_effect = KeyError("phage")
+        with self.assertRaises(KeyError):
+            freeze_db.copy_subset(self.mock_engine, "new", {"Trixie"})
+
+
+if __name__ == "__main__":
+    unittest.main()
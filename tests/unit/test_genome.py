@@ -3,6 +3,7 @@
 from datetime import datetime
 import pathlib
 import unittest
+from unittest.mock import Mock
 
 from Bio.Seq import Seq
 from Bio.Alphabet import IUPAC
@@ -43,6 +44,43 @@ class TestGenomeClass1(unittest.TestCase):
 
         self.source1 = source.Source()
 
+    def test_seq_1(self):
+        """Verify the sequence is retrieved from a sequence loader
+        only once, on first access."""
+        loader = Mock()
+        loader.get_sequence.return_value = Seq("AATT")
+        self.gnm.id = "Trixie"
+        self.gnm.set_sequence_loader(loader)
+        with self.subTest():
+            loader.get_sequence.assert_not_called()
+        with self.subTest():
+            self.assertEqual(self.gnm.seq, "AATT")
+        with self.subTest():
+            self.assertEqual(self.gnm.seq, "AATT")
+        with self.subTest():
+            loader.get_sequence.assert_called_once_with("Trixie")
+
+    def test_seq_2(self):
+        """Verify a set sequence replaces the sequence loader."""
+        loader = Mock()
+        self.gnm.set_sequence_loader(loader)
+        self.gnm.set_sequence("GGCC")
+        with self.subTest():
+            self.assertEqual(self.gnm.seq, "GGCC")
+        with self.subTest():
+            loader.get_sequence.assert_not_called()
+
+    def test_seq_3(self):
+        """Verify the empty sequence is retained if the loader can not
+        retrieve the sequence."""
+        loader = Mock()
+        loader.get_sequence.return_value = None
+        self.gnm.set_sequence_loader(loader)
+        self.assertEqual(self.gnm.seq, "")
+
+
+
+
     def test_set_filename_1(self):
         """Confirm file path is split appropriately."""
         filepath = pathlib.Path("/path/to/folder/Trixie.gbk")
@@ -178,6 +216,39 @@ class TestGenomeClass1(unittest.TestCase):
 
 
 
+    def test_translate_cds_features_1(self):
+        """Verify all CDS features are translated with their own
+        translation tables, and translations are not set by default."""
+        self.cds1.seq = Seq("ATGTTTTGA", IUPAC.ambiguous_dna)
+        self.cds1.translation_table = 11
+        self.cds2.seq = Seq("ATGTGATAA", IUPAC.ambiguous_dna)
+        self.cds2.translation_table = 4
+        self.cds3.seq = Seq("ATGTTTTAATAA", IUPAC.ambiguous_dna)
+        self.cds3.translation_table = 11
+        self.gnm.cds_features = [self.cds1, self.cds2, self.cds3]
+        results = self.gnm.translate_cds_features()
+        with self.subTest():
+            self.assertEqual(results[0], ("MF", None))
+        with self.subTest():
+            self.assertEqual(results[1], ("MW", None))
+        with self.subTest():
+            self.assertEqual(results[2], ("", "internal_stop"))
+        with self.subTest():
+            self.assertEqual(self.cds1.translation, "")
+
+    def test_translate_cds_features_2(self):
+        """Verify translations are set when fill is True."""
+        self.cds1.seq = Seq("ATGTTTTGA", IUPAC.ambiguous_dna)
+        self.cds1.translation_table = 11
+        self.gnm.cds_features = [self.cds1]
+        self.gnm.translate_cds_features(fill=True)
+        with self.subTest():
+            self.assertEqual(self.cds1.translation, "MF")
+        with self.subTest():
+            self.assertEqual(self.cds1.translation_length, 2)
+
+
+
     def test_set_source_features_1(self):
         """Check that source feature list is set and length is computed."""
         features_list = [0,1,2,3]
@@ -1461,6 +1532,108 @@ class TestGenomeClass1(unittest.TestCase):
         self.gnm.check_feature_coordinates(use_cds=True)
         self.assertEqual(self.gnm.evaluations[0].status, "correct")
 
+    def test_check_feature_coordinates_16(self):
+        """Verify an error is produced by two CDS features with nested
+        coordinates when they are not adjacent after sorting."""
+        self.cds1.orientation = "F"
+        self.cds1.start = 5
+        self.cds1.stop = 500
+        self.cds2.orientation = "F"
+        self.cds2.start = 10
+        self.cds2.stop = 600
+        self.cds3.orientation = "F"
+        self.cds3.start = 20
+        self.cds3.stop = 100
+        self.gnm.cds_features = [self.cds1, self.cds2, self.cds3]
+        self.gnm.check_feature_coordinates(use_cds=True)
+        with self.subTest():
+            self.assertEqual(self.gnm.evaluations[0].status, "error")
+        with self.subTest():
+            self.assertEqual(
+                self.gnm.evaluations[0].result.count("is nested within"), 2)
+
+
+
+
+class TestIntervalIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.cds1 = cds.Cds()
+        self.cds1.id = "Trixie_1"
+        self.cds1.start = 5
+        self.cds1.stop = 500
+        self.cds1.orientation = "F"
+        self.cds2 = cds.Cds()
+        self.cds2.id = "Trixie_2"
+        self.cds2.start = 10
+        self.cds2.stop = 600
+        self.cds2.orientation = "F"
+        self.cds3 = cds.Cds()
+        self.cds3.id = "Trixie_3"
+        self.cds3.start = 20
+        self.cds3.stop = 100
+        self.cds3.orientation = "F"
+        self.cds4 = cds.Cds()
+        self.cds4.id = "Trixie_4"
+        self.cds4.start = 700
+        self.cds4.stop = 900
+        self.cds4.orientation = "R"
+        self.cds5 = cds.Cds()
+        self.cds5.id = "Trixie_5"
+        self.cds5.start = 700
+        self.cds5.stop = 800
+        self.cds5.orientation = "R"
+        self.features = [self.cds4, self.cds3, self.cds2, self.cds1, self.cds5]
+        self.index = genome.IntervalIndex(self.features)
+
+    def test_init_1(self):
+        """Verify features are sorted by start and stop coordinates."""
+        with self.subTest():
+            self.assertEqual(len(self.index), 5)
+        with self.subTest():
+            self.assertEqual(self.index.starts, [5, 10, 20, 700, 700])
+        with self.subTest():
+            self.assertEqual(self.index.stops, [500, 600, 100, 800, 900])
+
+    def test_query_1(self):
+        """Verify all features overlapping a region are returned."""
+        ftrs = self.index.query(550, 750)
+        self.assertEqual(ftrs, [self.cds2, self.cds5, self.cds4])
+
+    def test_query_2(self):
+        """Verify features bordering a region are not returned."""
+        ftrs = self.index.query(600, 700)
+        self.assertEqual(ftrs, [])
+
+    def test_query_3(self):
+        """Verify an empty index can be queried."""
+        index = genome.IntervalIndex([])
+        self.assertEqual(index.query(0, 100), [])
+
+    def test_get_conflicts_1(self):
+        """Verify all nested and shared stop conflicts are identified."""
+        conflicts = self.index.get_conflicts()
+        expected = [(self.cds1, self.cds3, "nested"),
+                    (self.cds2, self.cds3, "nested"),
+                    (self.cds5, self.cds4, "shared_stop")]
+        self.assertEqual(conflicts, expected)
+
+    def test_get_conflicts_2(self):
+        """Verify duplicate features are not also reported as
+        shared stop conflicts."""
+        self.cds5.stop = 900
+        index = genome.IntervalIndex([self.cds4, self.cds5])
+        conflicts = index.get_conflicts()
+        self.assertEqual(conflicts, [(self.cds4, self.cds5, "duplicate")])
+
+    def test_get_conflicts_3(self):
+        """Verify features that wrap around the end of the genome are
+        not reported as nested."""
+        self.cds4.start = 50000
+        self.cds4.stop = 20
+        index = genome.IntervalIndex([self.cds1, self.cds4])
+        self.assertEqual(index.get_conflicts(), [])
+
 
 
 
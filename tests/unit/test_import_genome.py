@@ -2,7 +2,7 @@
 
 import pathlib
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 from Bio.Seq import Seq
 from Bio.Alphabet import IUPAC
@@ -15,6 +15,8 @@ from pdm_utils.classes import source
 from pdm_utils.classes import cds, trna, tmrna
 from pdm_utils.classes import genomepair
 from pdm_utils.classes import ticket
+from pdm_utils.classes.evalcache import EvalCache
+from pdm_utils.classes.evaluation import Evaluation
 from pdm_utils.constants import constants
 from pdm_utils.functions import eval_modes
 from pdm_utils.pipelines import import_genome
@@ -2424,6 +2426,186 @@ class TestImportGenome9(unittest.TestCase):
 
 
 
+class TestImportGenome10(unittest.TestCase):
+
+    def setUp(self):
+        self.tkt = ticket.ImportTicket()
+        self.tkt.phage_id = "Trixie"
+        self.tkt.type = "add"
+        self.tkt.eval_flags = eval_modes.get_eval_flag_dict("base")
+        self.tkt.description_field = "product"
+
+        self.cds1 = cds.Cds()
+        self.cds2 = cds.Cds()
+
+        self.gnm1 = genome.Genome()
+        self.gnm1.id = "Trixie"
+        self.gnm1.type = "flat_file"
+        self.gnm1.cds_features = [self.cds1, self.cds2]
+
+        self.bndl = bundle.Bundle()
+        self.bndl.ticket = self.tkt
+        self.bndl.genome_dict["flat_file"] = self.gnm1
+
+        self.eval_cache = Mock(spec=EvalCache)
+        self.eval_cache.full_hits = 0
+        self.eval_cache.partial_hits = 0
+
+        self.evl1 = Evaluation(id="CDS-EVAL-001", status="correct")
+        self.evl2 = Evaluation(id="GNM-EVAL-001", status="error")
+        self.entry = {"genome_key": "genome_key",
+                      "features": {"cds_1": [self.evl1]},
+                      "genomes": {"genome_flat_file": [self.evl2]}}
+
+    @patch("pdm_utils.pipelines.import_genome.run_checks")
+    @patch("pdm_utils.pipelines.import_genome.get_eval_cache_keys")
+    def test_run_cached_checks_1(self, get_keys_mock, run_checks_mock):
+        """Verify all checks are run and the results are cached
+        when there is no cached entry."""
+        get_keys_mock.return_value = ("feature_key", "genome_key")
+        self.eval_cache.get_entry.return_value = None
+        status = import_genome.run_cached_checks(
+                    self.bndl, self.eval_cache, filepath=pathlib.Path(),
+                    file_ref="flat_file")
+        with self.subTest():
+            self.assertEqual(status, "miss")
+        with self.subTest():
+            run_checks_mock.assert_called_once()
+        with self.subTest():
+            self.assertNotIn("feature_checks",
+                             run_checks_mock.call_args[1].keys())
+        with self.subTest():
+            self.eval_cache.put_entry.assert_called_once()
+
+    @patch("pdm_utils.pipelines.import_genome.run_checks")
+    @patch("pdm_utils.pipelines.import_genome.get_eval_cache_keys")
+    def test_run_cached_checks_2(self, get_keys_mock, run_checks_mock):
+        """Verify no checks are run when the cached entry matches
+        both keys."""
+        get_keys_mock.return_value = ("feature_key", "genome_key")
+        self.eval_cache.get_entry.return_value = self.entry
+        status = import_genome.run_cached_checks(
+                    self.bndl, self.eval_cache, filepath=pathlib.Path(),
+                    file_ref="flat_file")
+        with self.subTest():
+            self.assertEqual(status, "full")
+        with self.subTest():
+            run_checks_mock.assert_not_called()
+        with self.subTest():
+            self.eval_cache.put_entry.assert_not_called()
+        with self.subTest():
+            self.assertEqual(self.cds1.evaluations, [])
+        with self.subTest():
+            self.assertEqual(self.cds2.evaluations, [self.evl1])
+        with self.subTest():
+            self.assertEqual(self.gnm1.evaluations, [self.evl2])
+        with self.subTest():
+            self.assertEqual(self.eval_cache.full_hits, 1)
+
+    @patch("pdm_utils.pipelines.import_genome.run_checks")
+    @patch("pdm_utils.pipelines.import_genome.get_eval_cache_keys")
+    def test_run_cached_checks_3(self, get_keys_mock, run_checks_mock):
+        """Verify only genome checks are run when the cached entry
+        matches only the feature key."""
+        get_keys_mock.return_value = ("feature_key", "new_genome_key")
+        self.eval_cache.get_entry.return_value = self.entry
+        status = import_genome.run_cached_checks(
+                    self.bndl, self.eval_cache, filepath=pathlib.Path(),
+                    file_ref="flat_file")
+        with self.subTest():
+            self.assertEqual(status, "partial")
+        with self.subTest():
+            self.assertFalse(run_checks_mock.call_args[1]["feature_checks"])
+        with self.subTest():
+            self.assertEqual(self.cds2.evaluations, [self.evl1])
+        with self.subTest():
+            self.assertEqual(self.gnm1.evaluations, [])
+        with self.subTest():
+            self.eval_cache.put_entry.assert_called_once()
+        with self.subTest():
+            self.assertEqual(self.eval_cache.partial_hits, 1)
+
+    def test_run_cached_checks_4(self):
+        """Verify that evaluations produced without the cache match
+        evaluations restored from the cache."""
+        self.eval_cache.get_entry.return_value = None
+        self.tkt.evaluations.append(Evaluation(id="TKT-EVAL-001"))
+        with patch("pdm_utils.pipelines.import_genome.get_eval_cache_keys",
+                   return_value=("feature_key", "genome_key")):
+            import_genome.run_cached_checks(
+                self.bndl, self.eval_cache, filepath=pathlib.Path(),
+                file_ref="flat_file")
+        entry = self.eval_cache.put_entry.call_args[0][1]
+        with self.subTest():
+            self.assertEqual(len(entry["features"]["cds_0"]),
+                             len(self.cds1.evaluations))
+        with self.subTest():
+            self.assertEqual(len(entry["genomes"]["genome_flat_file"]),
+                             len(self.gnm1.evaluations))
+        with self.subTest():
+            self.assertNotIn("ticket", entry["genomes"].keys())
+
+
+
+
+    def test_get_eval_cache_keys_1(self):
+        """Verify no keys are computed when there is no filepath."""
+        keys = import_genome.get_eval_cache_keys(self.bndl, None, {},
+                                                 file_ref="flat_file")
+        self.assertEqual(keys, (None, None))
+
+    @patch("pdm_utils.pipelines.import_genome.open", create=True)
+    def test_get_eval_cache_keys_2(self, open_mock):
+        """Verify only the genome key changes when reference data changes."""
+        open_mock.return_value.__enter__.return_value.read.return_value = b"A"
+        keys1 = import_genome.get_eval_cache_keys(
+                    self.bndl, pathlib.Path("Trixie.gb"),
+                    {"phage_id_set": {"L5"}}, file_ref="flat_file")
+        keys2 = import_genome.get_eval_cache_keys(
+                    self.bndl, pathlib.Path("Trixie.gb"),
+                    {"phage_id_set": {"L5", "D29"}}, file_ref="flat_file")
+        with self.subTest():
+            self.assertEqual(keys1[0], keys2[0])
+        with self.subTest():
+            self.assertNotEqual(keys1[1], keys2[1])
+
+    @patch("pdm_utils.pipelines.import_genome.open", create=True)
+    def test_get_eval_cache_keys_3(self, open_mock):
+        """Verify the feature key changes when the eval flags change."""
+        open_mock.return_value.__enter__.return_value.read.return_value = b"A"
+        keys1 = import_genome.get_eval_cache_keys(
+                    self.bndl, pathlib.Path("Trixie.gb"), {},
+                    file_ref="flat_file")
+        self.tkt.eval_flags = eval_modes.get_eval_flag_dict("draft")
+        keys2 = import_genome.get_eval_cache_keys(
+                    self.bndl, pathlib.Path("Trixie.gb"), {},
+                    file_ref="flat_file")
+        self.assertNotEqual(keys1[0], keys2[0])
+
+    @patch("pdm_utils.pipelines.import_genome.open", create=True)
+    def test_get_eval_cache_keys_4(self, open_mock):
+        """Verify the genome key only changes with sequence reference data
+        when membership of the genome sequence changes."""
+        open_mock.return_value.__enter__.return_value.read.return_value = b"A"
+        self.gnm1.seq = Seq("ATGC")
+        keys1 = import_genome.get_eval_cache_keys(
+                    self.bndl, pathlib.Path("Trixie.gb"),
+                    {"seq_set": {Seq("AAAA")}}, file_ref="flat_file")
+        keys2 = import_genome.get_eval_cache_keys(
+                    self.bndl, pathlib.Path("Trixie.gb"),
+                    {"seq_set": {Seq("AAAA"), Seq("CCCC")}},
+                    file_ref="flat_file")
+        keys3 = import_genome.get_eval_cache_keys(
+                    self.bndl, pathlib.Path("Trixie.gb"),
+                    {"seq_set": {Seq("AAAA"), Seq("ATGC")}},
+                    file_ref="flat_file")
+        with self.subTest():
+            self.assertEqual(keys1[1], keys2[1])
+        with self.subTest():
+            self.assertNotEqual(keys1[1], keys3[1])
+
+
+
 
 if __name__ == '__main__':
     unittest.main()
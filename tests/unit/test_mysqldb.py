@@ -5,6 +5,8 @@ from datetime import datetime
 from pathlib import Path
 import sys
 import unittest
+from unittest.mock import Mock
+from unittest.mock import patch
 
 from Bio.Seq import Seq
 
@@ -460,5 +462,126 @@ class TestMysqldbFunctions2(unittest.TestCase):
 
 
 
+
+class TestMysqldbFunctions3(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = Mock()
+        self.phage_data = [{"PhageID": "Trixie", "Length": 100},
+                           {"PhageID": "L5", "Length": 200},
+                           {"PhageID": "D29", "Length": 300}]
+        self.gene_data = [{"PhageID": "D29", "GeneID": "D29_1"},
+                          {"PhageID": "Trixie", "GeneID": "Trixie_1"},
+                          {"PhageID": "Trixie", "GeneID": "Trixie_2"}]
+
+    @patch("pdm_utils.functions.mysqldb_basic.retrieve_data")
+    def test_parse_feature_dict_1(self, retrieve_data_mock):
+        """Verify features are retrieved in chunks and grouped by PhageID."""
+        retrieve_data_mock.side_effect = [self.gene_data[:1],
+                                          self.gene_data[1:]]
+        ftr_dict = mysqldb.parse_feature_dict(
+                        self.engine, "cds", ["D29", "L5", "Trixie"],
+                        "SELECT * FROM gene", chunk_size=2)
+        with self.subTest():
+            self.assertEqual(retrieve_data_mock.call_count, 2)
+        with self.subTest():
+            self.assertEqual(set(ftr_dict.keys()), {"D29", "Trixie"})
+        with self.subTest():
+            self.assertEqual([ftr.id for ftr in ftr_dict["Trixie"]],
+                             ["Trixie_1", "Trixie_2"])
+
+    @patch("pdm_utils.functions.mysqldb_basic.retrieve_data")
+    def test_parse_feature_dict_2(self, retrieve_data_mock):
+        """Verify features are retrieved for each genome separately if
+        the query does not select PhageID."""
+        retrieve_data_mock.side_effect = [[{"GeneID": "L5_1"}],
+                                          [{"GeneID": "L5_1"}],
+                                          [{"GeneID": "D29_1"}]]
+        ftr_dict = mysqldb.parse_feature_dict(
+                        self.engine, "cds", ["L5", "D29"],
+                        "SELECT GeneID FROM gene")
+        with self.subTest():
+            self.assertEqual(retrieve_data_mock.call_count, 3)
+        with self.subTest():
+            self.assertEqual(ftr_dict["D29"][0].id, "D29_1")
+
+    @patch("pdm_utils.functions.mysqldb_basic.retrieve_data")
+    def test_parse_genome_data_1(self, retrieve_data_mock):
+        """Verify features of all genomes are retrieved with one query
+        and genomes retain the order of the phage query."""
+        retrieve_data_mock.side_effect = [self.phage_data, self.gene_data]
+        genome_list = mysqldb.parse_genome_data(
+                        self.engine, phage_query="SELECT * FROM phage",
+                        gene_query="SELECT * FROM gene")
+        with self.subTest():
+            self.assertEqual(retrieve_data_mock.call_count, 2)
+        with self.subTest():
+            self.assertEqual([gnm.id for gnm in genome_list],
+                             ["Trixie", "L5", "D29"])
+        with self.subTest():
+            self.assertEqual(len(genome_list[0].cds_features), 2)
+        with self.subTest():
+            self.assertEqual(len(genome_list[1].cds_features), 0)
+        with self.subTest():
+            self.assertEqual(genome_list[2].cds_features[0].genome_length,
+                             300)
+
+
+
+
+class TestMysqldbFunctions4(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = Mock()
+        self.genomes = {}
+        for phage_id in ["Trixie", "D29", "L5"]:
+            gnm = genome.Genome()
+            gnm.id = phage_id
+            self.genomes[phage_id] = gnm
+
+    def parse_genome_data(self, engine, phage_id_list=None, **kwargs):
+        return [self.genomes[phage_id] for phage_id in reversed(phage_id_list)
+                if phage_id in self.genomes.keys()]
+
+    @patch("pdm_utils.functions.mysqldb.parse_genome_data")
+    @patch("pdm_utils.functions.mysqldb_basic.query_set")
+    def test_iter_genome_data_1(self, query_set_mock, parse_genome_data_mock):
+        """Verify genomes are retrieved in batches and yielded one at a time
+        in order of PhageID."""
+        query_set_mock.return_value = {"Trixie", "D29", "L5"}
+        parse_genome_data_mock.side_effect = self.parse_genome_data
+        genomes = mysqldb.iter_genome_data(
+                        self.engine, phage_query="SELECT * FROM phage",
+                        gene_query="SELECT * FROM gene", batch_size=2)
+        with self.subTest():
+            self.assertFalse(isinstance(genomes, list))
+        genome_list = list(genomes)
+        with self.subTest():
+            self.assertEqual([gnm.id for gnm in genome_list],
+                             ["D29", "L5", "Trixie"])
+        with self.subTest():
+            self.assertEqual([call_args[1]["phage_id_list"] for call_args
+                              in parse_genome_data_mock.call_args_list],
+                             [["D29", "L5"], ["Trixie"]])
+        with self.subTest():
+            self.assertEqual(parse_genome_data_mock.call_args[1]["gene_query"],
+                             "SELECT * FROM gene")
+
+    @patch("pdm_utils.functions.mysqldb.parse_genome_data")
+    @patch("pdm_utils.functions.mysqldb_basic.query_set")
+    def test_iter_genome_data_2(self, query_set_mock, parse_genome_data_mock):
+        """Verify PhageIDs are not retrieved if a PhageID list is provided."""
+        parse_genome_data_mock.side_effect = self.parse_genome_data
+        genome_list = list(mysqldb.iter_genome_data(
+                                self.engine, phage_id_list=["L5"],
+                                phage_query="SELECT * FROM phage"))
+        with self.subTest():
+            query_set_mock.assert_not_called()
+        with self.subTest():
+            self.assertEqual([gnm.id for gnm in genome_list], ["L5"])
+
+
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,10 @@
 from pathlib import Path
 import sys
 import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from sqlalchemy.exc import OperationalError
 
 from pdm_utils.functions import mysqldb_basic
 
@@ -64,6 +68,66 @@ class TestMysqldbBasic1(unittest.TestCase):
         self.assertEqual(value, "NULL")
 
 
+class TestMysqldbBasic2(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = MagicMock()
+        self.engine.url.database = "Actinobacteriophage"
+        self.connection = self.engine.connect.return_value.__enter__.return_value
+
+    @patch("pdm_utils.functions.mysqldb_basic.scalar")
+    @patch("pdm_utils.functions.mysqldb_basic.copy_schema")
+    def test_copy_db_native_1(self, copy_schema_mock, scalar_mock):
+        """Verify each table is copied with a single INSERT ... SELECT
+        statement."""
+        copy_schema_mock.return_value = {"phage", "gene"}
+        scalar_mock.return_value = 0
+        result = mysqldb_basic.copy_db_native(self.engine, "new", threads=1)
+        statements = [args[0][0] for args in
+                      self.connection.execute.call_args_list]
+        inserts = [statement for statement in statements
+                   if statement.startswith("INSERT")]
+        with self.subTest():
+            self.assertEqual(result, 0)
+        with self.subTest():
+            self.assertEqual(len(inserts), 2)
+        with self.subTest():
+            self.assertFalse(any("KEYS" in statement
+                                 for statement in statements))
+
+    @patch("builtins.print")
+    @patch("pdm_utils.functions.mysqldb_basic.copy_schema")
+    def test_copy_db_native_2(self, copy_schema_mock, print_mock):
+        """Verify the message of a database error is reported."""
+        copy_schema_mock.side_effect = OperationalError(
+                                    "", "", Exception("Access denied"))
+        result = mysqldb_basic.copy_db_native(self.engine, "new")
+        messages = [str(args[0][0]) for args in print_mock.call_args_list]
+        with self.subTest():
+            self.assertEqual(result, 1)
+        with self.subTest():
+            self.assertIn("Access denied", messages)
+
+    @patch("builtins.print")
+    @patch("pdm_utils.functions.mysqldb_basic.pipe_commands")
+    @patch("pdm_utils.functions.mysqldb_basic.copy_db_native")
+    @patch("pdm_utils.functions.mysqldb_basic.get_mysql_dbs")
+    def test_copy_db_1(self, get_dbs_mock, native_mock, pc_mock, print_mock):
+        """Verify the fallback to mysqldump is reported if the native copy
+        fails."""
+        get_dbs_mock.return_value = {"new"}
+        native_mock.return_value = 1
+        result = mysqldb_basic.copy_db(self.engine, "new")
+        messages = [str(args[0][0]) for args in print_mock.call_args_list]
+        with self.subTest():
+            self.assertEqual(result, 0)
+        with self.subTest():
+            pc_mock.assert_called()
+        with self.subTest():
+            self.assertIn("Falling back to mysqldump to copy the database.",
+                          messages)
+
+
 
 if __name__ == '__main__':
     unittest.main()
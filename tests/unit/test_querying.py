@@ -8,6 +8,8 @@ from networkx import Graph
 from sqlalchemy import create_engine
 from sqlalchemy import Column
 from sqlalchemy import MetaData
+from sqlalchemy import select
+from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy.sql import distinct
 from sqlalchemy.sql import func
@@ -15,6 +17,7 @@ from sqlalchemy.sql import functions
 from sqlalchemy.sql.elements import BinaryExpression
 from sqlalchemy.sql.elements import BindParameter
 from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.sql.schema import ForeignKey
 
 from pdm_utils.functions import querying
@@ -621,6 +624,36 @@ class TestBuildClauses(unittest.TestCase):
         get_table_pathing_mock.assert_called_with(self.graph, self.table_names)
         join_pathed_tables_mock.assert_called_with(self.graph, self.pathing)
 
+    @patch("pdm_utils.functions.querying.join_pathed_tables")
+    @patch("pdm_utils.functions.querying.get_table_pathing")
+    @patch("pdm_utils.functions.querying.get_table_list")
+    def test_build_fromclause_2(self, get_table_list_mock,
+                                      get_table_pathing_mock,
+                                      join_pathed_tables_mock):
+        """Verify build_fromclause() reuses joins planned for a set of tables
+        until they are cleared.
+        """
+        joined_table = Mock()
+        get_table_list_mock.return_value = self.table_names
+        get_table_pathing_mock.return_value = self.pathing
+        join_pathed_tables_mock.return_value = joined_table
+
+        first = querying.build_fromclause(self.graph, self.tables)
+        second = querying.build_fromclause(self.graph, self.tables)
+
+        with self.subTest():
+            self.assertIs(first, joined_table)
+        with self.subTest():
+            self.assertIs(second, joined_table)
+        with self.subTest():
+            get_table_pathing_mock.assert_called_once()
+
+        querying.clear_join_plans(self.graph)
+        querying.build_fromclause(self.graph, self.tables)
+
+        with self.subTest():
+            self.assertEqual(get_table_pathing_mock.call_count, 2)
+
     @patch("pdm_utils.functions.querying.append_order_by_clauses")
     @patch("pdm_utils.functions.querying.append_where_clauses")
     @patch("pdm_utils.functions.querying.select")
@@ -817,14 +850,15 @@ class TestExecute(unittest.TestCase):
         """
         querying.execute(self.mock_engine, self.mock_executable,
                          values=self.values, in_column=self.mock_in_column,
-                         limit=8001, return_dict=False)
+                         limit=8001, return_dict=False, threads=2)
 
         subqueries_mock.assert_called_with(self.mock_engine,
                                            self.mock_executable,
                                            self.mock_in_column,
                                            self.values,
                                            limit=8001, 
-                                           return_dict=False)
+                                           return_dict=False,
+                                           threads=2)
 
     def test_execute_6(self):
         """Verify that execute() raises ValueError with lacking instruction.
@@ -854,13 +888,13 @@ class TestExecute(unittest.TestCase):
         """
         querying.first_column(self.mock_engine, self.mock_executable,
                               in_column=self.mock_in_column, 
-                              values=self.values, limit=8001)
+                              values=self.values, limit=8001, threads=2)
 
         subqueries_mock.assert_called_with(self.mock_engine,
                                            self.mock_executable,
                                            self.mock_in_column,
                                            self.values,
-                                           limit=8001)
+                                           limit=8001, threads=2)
 
     def test_first_column_4(self):
         """Verify first_column() raises ValueError with lacking instructions.
@@ -995,5 +1029,281 @@ class TestExecute(unittest.TestCase):
         self.mock_in_column.in_.assert_any_call(self.values[:2])
         self.mock_in_column.in_.assert_any_call([self.values[2]])
 
+    @patch("pdm_utils.functions.querying.execute_temp_table_subquery")
+    def test_first_column_value_subqueries_6(self, temp_table_mock):
+        """Verify that first_column_value_subqueries() joins values from
+        a temporary table above the threshold.
+        """
+        temp_table_mock.return_value = [("Trixie",), ("D29",)]
+
+        results = querying.first_column_value_subqueries(
+                                          self.mock_engine,
+                                          self.mock_executable,
+                                          self.mock_in_column,
+                                          self.values,
+                                          threshold=2)
+
+        temp_table_mock.assert_called_once_with(self.mock_engine,
+                                                self.mock_executable,
+                                                self.mock_in_column,
+                                                self.values, limit=8000)
+        self.mock_in_column.in_.assert_not_called()
+        self.assertEqual(results, ["Trixie", "D29"])
+
+    @patch("pdm_utils.functions.querying.execute_temp_table_subquery")
+    def test_execute_value_subqueries_6(self, temp_table_mock):
+        """Verify that execute_value_subqueries() joins values from
+        a temporary table above the threshold.
+        """
+        temp_table_mock.return_value = [("Trixie", "A")]
+
+        results = querying.execute_value_subqueries(
+                                          self.mock_engine,
+                                          self.mock_executable,
+                                          self.mock_in_column,
+                                          self.values,
+                                          return_dict=False,
+                                          threshold=2)
+
+        temp_table_mock.assert_called_once()
+        self.mock_in_column.in_.assert_not_called()
+        self.assertEqual(results, [("Trixie", "A")])
+
+    def test_get_collation_key_1(self):
+        """Verify get_collation_key() ignores case and trailing spaces of
+        text values only.
+        """
+        column = Mock(spec=Column)
+        column.type.python_type = str
+        binary_column = Mock(spec=Column)
+        binary_column.type.python_type = bytes
+
+        with self.subTest():
+            self.assertEqual(querying.get_collation_key(column, "Trixie "),
+                             querying.get_collation_key(column, "TRIXIE"))
+        with self.subTest():
+            self.assertNotEqual(querying.get_collation_key(column, " Trixie"),
+                                querying.get_collation_key(column, "Trixie"))
+        with self.subTest():
+            self.assertNotEqual(
+                        querying.get_collation_key(binary_column, "Trixie"),
+                        querying.get_collation_key(binary_column, "trixie"))
+        with self.subTest():
+            self.assertEqual(querying.get_collation_key(column, 1), 1)
+
+    def test_use_temp_table_1(self):
+        """Verify use_temp_table() compares the number of values to the
+        threshold.
+        """
+        with self.subTest():
+            self.assertTrue(querying.use_temp_table(self.values, threshold=2))
+        with self.subTest():
+            self.assertFalse(querying.use_temp_table(self.values, threshold=3))
+
+    @patch("pdm_utils.functions.querying.TEMP_TABLE_THRESHOLD", None)
+    def test_use_temp_table_2(self):
+        """Verify use_temp_table() returns False if temporary tables are
+        disabled.
+        """
+        self.assertFalse(querying.use_temp_table(self.values))
+
+    def test_get_chunk_threads_1(self):
+        """Verify get_chunk_threads() caps threads by the number of chunks,
+        MAX_CHUNK_THREADS and the connection pool size.
+        """
+        self.mock_engine.pool.size.return_value = 5
+
+        with self.subTest():
+            self.assertEqual(querying.get_chunk_threads(self.mock_engine,
+                                                        4, 3), 3)
+        with self.subTest():
+            self.assertEqual(querying.get_chunk_threads(self.mock_engine,
+                                                        4, 40), 4)
+        with self.subTest():
+            self.assertEqual(querying.get_chunk_threads(self.mock_engine,
+                                                        20, 40), 5)
+        with self.subTest():
+            self.assertEqual(querying.get_chunk_threads(self.mock_engine,
+                                                        None, 40), 1)
+
+    def test_execute_chunks_1(self):
+        """Verify execute_chunks() returns results in chunk order when
+        chunks are executed concurrently.
+        """
+        self.mock_engine.pool.size.return_value = 5
+        results = {"chunk_1" : [("Trixie",)], "chunk_2" : [("D29",)],
+                   "chunk_3" : [("Myrna",)]}
+        self.mock_engine.execute.side_effect = \
+                lambda subquery: Mock(**{"fetchall.return_value" :
+                                                        results[subquery]})
+
+        results_list = querying.execute_chunks(self.mock_engine,
+                                               ["chunk_1", "chunk_2",
+                                                "chunk_3"], threads=3)
+
+        self.assertEqual(results_list, [[("Trixie",)], [("D29",)],
+                                        [("Myrna",)]])
+
+    def test_iter_execute_1(self):
+        """Verify iter_execute() streams each value chunk in batches.
+        """
+        engine = MagicMock()
+        connection = engine.connect.return_value.__enter__.return_value
+        streaming = connection.execution_options.return_value
+        streaming.execute.return_value = self.mock_proxy
+        self.mock_proxy.fetchmany.side_effect = [[("Trixie", "A"),
+                                                  ("D29", "A")], [],
+                                                 [("Myrna", "C")], []]
+
+        batches = list(querying.iter_execute(engine, self.mock_executable,
+                                             in_column=self.mock_in_column,
+                                             values=self.values,
+                                             limit=2, batch_size=2,
+                                             return_dict=False))
+
+        with self.subTest():
+            self.assertEqual(batches, [[("Trixie", "A"), ("D29", "A")],
+                                       [("Myrna", "C")]])
+        with self.subTest():
+            connection.execution_options.assert_called_with(
+                                                    stream_results=True)
+        with self.subTest():
+            self.mock_proxy.fetchmany.assert_called_with(2)
+        with self.subTest():
+            self.assertEqual(streaming.execute.call_count, 2)
+        with self.subTest():
+            self.mock_proxy.fetchall.assert_not_called()
+
+    def test_iter_execute_2(self):
+        """Verify iter_execute() raises ValueError if values are given
+        without a Column.
+        """
+        with self.assertRaises(ValueError):
+            list(querying.iter_execute(self.mock_engine, self.mock_executable,
+                                       values=self.values))
+
+class TestValueSubqueries(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        metadata = MetaData()
+        self.phage = Table("phage", metadata,
+                           Column("PhageID", String(25), primary_key=True),
+                           Column("Cluster", String(5)))
+        metadata.create_all(self.engine)
+        self.engine.execute(self.phage.insert(),
+                            [{"PhageID" : "Trixie", "Cluster" : "A"},
+                             {"PhageID" : "D29", "Cluster" : "A"},
+                             {"PhageID" : "Myrna", "Cluster" : "C"}])
+
+        self.executable = select([self.phage.c.PhageID])
+        self.values = ["Trixie", "Myrna", "Alice"]
+
+    def fetch(self, connection, subqueries):
+        return sorted(row[0] for subquery in subqueries
+                             for row in connection.execute(subquery))
+
+    def get_temp_tables(self, connection):
+        return [row[0] for row in connection.execute(
+                                    "SELECT name FROM sqlite_temp_master "
+                                    "WHERE type = 'table'")]
+
+    def test_value_subqueries_1(self):
+        """Verify value_subqueries() joins values from a temporary table
+        that is dropped when the block exits.
+        """
+        with self.engine.connect() as connection:
+            with querying.value_subqueries(connection, self.executable,
+                                           self.phage.c.PhageID, self.values,
+                                           threshold=0) as subqueries:
+                tables = self.get_temp_tables(connection)
+                results = self.fetch(connection, subqueries)
+
+            with self.subTest():
+                self.assertEqual(len(subqueries), 1)
+            with self.subTest():
+                self.assertEqual(len(tables), 1)
+            with self.subTest():
+                self.assertEqual(results, ["Myrna", "Trixie"])
+            with self.subTest():
+                self.assertEqual(self.get_temp_tables(connection), [])
+
+    def test_value_subqueries_2(self):
+        """Verify value_subqueries() uses a unique temporary table for
+        each query sharing a connection.
+        """
+        with self.engine.connect() as connection:
+            with querying.value_subqueries(connection, self.executable,
+                                           self.phage.c.PhageID, ["Trixie"],
+                                           threshold=0) as subqueries_1:
+                with querying.value_subqueries(connection, self.executable,
+                                               self.phage.c.PhageID,
+                                               ["D29"],
+                                               threshold=0) as subqueries_2:
+                    tables = self.get_temp_tables(connection)
+                    results_2 = self.fetch(connection, subqueries_2)
+
+                results_1 = self.fetch(connection, subqueries_1)
+
+        with self.subTest():
+            self.assertEqual(len(set(tables)), 2)
+        with self.subTest():
+            self.assertEqual(results_1, ["Trixie"])
+        with self.subTest():
+            self.assertEqual(results_2, ["D29"])
+
+    @patch("pdm_utils.functions.querying.Table.create")
+    def test_value_subqueries_3(self, create_mock):
+        """Verify value_subqueries() falls back to IN clause chunks if the
+        temporary table cannot be created.
+        """
+        create_mock.side_effect = OperationalError("", "", "")
+        with self.engine.connect() as connection:
+            with querying.value_subqueries(connection, self.executable,
+                                           self.phage.c.PhageID, self.values,
+                                           limit=2,
+                                           threshold=0) as subqueries:
+                results = self.fetch(connection, subqueries)
+
+        with self.subTest():
+            self.assertEqual(len(subqueries), 2)
+        with self.subTest():
+            self.assertEqual(results, ["Myrna", "Trixie"])
+
+    def test_value_subqueries_4(self):
+        """Verify value_subqueries() uses IN clause chunks below the
+        threshold.
+        """
+        with self.engine.connect() as connection:
+            with querying.value_subqueries(connection, self.executable,
+                                           self.phage.c.PhageID, self.values,
+                                           limit=2,
+                                           threshold=3) as subqueries:
+                tables = self.get_temp_tables(connection)
+                results = self.fetch(connection, subqueries)
+
+        with self.subTest():
+            self.assertEqual(tables, [])
+        with self.subTest():
+            self.assertEqual(len(subqueries), 2)
+        with self.subTest():
+            self.assertEqual(results, ["Myrna", "Trixie"])
+
+    def test_iter_execute_1(self):
+        """Verify iter_execute() streams a temporary table query and drops
+        the temporary table afterwards.
+        """
+        batches = list(querying.iter_execute(self.engine, self.executable,
+                                             in_column=self.phage.c.PhageID,
+                                             values=self.values,
+                                             return_dict=False,
+                                             threshold=0))
+        results = sorted(row[0] for batch in batches for row in batch)
+
+        with self.subTest():
+            self.assertEqual(results, ["Myrna", "Trixie"])
+        with self.subTest():
+            with self.engine.connect() as connection:
+                self.assertEqual(self.get_temp_tables(connection), [])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,145 @@
+"""Unit tests for the QueryProfiler class."""
+
+import unittest
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from pdm_utils.classes.queryprofiler import QueryProfiler
+from pdm_utils.classes import queryprofiler
+
+
+class TestQueryProfilerFunctions(unittest.TestCase):
+
+    def test_get_fingerprint_1(self):
+        """Verify literal values and placeholders are replaced."""
+        statement = ("SELECT phage.`PhageID` FROM phage\n"
+                     "WHERE phage.`Cluster` = 'A' AND phage.`Length` > 5000")
+        fingerprint = queryprofiler.get_fingerprint(statement)
+        self.assertEqual(fingerprint,
+                         "SELECT phage.`PhageID` FROM phage "
+                         "WHERE phage.`Cluster` = ? AND phage.`Length` > ?")
+
+    def test_get_fingerprint_2(self):
+        """Verify value lists of any length share a fingerprint."""
+        statement_1 = ("SELECT gene.`GeneID` FROM gene WHERE gene.`PhageID` "
+                       "IN (%(PhageID_1)s, %(PhageID_2)s)")
+        statement_2 = ("SELECT gene.`GeneID` FROM gene WHERE gene.`PhageID` "
+                       "IN (%(PhageID_1)s)")
+        fingerprint_1 = queryprofiler.get_fingerprint(statement_1)
+        fingerprint_2 = queryprofiler.get_fingerprint(statement_2)
+        with self.subTest():
+            self.assertEqual(fingerprint_1, fingerprint_2)
+        with self.subTest():
+            self.assertTrue(fingerprint_1.endswith("IN (...)"))
+
+    def test_convert_value_1(self):
+        """Verify EXPLAIN values are converted to JSON serializable values."""
+        with self.subTest():
+            self.assertEqual(queryprofiler.convert_value(b"ref"), "ref")
+        with self.subTest():
+            self.assertEqual(queryprofiler.convert_value(3), 3)
+        with self.subTest():
+            self.assertIsNone(queryprofiler.convert_value(None))
+
+
+
+
+class TestQueryProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = QueryProfiler()
+        self.engine = Mock()
+
+    def test_record_1(self):
+        """Verify executions are aggregated by fingerprint, retaining the
+        slowest execution."""
+        self.profiler.record("SELECT * FROM phage WHERE PhageID = 'L5'",
+                             0.5, rows=1, engine=self.engine)
+        self.profiler.record("SELECT * FROM phage WHERE PhageID = 'D29'",
+                             1.5, rows=2, engine=self.engine)
+        self.profiler.record("SELECT * FROM phage WHERE PhageID = 'Trixie'",
+                             1.0, rows=0, engine=self.engine)
+        entry = self.profiler.stats["SELECT * FROM phage WHERE PhageID = ?"]
+        with self.subTest():
+            self.assertEqual(len(self.profiler.stats), 1)
+        with self.subTest():
+            self.assertEqual(entry["count"], 3)
+        with self.subTest():
+            self.assertEqual(entry["total_time"], 3.0)
+        with self.subTest():
+            self.assertEqual(entry["max_time"], 1.5)
+        with self.subTest():
+            self.assertEqual(entry["rows"], 3)
+        with self.subTest():
+            self.assertIn("D29", entry["statement"])
+
+    def test_after_cursor_execute_1(self):
+        """Verify statements are recorded with the latency measured from
+        the start time stored on the connection."""
+        conn = Mock(info={})
+        cursor = Mock(rowcount=4)
+        with patch("pdm_utils.classes.queryprofiler.time.perf_counter",
+                   side_effect=[10.0, 12.5]):
+            self.profiler.before_cursor_execute(conn, cursor, "SELECT 1",
+                                                (), None, False)
+            self.profiler.after_cursor_execute(conn, cursor, "SELECT 1",
+                                               (), None, False)
+        entry = self.profiler.stats["SELECT ?"]
+        with self.subTest():
+            self.assertEqual(entry["total_time"], 2.5)
+        with self.subTest():
+            self.assertEqual(entry["rows"], 4)
+        with self.subTest():
+            self.assertEqual(conn.info["pdm_utils_profiler_start_times"], [])
+
+    def test_after_cursor_execute_2(self):
+        """Verify statements are not recorded while profiling is disabled."""
+        conn = Mock(info={})
+        self.profiler.enabled = False
+        self.profiler.before_cursor_execute(conn, Mock(), "SELECT 1",
+                                            (), None, False)
+        self.profiler.after_cursor_execute(conn, Mock(), "SELECT 1",
+                                           (), None, False)
+        self.assertEqual(self.profiler.stats, {})
+
+    @patch("pdm_utils.classes.queryprofiler.QueryProfiler.explain_statement")
+    def test_get_report_1(self, explain_statement_mock):
+        """Verify statements are ranked by total latency and only the
+        slowest statements are explained."""
+        explain_statement_mock.return_value = ["plan"]
+        self.profiler.record("SELECT * FROM gene", 3.0, engine=self.engine)
+        for x in range(4):
+            self.profiler.record("SELECT * FROM phage", 1.0,
+                                 engine=self.engine)
+        self.profiler.record("SELECT * FROM trna", 0.5, engine=self.engine)
+
+        report = self.profiler.get_report(top=2, explain=1)
+        with self.subTest():
+            self.assertEqual(report["statements"], 3)
+        with self.subTest():
+            self.assertEqual(report["executions"], 6)
+        with self.subTest():
+            self.assertEqual([data["fingerprint"] for data in report["top"]],
+                             ["SELECT * FROM phage", "SELECT * FROM gene"])
+        with self.subTest():
+            self.assertEqual(report["top"][0]["mean_time"], 1.0)
+        with self.subTest():
+            self.assertNotIn("explain", report["top"][0])
+        with self.subTest():
+            self.assertEqual(report["top"][1]["explain"], ["plan"])
+
+    def test_explain_statement_1(self):
+        """Verify only SELECT statements are explained."""
+        self.profiler.record("UPDATE phage SET Cluster = 'A'", 1.0,
+                             engine=self.engine)
+        entry = self.profiler.stats["UPDATE phage SET Cluster = ?"]
+        with self.subTest():
+            self.assertIsNone(self.profiler.explain_statement(entry))
+        with self.subTest():
+            self.engine.connect.assert_not_called()
+
+
+
+
+if __name__ == '__main__':
+    unittest.main()
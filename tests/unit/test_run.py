@@ -1,5 +1,6 @@
 """Unit tests for main run script."""
 
+import os
 import unittest
 from unittest.mock import patch
 from pdm_utils import run
@@ -90,5 +91,89 @@ class TestRunFunctions1(unittest.TestCase):
         run.main(unparsed_args)
         pipeline_mock.assert_called()
 
+    @patch("pdm_utils.pipelines.clear_cache.main")
+    def test_main_13(self, pipeline_mock):
+        """Verify that clear_cache pipeline is called."""
+        unparsed_args = ["pdm_utils.run", "clear_cache"]
+        run.main(unparsed_args)
+        pipeline_mock.assert_called()
+
+
+
+
+class TestRunFunctions2(unittest.TestCase):
+
+    @patch.dict("os.environ", {})
+    def test_parse_profile_args_1(self):
+        """Verify profiling args are removed and stored in environment
+        variables."""
+        unparsed_args = ["pdm_utils.run", "export", "Actino_Draft", "csv",
+                         "--profile", "--profile_report", "profile.csv",
+                         "--profile_explain", "3", "-v"]
+        remaining_args = run.parse_profile_args(unparsed_args)
+        with self.subTest():
+            self.assertEqual(remaining_args, ["pdm_utils.run", "export",
+                                              "Actino_Draft", "csv", "-v"])
+        with self.subTest():
+            self.assertEqual(os.environ["PDM_UTILS_PROFILE"], "1")
+        with self.subTest():
+            self.assertEqual(os.environ["PDM_UTILS_PROFILE_REPORT"],
+                             "profile.csv")
+        with self.subTest():
+            self.assertEqual(os.environ["PDM_UTILS_PROFILE_EXPLAIN"], "3")
+
+    @patch.dict("os.environ", {})
+    def test_parse_profile_args_2(self):
+        """Verify args are unchanged without profiling args."""
+        unparsed_args = ["pdm_utils.run", "export", "Actino_Draft", "csv"]
+        remaining_args = run.parse_profile_args(unparsed_args)
+        with self.subTest():
+            self.assertEqual(remaining_args, unparsed_args)
+        with self.subTest():
+            self.assertNotIn("PDM_UTILS_PROFILE", os.environ)
+
+    @patch.dict("os.environ", {})
+    def test_parse_schema_args_1(self):
+        """Verify the schema refresh arg is removed and stored in an
+        environment variable."""
+        unparsed_args = ["pdm_utils.run", "export", "Actino_Draft", "csv",
+                         "--refresh_schema", "-v"]
+        remaining_args = run.parse_schema_args(unparsed_args)
+        with self.subTest():
+            self.assertEqual(remaining_args, ["pdm_utils.run", "export",
+                                              "Actino_Draft", "csv", "-v"])
+        with self.subTest():
+            self.assertEqual(os.environ["PDM_UTILS_REFRESH_SCHEMA"], "1")
+
+    @patch.dict("os.environ", {})
+    def test_parse_schema_args_2(self):
+        """Verify args are unchanged without the schema refresh arg."""
+        unparsed_args = ["pdm_utils.run", "export", "Actino_Draft", "csv"]
+        remaining_args = run.parse_schema_args(unparsed_args)
+        with self.subTest():
+            self.assertEqual(remaining_args, unparsed_args)
+        with self.subTest():
+            self.assertNotIn("PDM_UTILS_REFRESH_SCHEMA", os.environ)
+
+    @patch.dict("os.environ", {})
+    def test_parse_pool_args_1(self):
+        """Verify connection pool args are removed and stored in environment
+        variables."""
+        unparsed_args = ["pdm_utils.run", "import", "Actino_Draft",
+                         "--pool_size", "8", "--max_overflow", "0",
+                         "--no_pool_pre_ping", "-p"]
+        remaining_args = run.parse_pool_args(unparsed_args)
+        with self.subTest():
+            self.assertEqual(remaining_args, ["pdm_utils.run", "import",
+                                              "Actino_Draft", "-p"])
+        with self.subTest():
+            self.assertEqual(os.environ["PDM_UTILS_POOL_SIZE"], "8")
+        with self.subTest():
+            self.assertEqual(os.environ["PDM_UTILS_MAX_OVERFLOW"], "0")
+        with self.subTest():
+            self.assertEqual(os.environ["PDM_UTILS_POOL_PRE_PING"], "0")
+        with self.subTest():
+            self.assertNotIn("PDM_UTILS_POOL_RECYCLE", os.environ)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,175 @@
+"""Unit tests for sequence kernel functions."""
+
+
+from pdm_utils.functions import seqkernels
+from pdm_utils.constants import constants
+from Bio.Alphabet import IUPAC
+from Bio.Seq import Seq
+from Bio.SeqUtils import GC
+import unittest
+
+
+
+
+class TestSeqKernelFunctions1(unittest.TestCase):
+
+    def test_to_bytes_1(self):
+        """Verify a Seq object is converted to bytes."""
+        data = seqkernels.to_bytes(Seq("ACTG", IUPAC.ambiguous_dna))
+        self.assertEqual(data, b"ACTG")
+
+    def test_to_bytes_2(self):
+        """Verify None is returned for a non-ASCII sequence."""
+        data = seqkernels.to_bytes("ACTGé")
+        self.assertIsNone(data)
+
+
+
+
+    def test_get_invalid_symbols_1(self):
+        """Verify no symbols are returned for a valid sequence."""
+        invalid = seqkernels.get_invalid_symbols(Seq("ACTGACTG"),
+                                                 constants.DNA_ALPHABET)
+        self.assertEqual(invalid, set())
+
+    def test_get_invalid_symbols_2(self):
+        """Verify invalid symbols are returned."""
+        invalid = seqkernels.get_invalid_symbols(Seq("ACTGNRXACTG"),
+                                                 constants.DNA_ALPHABET)
+        self.assertEqual(invalid, {"N", "R", "X"})
+
+    def test_get_invalid_symbols_3(self):
+        """Verify results are identical to set difference for a variety
+        of sequences and alphabets."""
+        seqs = ["", "ACTG", "actg", "MKV*LL", "ACTGé-", "B J"]
+        alphabets = [set(), constants.DNA_ALPHABET,
+                     constants.PROTEIN_ALPHABET, {"A", "é", "AC", 1}]
+        for seq in seqs:
+            for alphabet in alphabets:
+                with self.subTest(seq=seq, alphabet=alphabet):
+                    invalid = seqkernels.get_invalid_symbols(seq, alphabet)
+                    self.assertEqual(invalid, set(seq) - alphabet)
+
+
+
+
+    def test_count_symbols_1(self):
+        """Verify symbols are counted by byte value."""
+        counts = seqkernels.count_symbols("AACG")
+        with self.subTest():
+            self.assertEqual(len(counts), 256)
+        with self.subTest():
+            self.assertEqual(counts[ord("A")], 2)
+        with self.subTest():
+            self.assertEqual(counts.sum(), 4)
+
+    def test_count_from_table_1(self):
+        """Verify counts are summed for the indicated symbols."""
+        counts = seqkernels.count_symbols("AACGTT")
+        self.assertEqual(seqkernels.count_from_table(counts, "AT"), 4)
+
+
+
+
+    def test_get_gc_content_1(self):
+        """Verify GC content is identical to Biopython GC()."""
+        seqs = ["ACTGN", "GGGG", "atgcS", "s", "NNNN", ""]
+        for seq in seqs:
+            with self.subTest(seq=seq):
+                self.assertEqual(seqkernels.get_gc_content(Seq(seq)), GC(seq))
+
+    def test_get_ambiguous_count_1(self):
+        """Verify ambiguous nucleotides are counted."""
+        count = seqkernels.get_ambiguous_count("ACTGNNrsA")
+        self.assertEqual(count, 4)
+
+
+
+
+    def test_get_sequence_stats_1(self):
+        """Verify length, GC content, and ambiguous count are computed."""
+        stats = seqkernels.get_sequence_stats(Seq("ACTGN"))
+        with self.subTest():
+            self.assertEqual(stats["length"], 5)
+        with self.subTest():
+            self.assertEqual(stats["gc"], 40.0)
+        with self.subTest():
+            self.assertEqual(stats["ambiguous"], 1)
+
+    def test_get_sequence_stats_2(self):
+        """Verify an empty sequence is handled."""
+        stats = seqkernels.get_sequence_stats("")
+        self.assertEqual(stats, {"length": 0, "gc": 0.0, "ambiguous": 0})
+
+
+
+
+    def test_get_codon_lookup_1(self):
+        """Verify codon lookup tables are created for a valid
+        translation table."""
+        amino_acids, starts = seqkernels.get_codon_lookup(11)
+        # ATG = 0*16 + 3*4 + 2 = 14; TAA = 3*16 + 0*4 + 0 = 48
+        with self.subTest():
+            self.assertEqual(chr(amino_acids[14]), "M")
+        with self.subTest():
+            self.assertEqual(chr(amino_acids[48]), "*")
+        with self.subTest():
+            self.assertTrue(starts[14])
+
+    def test_get_codon_lookup_2(self):
+        """Verify None is returned for invalid translation tables and
+        tables with codons that code for both an amino acid and a stop."""
+        for table in [0, -1, "abc", 27]:
+            with self.subTest(table=table):
+                self.assertIsNone(seqkernels.get_codon_lookup(table))
+
+
+
+
+    def test_translate_cds_1(self):
+        """Verify a valid CDS is translated."""
+        translation, code = seqkernels.translate_cds(
+                                Seq("GTGTTTTGA", IUPAC.ambiguous_dna), 11)
+        with self.subTest():
+            self.assertEqual(translation, "MF")
+        with self.subTest():
+            self.assertIsNone(code)
+
+    def test_translate_cds_2(self):
+        """Verify translation failures are reported."""
+        seqs = {"bad_start": "CCCTTTTGA",
+                "bad_length": "ATGTTTTTGA",
+                "bad_stop": "ATGTTTTTT",
+                "internal_stop": "ATGTAATTTTGA",
+                "invalid": "ATG?TTTGA"}
+        for expected, seq in seqs.items():
+            with self.subTest(expected=expected):
+                translation, code = seqkernels.translate_cds(
+                                        Seq(seq, IUPAC.ambiguous_dna), 11)
+                self.assertEqual((translation, code), ("", expected))
+
+    def test_translate_cds_seqs_1(self):
+        """Verify results are identical to Biopython for sequences
+        translated with lookup tables and by Biopython."""
+        seqs = [Seq("ATGTTTTGA", IUPAC.ambiguous_dna),
+                Seq("atgtttcgntga", IUPAC.ambiguous_dna),
+                Seq("TTGAAATGA", IUPAC.unambiguous_dna),
+                Seq("ATGAAATAAGGGTGA", IUPAC.ambiguous_dna),
+                Seq("ATGTGATAA", IUPAC.ambiguous_dna)]
+        tables = [11, 11, 11, 11, 4]
+        results = seqkernels.translate_cds_seqs(seqs, tables)
+        for x in range(len(seqs)):
+            try:
+                expected = seqs[x].translate(table=tables[x], cds=True)
+            except:
+                expected = Seq("", IUPAC.protein)
+            with self.subTest(seq=seqs[x]):
+                self.assertEqual(str(results[x][0]), str(expected))
+            with self.subTest(seq=seqs[x]):
+                self.assertEqual(results[x][0].alphabet, expected.alphabet)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Unit tests for the SequenceLoader class."""
+
+import unittest
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from pdm_utils.classes.sequenceloader import SequenceLoader
+
+RETRIEVE_DATA_PATH = "pdm_utils.functions.mysqldb_basic.retrieve_data"
+
+
+class TestSequenceLoader(unittest.TestCase):
+    def setUp(self):
+        self.engine = Mock()
+        self.loader = SequenceLoader(self.engine,
+                                     ["Trixie", "L5", "D29", "Alice"],
+                                     batch_size=2)
+
+    def test_get_batch_1(self):
+        """Verify the requested PhageID is batched with the following
+        PhageIDs.
+        """
+        batch = self.loader.get_batch("L5")
+        self.assertEqual(batch, ["L5", "D29"])
+
+    def test_get_batch_2(self):
+        """Verify a PhageID not in the list of PhageIDs is only batched
+        with itself.
+        """
+        batch = self.loader.get_batch("EagleEye")
+        self.assertEqual(batch, ["EagleEye"])
+
+    @patch(RETRIEVE_DATA_PATH)
+    def test_get_batch_3(self, retrieve_data_mock):
+        """Verify previously requested PhageIDs are not batched again.
+        """
+        retrieve_data_mock.return_value = []
+        self.loader.load(["D29"])
+        batch = self.loader.get_batch("L5")
+        self.assertEqual(batch, ["L5", "Alice"])
+
+    @patch(RETRIEVE_DATA_PATH)
+    def test_get_sequence_1(self, retrieve_data_mock):
+        """Verify sequences are retrieved in batches and decoded.
+        """
+        retrieve_data_mock.return_value = [
+                            {"PhageID": "Trixie", "Sequence": b"aatt"},
+                            {"PhageID": "L5", "Sequence": b"GGCC"}]
+        seq1 = self.loader.get_sequence("Trixie")
+        seq2 = self.loader.get_sequence("L5")
+
+        with self.subTest():
+            self.assertEqual(seq1, "AATT")
+        with self.subTest():
+            self.assertEqual(seq2, "GGCC")
+        with self.subTest():
+            self.assertEqual(self.loader.queries, 1)
+        with self.subTest():
+            retrieve_data_mock.assert_called_once_with(
+                            self.engine, column="PhageID",
+                            query="SELECT PhageID, Sequence FROM phage",
+                            id_list=["Trixie", "L5"])
+
+    @patch(RETRIEVE_DATA_PATH)
+    def test_get_sequence_2(self, retrieve_data_mock):
+        """Verify None is returned for a genome not in the database.
+        """
+        retrieve_data_mock.return_value = []
+        seq = self.loader.get_sequence("EagleEye")
+        self.assertIsNone(seq)
+
+
+if __name__ == "__main__":
+    unittest.main()
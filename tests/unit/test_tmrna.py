@@ -793,5 +793,35 @@ class TestTmrnaClass(unittest.TestCase):
                 self.feature.seqfeature.location.end.position, 5)
 
 
+class TestTmrnaSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.feature = tmrna.Tmrna()
+
+    def test_slots_1(self):
+        """Verify declared attributes are not stored in a __dict__."""
+        self.feature.id = "Trixie_1"
+        self.feature.evaluations.append(None)
+        self.assertEqual(self.feature.__dict__, {})
+
+    def test_slots_2(self):
+        """Verify undeclared attributes can still be assigned."""
+        self.feature.misc = "abc"
+        self.assertEqual(self.feature.misc, "abc")
+
+    def test_evaluations_1(self):
+        """Verify the evaluations list is created when first accessed
+        and is retained."""
+        self.feature.evaluations.append(1)
+        self.assertEqual(self.feature.evaluations, [1])
+
+    def test_evaluations_2(self):
+        """Verify the evaluations list is not shared between features."""
+        other = tmrna.Tmrna()
+        self.feature.evaluations.append(1)
+        self.assertEqual(other.evaluations, [])
+
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -794,6 +794,41 @@ class TestTrnaClass(unittest.TestCase):
                 self.feature.seqfeature.location.end.position, 5)
 
 
+class TestTrnaSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.feature = trna.Trna()
+
+    def test_slots_1(self):
+        """Verify declared attributes are not stored in a __dict__."""
+        self.feature.id = "Trixie_1"
+        self.feature.evaluations.append(None)
+        self.assertEqual(self.feature.__dict__, {})
+
+    def test_slots_2(self):
+        """Verify undeclared attributes can still be assigned."""
+        self.feature.misc = "abc"
+        self.assertEqual(self.feature.misc, "abc")
+
+    def test_evaluations_1(self):
+        """Verify the evaluations list is created when first accessed
+        and is retained."""
+        self.feature.evaluations.append(1)
+        self.assertEqual(self.feature.evaluations, [1])
+
+    def test_evaluations_2(self):
+        """Verify the evaluations list is not shared between features."""
+        other = trna.Trna()
+        self.feature.evaluations.append(1)
+        self.assertEqual(other.evaluations, [])
+
+    def test_sources_1(self):
+        """Verify the sources set is not shared between features."""
+        other = trna.Trna()
+        self.feature.sources.add("aragorn")
+        self.assertEqual(other.sources, set())
+
+
 
 if __name__ == '__main__':
     unittest.main()